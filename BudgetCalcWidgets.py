@@ -1,72 +1,15 @@
 from tkinter import *
 import tkinter.ttk as ttk
 import typing as t
-import numpy as np
-
-
-#algorithm is from outside sources.
-#https://www.youtube.com/watch?v=hgysxwqXXM0&t=61s
-def hex_to_rgb(hexCode:str) -> tuple[int, int, int]:
-    """
-    hex_to_rgb(hexCode) -> rgb: tuple[int, int, int]
-    hexCode: str: hex code to convert to RGB
-    converts hex value to rgb value
-    returns tuple[int, int, int]: tuple[int, int, int]: calculated RGB value
-    """
-    #initialize the RGB value as an emty list
-    rgb:list = []
-
-    #create list of all hex values
-    hexValues = list("0123456789ABCDEF")
-
-    #get rid of the leading #
-    hexCode = hexCode.replace("#", "")
-
-    #each hex code duo represents 1 RGB Value. Convert each duo to a decimal
-    #i for index
-    for i in range(0, 6, 2):
-        #initialise the current hex value
-        currentValue = hexCode[i:i+2]
-        
-        #go through each element in current value using enumerate
-        #enumerate -> item (index 1) and index in currentValue (index 0)
-        #use the formula: 
-        #16 ^ ((length of hex value) - current index)
-        #   * the hexidecimal's decimal equivalent (found based on its index 
-        #   in hexValues)
-        currentRGB = sum(list(map(
-            lambda x: 16 ** (1 - x[0]) * hexValues.index(x[1].upper()),
-            enumerate(currentValue)
-        )))
-
-        #add the RGB value to the rgb list
-        rgb.append(currentRGB)
-
-    
-    return tuple(rgb)
+from contextlib import contextmanager
 
-def rgb_to_hex(rgb:t.Iterable[int]) -> str:
-    """
-    rgb_to_hex(rgb: tuple[int, int, int]) -> str
-    rgb: tuple[int, int, int]: rgb values to convert to hex
-    converts rgb value to hexadecimal value
-    returns str: calculated hexadecimal value
-    """
-    #initialize hex string
-    hexCode:str = "#"
-
-    #make sure rgb is 3 values long
-    rgb = rgb[:3]
+import dateUtils
+import numpy as np
 
-    #use .join() and map() to go through each element in RGB
-    #convert RGB to a string value of hex (exclude "0x")
-    #then add it to hex code
+#color conversions used by the widgets and the calculator
+from colorUtils import hex_to_rgb, rgb_to_hex
 
-    hexCode += "".join(
-        map(lambda x: "{:02x}".format(x).replace("0x", ""), rgb)
-    )
 
-    return hexCode
 class Mutable_Label(Label):
 
     '''Makes a label that can be changed based on the user's desire'''
@@ -197,6 +140,10 @@ class ScrollingFrame(Frame):
         #instantiate self
         Frame.__init__(self, master, **kwargs)
 
+        #number of open batch() blocks. the scroll region is only updated
+        #when the last one closes
+        self.__batchDepth:int = 0
+
         #initialize scrollAxis, scrollCanvas, and scrollBars
         self.scrollAxis:str = scrollAxis.upper()
         self.scrollCanvas:Canvas = Canvas(self, bg=self["bg"])
@@ -342,12 +289,31 @@ class ScrollingFrame(Frame):
         Updates the contents and attributes of the canvas to Tkinter and the
         Frame 
         """
-        self.update()
-
+        #lay out the widgets once so bbox() sees their real size
+        self.update_idletasks()
 
         self.scrollCanvas.configure(scrollregion=self.scrollCanvas.bbox("all"))
 
-        self.update()
+    @contextmanager
+    def batch(self) -> t.Iterator["ScrollingFrame"]:
+        """
+        ScrollingFrame.batch()
+        with scrollFrame.batch(): ...
+
+        items added inside the with block do not update the scroll region
+        one at a time. The widgets are laid out and the scroll region is
+        updated once when the block ends
+        """
+        self.__batchDepth += 1
+
+        try:
+            yield self
+        finally:
+            self.__batchDepth -= 1
+
+            #only the outermost batch updates the scrollbar
+            if self.__batchDepth == 0:
+                self.update_scrollbar()
 
     def add_item(self, obj, 
             args:tuple|None = None, 
@@ -375,14 +341,211 @@ class ScrollingFrame(Frame):
 
         newObject.grid(row=row, column=column)
 
-        self.update_scrollbar()
+        #inside batch(), the scrollbar is updated once at the end
+        if not self.__batchDepth:
+            self.update_scrollbar()
 
         #returns the object so that the programmer can modify/delete the object
         #later
         return newObject
 
+    def add_items(self, items:t.Iterable[dict]) -> list:
+        """
+        ScrollingFrame.add_items(self, items)
+        items: iterable[dict]: keyword arguments of add_item() for each item
+            e.g. {"obj": Label, "kwargs": {"text": "hi"}, "row": 0}
+
+        adds every item, then updates the scrollbar once
+        returns the items added to the frame, in order
+        """
+        with self.batch():
+            return [self.add_item(**item) for item in items]
+
     
 
+class VirtualScrollingFrame(ScrollingFrame):
+    """
+    Create a scrollable table that only makes widgets for the rows that can
+    be seen. The rows are stored as data and a small set of row widgets is
+    reused as the user scrolls
+    """
+    def __init__(self, master:Tk|Frame, kwargs:dict|None = None,
+                    scrollAxis:str = "Y", rowHeight:int = 30,
+                    columns:int = 1, cellType:type = Label,
+                    cellKwargs:dict|None = None,
+                    fillRow:t.Callable[[list, t.Sequence], None]|None = None):
+        """
+        VirtualScrollingFrame(self, master, kwargs, scrollAxis, rowHeight,
+            columns, cellType, cellKwargs, fillRow)
+        master: tkinter.Tk|tkinter.Frame: parent widget VirtualScrollingFrame
+        kwargs: dict: keyword arguments for tkinter.Frame
+        scrollAxis: str: 'Y' or 'XY'. rows are always scrolled vertically
+        rowHeight: int: height of every row in pixels
+        columns: int: number of cells in each row
+        cellType: Tkinter widget: class type of each cell
+        cellKwargs: dict: keyword arguments for each cell
+        fillRow: function(cells, values): shows a row's values in the
+            cells of a row widget. By default, each cell's text is set to
+            its value
+
+        creates an instantiation of VirtualScrollingFrame
+        """
+        if not kwargs: kwargs = {}
+        if not cellKwargs: cellKwargs = {}
+
+        #initialize the size of the rows and how to make them
+        self.rowHeight:int = rowHeight
+        self.columns:int = columns
+        self.cellType:type = cellType
+        self.cellKwargs:dict = cellKwargs
+        self.fillRow = fillRow if fillRow else self.__fill_row_text
+
+        #the data shown in the table. one sequence of values per row
+        self.rows:t.Sequence[t.Sequence] = []
+
+        #the reusable row widgets: the row frame, its cells and its canvas id
+        self.__pool:list[tuple[Frame, list, int]] = []
+
+        ScrollingFrame.__init__(self, master, kwargs, scrollAxis)
+
+        #scroll one row at a time
+        self.scrollCanvas.configure(yscrollincrement=self.rowHeight)
+
+        #make enough row widgets to fill the window whenever it changes size
+        self.scrollCanvas.bind("<Configure>", self.__fit_pool)
+
+    def change_scroll_axis(self, direction:str) -> None:
+        """
+        VirtualScrollingFrame.change_scroll_axis(direction)
+        direction: str: axis on which to scroll:
+            - 'Y': scroll along y-axis
+            - "XY": scroll along x-axis and y-axis
+
+        the rows are reused as the table scrolls vertically, so there is
+        always a vertical scrollbar
+        """
+        #rows can only be reused when scrolling up and down
+        if "Y" not in direction.upper():
+            print(f"ERROR: VirtualScrollingFrame must scroll along 'Y'. "
+                  + f"You selected: '{direction}'. Using 'XY' instead")
+            direction = "XY"
+
+        ScrollingFrame.change_scroll_axis(self, direction)
+
+        #move the row widgets every time the table scrolls
+        self.scrollCanvas.configure(yscrollcommand=self.__on_scroll)
+
+    def set_rows(self, rows:t.Sequence[t.Sequence]) -> None:
+        """
+        VirtualScrollingFrame.set_rows(rows)
+        rows: sequence of sequences: values of each row
+
+        replaces the data in the table and shows the rows in view
+        """
+        self.rows = rows
+
+        self.update_scrollbar()
+
+    def update_scrollbar(self) -> None:
+        """
+        VirtualScrollingFrame.update_scrollbar()
+        sets the scroll region to the height of every row and refreshes the
+        rows in view
+        """
+        #the table is as wide as the widest row widget
+        width = max(
+            (row.winfo_reqwidth() for row, cells, windowId in self.__pool),
+            default=0
+            )
+
+        self.scrollCanvas.configure(
+            scrollregion=(0, 0, width, len(self.rows) * self.rowHeight)
+        )
+
+        self.refresh_rows()
+
+    def refresh_rows(self) -> None:
+        """
+        VirtualScrollingFrame.refresh_rows()
+        moves the row widgets to the rows in view and shows the values of
+        those rows. call after changing the values in rows
+        """
+        #the first row in view
+        firstRow = int(self.scrollCanvas.canvasy(0) // self.rowHeight)
+
+        for index, (row, cells, windowId) in enumerate(self.__pool):
+            rowIndex = firstRow + index
+
+            #hide row widgets that are past the last row
+            if not 0 <= rowIndex < len(self.rows):
+                self.scrollCanvas.itemconfigure(windowId, state="hidden")
+                continue
+
+            #move the row widget to its row and show that row's values
+            self.scrollCanvas.coords(windowId, 0, rowIndex * self.rowHeight)
+            self.scrollCanvas.itemconfigure(windowId, state="normal")
+            self.fillRow(cells, self.rows[rowIndex])
+
+    def __on_scroll(self, first:str, last:str) -> None:
+        """
+        VirtualScrollingFrame.__on_scroll(first, last)
+        first: str: fraction of the table above the window
+        last: str: fraction of the table above the bottom of the window
+
+        moves the scrollbar and the rows in view
+        """
+        self.scrollbars[0].set(first, last)
+
+        self.refresh_rows()
+
+    def __fit_pool(self, e:Event|None = None) -> None:
+        """
+        VirtualScrollingFrame.__fit_pool(e)
+        e: Tkinter.Event
+        makes sure there are enough row widgets to fill the window
+        """
+        #one extra row covers the row that is partly scrolled into view
+        needed = self.scrollCanvas.winfo_height() // self.rowHeight + 2
+
+        #make new row widgets until there are enough
+        while len(self.__pool) < needed:
+            row = Frame(self.scrollCanvas, bg=self["bg"], height=self.rowHeight)
+
+            cells = []
+            for column in range(self.columns):
+                cell = self.cellType(row, **self.cellKwargs)
+                cell.grid(row=0, column=column, sticky="nsew")
+                cells.append(cell)
+
+            #keep every row the same height so rows line up when moved
+            row.grid_propagate(False)
+            row.configure(width=sum(cell.winfo_reqwidth() for cell in cells))
+
+            windowId = self.scrollCanvas.create_window(
+                (0, 0),
+                window=row,
+                anchor="nw",
+                state="hidden"
+            )
+
+            self.__pool.append((row, cells, windowId))
+
+        self.update_scrollbar()
+
+    @staticmethod
+    def __fill_row_text(cells:list, values:t.Sequence) -> None:
+        """
+        VirtualScrollingFrame.__fill_row_text(cells, values)
+        cells: list: cells of the row widget
+        values: sequence: values of the row
+
+        sets the text of each cell to its value
+        """
+        for cell, value in zip(cells, values):
+            cell["text"] = value
+
+
+
 def main():
     import random
     import numpy as np
@@ -408,21 +571,26 @@ def main():
 
     arrayOfLabels = np.full((50, 5), None)
 
-    for i in range(50):
-        for j in range(5):
-            arrayOfLabels[i][j] = scrollFrame.add_item(
-                obj=Label,
-                kwargs={
-                    "bg":"white", 
-                    "fg":"black", 
-                    "font": ("Georgia", 12),
-                    "width":10, 
-                    "height":5,
-                    "text":f"Button {random.randrange(1, 3000)}"
-                },
-                row = i, 
-                column= j
-            )
+    #add all the labels, then update the scrollbar once
+    labels = scrollFrame.add_items(
+        {
+            "obj": Label,
+            "kwargs": {
+                "bg":"white", 
+                "fg":"black", 
+                "font": ("Georgia", 12),
+                "width":10, 
+                "height":5,
+                "text":f"Button {random.randrange(1, 3000)}"
+            },
+            "row": i, 
+            "column": j
+        }
+        for i in range(50)
+        for j in range(5)
+    )
+    for index, label in enumerate(labels):
+        arrayOfLabels[index // 5][index % 5] = label
 
     print(1)
 
@@ -434,5 +602,279 @@ def main():
 if __name__ == "__main__":
     main()
 
-class DataList (Frame):
-    pass
\ No newline at end of file
+class DataListRows:
+    """
+    Read-only view of the rows a DataList shows, in the order they are
+    shown. Rows are only formatted when they are asked for, so no Python
+    object is kept for each transaction
+    """
+    def __init__(self, dataList:"DataList"):
+        """
+        DataListRows(self, dataList)
+        dataList: DataList: table whose rows are viewed
+        """
+        self.dataList = dataList
+
+    def __len__(self) -> int:
+        return len(self.dataList.get_order())
+
+    def __getitem__(self, index:int) -> tuple[str, str, str, str, str]:
+        """
+        DataListRows[index] -> tuple[str, str, str, str, str]
+        index: int: position of the row in the table
+
+        returns the date, amount, category, description and running total
+        of the row as text
+        """
+        dataList = self.dataList
+        position = dataList.get_order()[index]
+
+        return (
+            dataList.dates[position].item().strftime("%m/%d/%Y"),
+            f"{dataList.amounts[position]:,.2f}",
+            str(dataList.categories[position]),
+            str(dataList.descriptions[position]),
+            f"{dataList.get_running_totals()[index]:,.2f}"
+        )
+
+
+class DataList(Frame):
+    """
+    Table of transactions. Each column is stored as one numpy array;
+    sorting, filtering and running totals are done on the whole arrays at
+    once, and only the rows in view are made into widgets
+    """
+
+    #columns that can be sorted and the text of their headers
+    COLUMNS:tuple[str, ...] = ("date", "amount", "category", "description")
+    HEADERS:tuple[str, ...] = ("Date", "Amount", "Category", "Description",
+                               "Total")
+
+    def __init__(self, master:Tk|Frame, kwargs:dict|None = None,
+                    rowHeight:int = 30, cellKwargs:dict|None = None):
+        """
+        DataList(self, master, kwargs, rowHeight, cellKwargs)
+        master: tkinter.Tk|tkinter.Frame: parent widget of DataList
+        kwargs: dict: keyword arguments for tkinter.Frame
+        rowHeight: int: height of every row in pixels
+        cellKwargs: dict: keyword arguments for the Label of each cell
+
+        creates an empty table
+        """
+        if not kwargs: kwargs = {}
+        if not cellKwargs:
+            cellKwargs = {"bg": "white", "fg": "black", "width": 14,
+                          "anchor": "w"}
+
+        Frame.__init__(self, master, **kwargs)
+
+        #initialize the columns as empty arrays
+        self.dates:np.ndarray = np.array([], dtype="datetime64[D]")
+        self.amounts:np.ndarray = np.array([], dtype=np.float64)
+        self.categories:np.ndarray = np.array([], dtype=str)
+        self.descriptions:np.ndarray = np.array([], dtype=str)
+
+        #lowercase descriptions, so searching does not lower them every time.
+        #only made the first time the table is searched
+        self.__searchText:np.ndarray|None = None
+
+        #the column the rows are sorted by and the filters in use
+        self.sortColumn:str = "date"
+        self.ascending:bool = True
+        self.searchText:str = ""
+        self.category:str|None = None
+
+        #positions of the rows shown, in the order they are shown,
+        #and the running total at each of those rows
+        self.__order:np.ndarray = np.array([], dtype=np.int64)
+        self.__runningTotals:np.ndarray = np.array([], dtype=np.float64)
+
+        #the headers sort the table when clicked
+        headerFrame = Frame(self, bg=self["bg"])
+        headerFrame.pack(side=TOP, fill="x")
+
+        for index, text in enumerate(self.HEADERS):
+            header = Label(headerFrame, text=text, **cellKwargs)
+            header.grid(row=0, column=index, sticky="nsew")
+
+            #the running total column cannot be sorted by
+            if index < len(self.COLUMNS):
+                header.bind(
+                    "<Button>",
+                    lambda e, column=self.COLUMNS[index]: self.sort_by(column)
+                )
+
+        #the total of every row shown
+        self.totalLabel:Label = Label(self, text="Total: 0.00", **cellKwargs)
+        self.totalLabel.pack(side=BOTTOM, fill="x")
+
+        #only the rows in view are made into widgets
+        self.rowFrame:VirtualScrollingFrame = VirtualScrollingFrame(
+            self,
+            kwargs={"bg": self["bg"]},
+            rowHeight=rowHeight,
+            columns=len(self.HEADERS),
+            cellKwargs=cellKwargs
+        )
+        self.rowFrame.pack(side=TOP, fill=BOTH, expand=1)
+        self.rowFrame.set_rows(DataListRows(self))
+
+    def set_data(self, dates:t.Iterable, amounts:t.Iterable[float],
+                    categories:t.Iterable[str],
+                    descriptions:t.Iterable[str]) -> None:
+        """
+        DataList.set_data(dates, amounts, categories, descriptions)
+        dates: iterable: dates in MM/DD/YYYY format or datetime64
+        amounts: iterable[float]: amount of each transaction
+        categories: iterable[str]: category of each transaction
+        descriptions: iterable[str]: description of each transaction
+
+        replaces every transaction in the table
+        """
+        self.dates = dateUtils.parse_dates(dates)
+        self.amounts = np.asarray(amounts, dtype=np.float64)
+        self.categories = np.asarray(categories, dtype=str)
+        self.descriptions = np.asarray(descriptions, dtype=str)
+
+        #make sure every column is the same length
+        lengths = {len(self.dates), len(self.amounts), len(self.categories),
+                   len(self.descriptions)}
+        if len(lengths) != 1:
+            raise ValueError(
+                f"DataList columns must be the same length. Got {lengths}"
+            )
+
+        #descriptions are only read from the disk for the rows in view until
+        #the table is searched
+        self.__searchText = None
+
+        self.refresh()
+
+    def add_transactions(self, dates:t.Iterable, amounts:t.Iterable[float],
+                            categories:t.Iterable[str],
+                            descriptions:t.Iterable[str]) -> None:
+        """
+        DataList.add_transactions(dates, amounts, categories, descriptions)
+        dates: iterable: dates in MM/DD/YYYY format or datetime64
+        amounts: iterable[float]: amount of each transaction
+        categories: iterable[str]: category of each transaction
+        descriptions: iterable[str]: description of each transaction
+
+        adds the transactions to the end of the table
+        """
+        self.set_data(
+            np.concatenate((self.dates, dateUtils.parse_dates(dates))),
+            np.concatenate((self.amounts, np.asarray(amounts, dtype=float))),
+            np.concatenate((self.categories, np.asarray(categories, dtype=str))),
+            np.concatenate(
+                (self.descriptions, np.asarray(descriptions, dtype=str))
+            )
+        )
+
+    def sort_by(self, column:str, ascending:bool|None = None) -> None:
+        """
+        DataList.sort_by(column, ascending)
+        column: str: any of DataList.COLUMNS
+        ascending: bool|None: sort order. None sorts ascending, or flips the
+            order if the table is already sorted by column
+
+        sorts the rows shown by the column
+        """
+        column = column.lower()
+
+        if column not in self.COLUMNS:
+            print(f"ERROR: Invalid argument for sort_by. "
+                  + f"You selected: '{column}'. Table was not sorted.\n"
+                  + f"Please choose any: {self.COLUMNS}")
+            return
+
+        #clicking the same header twice flips the order
+        if ascending is None:
+            ascending = (column != self.sortColumn) or not self.ascending
+
+        self.sortColumn = column
+        self.ascending = ascending
+
+        self.refresh()
+
+    def filter(self, searchText:str = "", category:str|None = None) -> None:
+        """
+        DataList.filter(searchText, category)
+        searchText: str: only show rows whose description has this text.
+            not case sensitive
+        category: str|None: only show rows in this category. None shows
+            every category
+
+        filters the rows shown
+        """
+        self.searchText = searchText
+        self.category = category
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        DataList.refresh()
+        works out which rows are shown, their order and running totals, then
+        redraws the rows in view
+        """
+        #start with every row, then remove the rows the filters do not match
+        keep = np.ones(len(self.amounts), dtype=bool)
+
+        if self.category is not None:
+            keep &= self.categories == self.category
+
+        if self.searchText:
+            if self.__searchText is None:
+                self.__searchText = np.char.lower(self.descriptions)
+
+            keep &= np.char.find(
+                self.__searchText, self.searchText.lower()
+            ) >= 0
+
+        positions = np.flatnonzero(keep)
+
+        #sort the rows that are left by the chosen column.
+        #stable sorting keeps rows with the same value in the order added
+        column = {
+            "date": self.dates,
+            "amount": self.amounts,
+            "category": self.categories,
+            "description": self.descriptions
+        }[self.sortColumn]
+
+        order = np.argsort(column[positions], kind="stable")
+        if not self.ascending:
+            order = order[::-1]
+
+        self.__order = positions[order]
+        self.__runningTotals = np.cumsum(self.amounts[self.__order])
+
+        #show the total of every row shown
+        self.totalLabel["text"] = f"Total: {self.get_total():,.2f}"
+
+        self.rowFrame.update_scrollbar()
+
+    def get_order(self) -> np.ndarray:
+        """
+        DataList.get_order() -> np.ndarray[int]
+        returns the positions of the rows shown, in the order shown
+        """
+        return self.__order
+
+    def get_running_totals(self) -> np.ndarray:
+        """
+        DataList.get_running_totals() -> np.ndarray[float]
+        returns the running total at each row shown
+        """
+        return self.__runningTotals
+
+    def get_total(self) -> float:
+        """
+        DataList.get_total() -> float
+        returns the total amount of every row shown
+        """
+        if not len(self.__runningTotals):
+            return 0.0
+
+        return float(self.__runningTotals[-1])
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Times the slow parts of the budget calculator.
+Run this file directly; results are printed to the console
+"""
+
+#import needed modules
+import os
+import subprocess
+import sys
+import time
+import tkinter as tk
+import typing as t
+
+import BudgetCalcWidgets as bcw
+
+
+def time_it(function:t.Callable[[], t.Any]) -> float:
+    """
+    time_it(function) -> float
+    function: callable: function to time. takes no arguments
+
+    returns the number of seconds the function took to run
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def add_item_unbatched(scrollFrame:bcw.ScrollingFrame, obj,
+                        args:tuple|None = None, kwargs:dict|None = None,
+                        row:int = 0, column:int = 0) -> object:
+    """
+    add_item_unbatched(scrollFrame, obj, args, kwargs, row, column) -> object
+    scrollFrame: BudgetCalcWidgets.ScrollingFrame: frame to add the item to
+    (other arguments: see ScrollingFrame.add_item)
+
+    adds an item the way ScrollingFrame.add_item() used to: the whole
+    window is updated twice for every item. kept here so the benchmark
+    compares against the original behavior
+    """
+    newObject = obj(scrollFrame.displayFrame, *(args or ()), **(kwargs or {}))
+    newObject.grid(row=row, column=column)
+
+    scrollFrame.update()
+    scrollFrame.scrollCanvas.configure(
+        scrollregion=scrollFrame.scrollCanvas.bbox("all")
+    )
+    scrollFrame.update()
+
+    return newObject
+
+
+def bench_scrolling_frame_inserts(counts:t.Iterable[int] = (1000, 10000)) -> None:
+    """
+    bench_scrolling_frame_inserts(counts) -> None
+    counts: iterable[int]: numbers of labels to add
+
+    compares adding labels to a ScrollingFrame the original way (two
+    update() calls per label) against add_item() and add_items()
+    """
+    root = tk.Tk()
+    root.geometry("500x500")
+
+    for count in counts:
+        #every label is laid out in a 5 column grid
+        items = [
+            {
+                "obj": tk.Label,
+                "kwargs": {"text": f"Label {index}", "width": 10},
+                "row": index // 5,
+                "column": index % 5
+            }
+            for index in range(count)
+        ]
+
+        #add the labels the original way; the window updates twice per label
+        scrollFrame = bcw.ScrollingFrame(root, kwargs={}, scrollAxis="XY")
+        scrollFrame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        original = time_it(
+            lambda: [add_item_unbatched(scrollFrame, **item) for item in items]
+        )
+        scrollFrame.destroy()
+
+        #add the labels one at a time; the scrollbar updates after each one
+        scrollFrame = bcw.ScrollingFrame(root, kwargs={}, scrollAxis="XY")
+        scrollFrame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        oneAtATime = time_it(
+            lambda: [scrollFrame.add_item(**item) for item in items]
+        )
+        scrollFrame.destroy()
+
+        #add the labels together; the scrollbar updates once
+        scrollFrame = bcw.ScrollingFrame(root, kwargs={}, scrollAxis="XY")
+        scrollFrame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        allAtOnce = time_it(lambda: scrollFrame.add_items(items))
+        scrollFrame.destroy()
+
+        print(f"{count} inserts: original {original:.3f}s, "
+              + f"add_item {oneAtATime:.3f}s, "
+              + f"add_items {allAtOnce:.3f}s")
+
+    root.destroy()
+
+
+#opens the calculator in a new interpreter, prints once the first frame
+#is drawn, then prints which heavy libraries had been imported by then
+FIRST_FRAME_SCRIPT:str = """
+import sys
+import calculator_main
+app = calculator_main.Budget_Calculator(calculator_main.root)
+calculator_main.root.update()
+print("drawn", flush=True)
+print(" ".join(
+    name for name in ("pandas", "matplotlib") if name in sys.modules
+), flush=True)
+calculator_main.root.destroy()
+"""
+
+
+def bench_time_to_first_frame(runs:int = 5) -> None:
+    """
+    bench_time_to_first_frame(runs) -> None
+    runs: int: number of times to open the calculator
+
+    times how long the calculator takes to draw its first frame from a
+    cold start of Python, including every import
+    """
+    times = []
+    heavyImports = ""
+
+    for run in range(runs):
+        start = time.perf_counter()
+
+        calculator = subprocess.Popen(
+            [sys.executable, "-c", FIRST_FRAME_SCRIPT],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE,
+            text=True
+        )
+
+        #the first line is printed as soon as the window is drawn
+        calculator.stdout.readline()
+        times.append(time.perf_counter() - start)
+
+        heavyImports = calculator.stdout.readline().strip()
+        calculator.wait()
+
+    print(f"time to first frame: best {min(times):.3f}s, "
+          + f"worst {max(times):.3f}s over {runs} runs")
+    print(f"heavy libraries imported at startup: {heavyImports or 'none'}")
+
+
+def main():
+    bench_scrolling_frame_inserts()
+    bench_time_to_first_frame()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Saves and loads budget data.
+Each column is stored as raw numpy data after a small versioned header, so
+a saved budget can be memory-mapped and only the columns that are used are
+read from the disk.
+Edits between full saves are appended to a journal next to the budget file
+and folded into the budget file every so often
+"""
+
+#import needed modules
+import json
+import os
+import struct
+import threading
+import typing as t
+import numpy as np
+
+import dateUtils
+
+#identifies a budget file and the layout of its header
+MAGIC:bytes = b"BUDGCALC"
+SCHEMA_VERSION:int = 1
+
+#every column starts at a multiple of this many bytes
+ALIGNMENT:int = 64
+
+#the columns of the transaction table and their numpy types
+TRANSACTION_COLUMNS:dict[str, str] = {
+    "dates": "datetime64[D]",
+    "amounts": "float64",
+    "categories": "str",
+    "descriptions": "str"
+}
+
+#the value of each column when an added transaction does not give one
+COLUMN_DEFAULTS:dict[str, t.Any] = {
+    "dates": "1970-01-01",
+    "amounts": 0.0,
+    "categories": "",
+    "descriptions": ""
+}
+
+
+def empty_transactions() -> dict[str, np.ndarray]:
+    """
+    empty_transactions() -> dict[str, np.ndarray]
+    returns a transaction table with no rows
+    """
+    return {
+        name: np.array([], dtype=dtype)
+        for name, dtype in TRANSACTION_COLUMNS.items()
+    }
+
+
+def write_budget(path:str, columns:dict[str, np.ndarray],
+                    journalSeq:int = 0) -> None:
+    """
+    write_budget(path, columns, journalSeq) -> None
+    path: str: file to save to
+    columns: dict[str, np.ndarray]: name and data of each column
+    journalSeq: int: number of the last journal record already in columns
+
+    saves the columns to the file. The file is written next to the old one
+    and then swapped in, so a failed save never leaves half a file
+    """
+    #work out where each column starts in the file
+    header:dict = {
+        "version": SCHEMA_VERSION,
+        "journalSeq": journalSeq,
+        "columns": {}
+    }
+    arrays:list[np.ndarray] = []
+    offset = 0
+
+    for name, column in columns.items():
+        #strings are saved as fixed-width unicode so they can be mapped
+        column = np.ascontiguousarray(column)
+        if column.dtype == object:
+            column = column.astype(str)
+
+        header["columns"][name] = {
+            "dtype": column.dtype.str,
+            "shape": list(column.shape),
+            "offset": offset
+        }
+        arrays.append(column)
+
+        #leave room up to the start of the next column
+        offset += -(-column.nbytes // ALIGNMENT) * ALIGNMENT
+
+    headerBytes = json.dumps(header).encode("utf-8")
+
+    #the data starts at the first multiple of ALIGNMENT after the header
+    dataStart = len(MAGIC) + 4 + len(headerBytes)
+    dataStart = -(-dataStart // ALIGNMENT) * ALIGNMENT
+
+    tempPath = path + ".tmp"
+    with open(tempPath, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<I", len(headerBytes)))
+        file.write(headerBytes)
+
+        for name, column in zip(header["columns"], arrays):
+            file.seek(dataStart + header["columns"][name]["offset"])
+            file.write(column.tobytes())
+
+        #make sure every column ends inside the file
+        file.truncate(dataStart + offset)
+
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tempPath, path)
+
+
+def read_header(path:str) -> tuple[dict, int]:
+    """
+    read_header(path) -> tuple[dict, int]
+    path: str: budget file to read
+
+    raises ValueError if the file is not a budget file or was saved by a
+    newer version of the program
+    returns the header of the file and the position the data starts at
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a budget file")
+
+        headerLength, = struct.unpack("<I", file.read(4))
+        header = json.loads(file.read(headerLength).decode("utf-8"))
+
+    if header["version"] > SCHEMA_VERSION:
+        raise ValueError(
+            f"'{path}' was saved with version {header['version']} of the "
+            + f"budget file. Only version {SCHEMA_VERSION} can be read"
+        )
+
+    dataStart = len(MAGIC) + 4 + headerLength
+    dataStart = -(-dataStart // ALIGNMENT) * ALIGNMENT
+
+    return header, dataStart
+
+
+def read_budget(path:str) -> dict[str, np.ndarray]:
+    """
+    read_budget(path) -> dict[str, np.ndarray]
+    path: str: budget file to read
+
+    maps each column of the file into memory. Nothing is read from the disk
+    until a column's values are used, and only the parts used are read
+    returns the name and data of each column
+    """
+    header, dataStart = read_header(path)
+
+    columns:dict[str, np.ndarray] = {}
+    for name, info in header["columns"].items():
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+
+        #a file cannot be mapped with a length of 0
+        if 0 in shape or dtype.itemsize == 0:
+            columns[name] = np.empty(shape, dtype=dtype)
+            continue
+
+        columns[name] = np.memmap(
+            path,
+            dtype=dtype,
+            mode="r",
+            offset=dataStart + info["offset"],
+            shape=shape
+        )
+
+    return columns
+
+
+def column_value(name:str, value:t.Any) -> np.ndarray:
+    """
+    column_value(name, value) -> np.ndarray
+    name: str: name of a column in TRANSACTION_COLUMNS
+    value: any: value to put in the column. dates can be MM/DD/YYYY or
+        YYYY-MM-DD
+
+    returns the value as a one item array of the column's type
+    """
+    dtype = TRANSACTION_COLUMNS.get(name, "str")
+
+    if dtype == "str":
+        return np.array([str(value)])
+
+    if dtype.startswith("datetime64") and "/" in str(value):
+        return dateUtils.parse_dates([value])
+
+    return np.array([value], dtype=dtype)
+
+
+def apply_record(columns:dict[str, np.ndarray],
+                    record:dict) -> dict[str, np.ndarray]:
+    """
+    apply_record(columns, record) -> dict[str, np.ndarray]
+    columns: dict[str, np.ndarray]: name and data of each column
+    record: dict: one edit:
+        - {"op": "add", "values": {column: value}}
+        - {"op": "edit", "row": int, "column": str, "value": any}
+        - {"op": "delete", "row": int}
+
+    columns that change are replaced, never changed in place, so arrays
+    that are being saved or are memory-mapped are left alone
+    returns the columns with the edit made
+    """
+    columns = dict(columns)
+
+    match record["op"]:
+        #add one row to the end of every column
+        case "add":
+            for name in columns:
+                value = record["values"].get(
+                    name,
+                    COLUMN_DEFAULTS.get(name, "")
+                )
+                columns[name] = np.concatenate(
+                    (columns[name], column_value(name, value))
+                )
+
+        #change one value
+        case "edit":
+            value = column_value(record["column"], record["value"])
+            column = columns[record["column"]]
+
+            #make room for longer text
+            column = column.astype(np.result_type(column.dtype, value.dtype))
+            column[record["row"]] = value[0]
+
+            columns[record["column"]] = column
+
+        #remove one row from every column
+        case "delete":
+            for name in columns:
+                columns[name] = np.delete(columns[name], record["row"])
+
+        case _:
+            raise ValueError(f"unknown journal record: {record}")
+
+    return columns
+
+
+def concatenate_columns(columns:dict[str, np.ndarray],
+                            more:dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    concatenate_columns(columns, more) -> dict[str, np.ndarray]
+    columns: dict[str, np.ndarray]: name and data of each column
+    more: dict[str, np.ndarray]: rows to add to the end of columns
+
+    returns new columns with the rows of more after the rows of columns
+    """
+    return {
+        name: np.concatenate((column, np.asarray(more[name], column.dtype)))
+        if column.dtype.kind != "U"
+        else np.concatenate((column, np.asarray(more[name], dtype=str)))
+        for name, column in columns.items()
+    }
+
+
+def select_dates(columns:dict[str, np.ndarray], start:t.Any = None,
+                    end:t.Any = None) -> dict[str, np.ndarray]:
+    """
+    select_dates(columns, start, end) -> dict[str, np.ndarray]
+    columns: dict[str, np.ndarray]: name and data of each column
+    start: str|np.datetime64|None: first date to keep. None for no limit
+    end: str|np.datetime64|None: last date to keep. None for no limit
+
+    returns the transactions between start and end
+    """
+    #every transaction is kept; memory-mapped columns are not read
+    if start is None and end is None:
+        return dict(columns)
+
+    keep = np.ones(len(columns["dates"]), dtype=bool)
+
+    if start is not None:
+        keep &= columns["dates"] >= column_value("dates", start)[0]
+    if end is not None:
+        keep &= columns["dates"] <= column_value("dates", end)[0]
+
+    return {name: column[keep] for name, column in columns.items()}
+
+
+def open_store(path:str) -> "BudgetStore":
+    """
+    open_store(path) -> BudgetStore|sqliteStorage.SqliteBudgetStore
+    path: str: file the budget is saved in
+
+    returns a SQLite store if path ends in .db, .sqlite or .sqlite3.
+    Otherwise, returns a BudgetStore
+    """
+    if path.lower().endswith((".db", ".sqlite", ".sqlite3")):
+        #only import sqlite when it is used
+        import sqliteStorage
+        return sqliteStorage.SqliteBudgetStore(path)
+
+    return BudgetStore(path)
+
+
+class BudgetStore:
+    """
+    Saves and loads the budget kept in one file.
+    Small edits are appended to a journal instead of rewriting the whole
+    budget, so saving takes the same time however big the budget is.
+    Once the journal is long, it is folded into the budget file on a
+    background thread
+    """
+
+    #the whole budget is loaded at once; tabs filter it in memory
+    queryable:bool = False
+
+    def __init__(self, path:str, compactAfter:int = 1000):
+        """
+        BudgetStore(self, path, compactAfter)
+        path: str: file the budget is saved in
+        compactAfter: int: number of journal records that starts a
+            compaction
+        """
+        self.path:str = path
+        self.journalPath:str = path + ".journal"
+        self.compactAfter:int = compactAfter
+
+        #number of the last journal record written, and of the last
+        #record already in the budget file
+        self.__lastSeq:int = 0
+        self.__snapshotSeq:int = 0
+
+        #only one thread writes the journal at a time
+        self.__lock:threading.Lock = threading.Lock()
+        self.__compactThread:threading.Thread|None = None
+
+        #error raised by the last background compaction, if any. raised
+        #again by the next compact() or wait_for_compaction()
+        self.__compactError:OSError|None = None
+
+    def exists(self) -> bool:
+        """
+        BudgetStore.exists() -> bool
+        returns True if the budget has been saved before
+        """
+        return os.path.exists(self.path) or os.path.exists(self.journalPath)
+
+    def save(self, columns:dict[str, np.ndarray]) -> None:
+        """
+        BudgetStore.save(columns)
+        columns: dict[str, np.ndarray]: name and data of each column
+
+        rewrites the whole budget file and empties the journal
+        """
+        self.wait_for_compaction()
+
+        with self.__lock:
+            write_budget(self.path, columns, journalSeq=self.__lastSeq)
+            self.__snapshotSeq = self.__lastSeq
+            self.__rewrite_journal([])
+
+    def append(self, records:t.Iterable[dict]) -> None:
+        """
+        BudgetStore.append(records)
+        records: iterable[dict]: edits made since the last save. see
+            apply_record() for their format
+
+        adds the edits to the end of the journal
+        """
+        with self.__lock:
+            lines = []
+            for record in records:
+                self.__lastSeq += 1
+                lines.append(json.dumps({**record, "seq": self.__lastSeq}))
+
+            #nothing to save
+            if not lines:
+                return
+
+            with open(self.journalPath, "a", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+
+    def needs_compaction(self, minimum:int|None = None) -> bool:
+        """
+        BudgetStore.needs_compaction(minimum) -> bool
+        minimum: int|None: number of journal records needed. None uses
+            compactAfter
+
+        returns True if the journal is long enough to fold into the budget
+        file
+        """
+        if minimum is None:
+            minimum = self.compactAfter
+
+        return self.__lastSeq - self.__snapshotSeq >= minimum
+
+    def compact(self, columns:dict[str, np.ndarray],
+                    background:bool = True) -> None:
+        """
+        BudgetStore.compact(columns, background)
+        columns: dict[str, np.ndarray]: the budget with every journal
+            record applied
+        background: bool: write the budget file on another thread
+
+        writes the budget file and removes the journal records it now has.
+        records appended while the file is written stay in the journal
+        """
+        #only one compaction at a time
+        if self.__compactThread is not None and self.__compactThread.is_alive():
+            return
+
+        self.__raise_compact_error()
+
+        seq = self.__lastSeq
+
+        #edits replace columns instead of changing them, so this holds the
+        #columns as they are now. they are copied on the compaction thread
+        columns = dict(columns)
+
+        if background:
+            self.__compactThread = threading.Thread(
+                target=self.__compact_in_background,
+                args=(columns, seq),
+                daemon=True
+            )
+            self.__compactThread.start()
+        else:
+            self.__compact(columns, seq)
+
+    def wait_for_compaction(self) -> None:
+        """
+        BudgetStore.wait_for_compaction()
+        waits for a background compaction to finish
+        raises OSError if it failed
+        """
+        if self.__compactThread is not None:
+            self.__compactThread.join()
+            self.__compactThread = None
+
+        self.__raise_compact_error()
+
+    def __compact_in_background(self, columns:dict[str, np.ndarray],
+                                    seq:int) -> None:
+        """
+        BudgetStore.__compact_in_background(columns, seq)
+        columns: dict[str, np.ndarray]: the budget up to record seq
+        seq: int: number of the last journal record in columns
+
+        compacts on the worker thread. A failed compaction is logged and
+        kept so the next compact() or wait_for_compaction() raises it
+        """
+        try:
+            self.__compact(columns, seq)
+        except OSError as error:
+            print(f"ERROR: budget could not be compacted: {error}")
+            self.__compactError = error
+
+    def __raise_compact_error(self) -> None:
+        """
+        BudgetStore.__raise_compact_error()
+        raises OSError if the last background compaction failed. The
+        journal still has every record, so nothing was lost
+        """
+        error, self.__compactError = self.__compactError, None
+
+        if error is not None:
+            raise error
+
+    def load(self) -> dict[str, np.ndarray]:
+        """
+        BudgetStore.load() -> dict[str, np.ndarray]
+        returns the saved columns with the journal replayed on top of them.
+        Columns the journal did not change stay memory-mapped. A column the
+        journal changed, and every column if it added or deleted a row, is
+        read into memory; compaction keeps that journal short.
+        A new budget has an empty transaction table
+        """
+        columns = empty_transactions()
+        self.__snapshotSeq = 0
+
+        if os.path.exists(self.path):
+            columns.update(read_budget(self.path))
+            header, dataStart = read_header(self.path)
+            self.__snapshotSeq = header.get("journalSeq", 0)
+
+        self.__lastSeq = self.__snapshotSeq
+
+        #replay the edits the budget file does not have yet
+        for record in self.__read_journal():
+            if record["seq"] > self.__snapshotSeq:
+                columns = apply_record(columns, record)
+                self.__lastSeq = record["seq"]
+
+        return columns
+
+    def __compact(self, columns:dict[str, np.ndarray], seq:int) -> None:
+        """
+        BudgetStore.__compact(columns, seq)
+        columns: dict[str, np.ndarray]: the budget up to record seq
+        seq: int: number of the last journal record in columns
+
+        copies the columns, writes the budget file, then removes the
+        records it has from the journal
+        """
+        #the budget file being replaced may be mapped into the columns
+        snapshot = {name: np.array(column) for name, column in columns.items()}
+
+        write_budget(self.path, snapshot, journalSeq=seq)
+
+        with self.__lock:
+            self.__snapshotSeq = seq
+            self.__rewrite_journal(
+                record for record in self.__read_journal()
+                if record["seq"] > seq
+            )
+
+    def __read_journal(self) -> t.Iterator[dict]:
+        """
+        BudgetStore.__read_journal() -> iterator[dict]
+        returns each record in the journal. A record cut off by a crash is
+        skipped
+        """
+        if not os.path.exists(self.journalPath):
+            return
+
+        with open(self.journalPath, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    #only the last line can be cut off
+                    return
+
+    def __rewrite_journal(self, records:t.Iterable[dict]) -> None:
+        """
+        BudgetStore.__rewrite_journal(records)
+        records: iterable[dict]: records to keep
+
+        replaces the journal with records
+        """
+        lines = [json.dumps(record) + "\n" for record in records]
+
+        #no journal is needed if there are no records
+        if not lines:
+            if os.path.exists(self.journalPath):
+                os.remove(self.journalPath)
+            return
+
+        tempPath = self.journalPath + ".tmp"
+        with open(tempPath, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tempPath, self.journalPath)
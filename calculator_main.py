@@ -10,12 +10,34 @@ Also saves + retrieves data to & from the computer
 import tkinter as tk
 import time
 import sys
-import pickle
+import os
+import typing as t
 import numpy as np
-import pandas as pd
 
-#import the different parts of the program
+#import the different parts of the program.
+#parts that need pandas or matplotlib are imported the first time they are
+#used so the window opens without waiting for them
 import BudgetCalcWidgets as bcw
+import colorUtils
+import budgetStorage
+import taskRunner
+import categoryTotals
+import timePyramid
+
+
+#file the budget is saved to.
+#end it with .sqlite to keep the budget in a SQLite database instead
+DATA_FILE:str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "budget_data.budget"
+)
+
+#a budget kept in a database starts by showing this many days up to today,
+#so the tabs do not load the whole history
+DATABASE_WINDOW_DAYS:int = 365
+
+#default group of run_task(): the mode that is open when the task starts
+CURRENT_MODE:str = "current mode"
 
 
 #create the window
@@ -42,12 +64,8 @@ class Budget_Calculator(tk.Frame):
         self.master.update()
         self.master.update_idletasks()
 
-        if "#" not in self["bg"]:
-            self.color:tuple = bcw.rgb_to_hex(tuple(map(
-                lambda x: x // 256, root.winfo_rgb(self["bg"])
-            )))
-        else:
-            self.color = self["bg"]
+        #named colors are looked up once and cached
+        self.color:str = colorUtils.to_hex(self["bg"], self)
         
 
         #title of project
@@ -73,15 +91,7 @@ class Budget_Calculator(tk.Frame):
 
         #save unselected color as RGB and hex, same with selected Color
         self.__unselectedColor:list = [bcw.hex_to_rgb(self.color), self.color]
-        self.selectedColor = [
-             list(value - 50 for value in self.__unselectedColor[0]),           
-        ]
-
-        for index, value in enumerate(self.selectedColor[0]):
-            if value < 0:
-                self.selectedColor[0][index] = 0
-
-        self.selectedColor[0] = tuple(self.selectedColor[0])
+        self.selectedColor = [colorUtils.shade(self.__unselectedColor[0], -50)]
 
         self.selectedColor.append(bcw.rgb_to_hex(self.selectedColor[0]))
 
@@ -106,13 +116,13 @@ class Budget_Calculator(tk.Frame):
 
         # set a tab for each of the modes
         # store it to an empty dictionary
-        tabs:dict[str, tk.Label] = {}
+        self.__tabs:dict[str, tk.Label] = {}
 
         # go through each element in the tabs
         # add the corresponding tab to the app
 
         for index, label in enumerate(self.__MODES):
-            tabs[label] = tk.Label(
+            self.__tabs[label] = tk.Label(
                 tabFrame,
                 font=("Georgia", 24),
                 fg="White",
@@ -121,10 +131,14 @@ class Budget_Calculator(tk.Frame):
             )
 
             #place the label
-            tabs[label].grid(row=0, column=index, ipadx=2)
+            self.__tabs[label].grid(row=0, column=index, ipadx=2)
 
-            #allow the label to change mode of window
-            tabs[label].bind("<Button>", lambda e: self.__set_mode(index))
+            #allow the label to change mode of window.
+            #index is bound now; otherwise every tab would use the last one
+            self.__tabs[label].bind(
+                "<Button>",
+                lambda e, index=index: self.__set_mode(index)
+            )
 
 
 
@@ -177,9 +191,73 @@ class Budget_Calculator(tk.Frame):
         self.investmentsFrame = None
         self.taxesFrame = None
 
+        #each mode's frame is built the first time it is opened, then kept
+        #and hidden while another mode is open
+        self.__tabBuilders:dict[str, t.Callable[[], tk.Frame]] = {
+            'income and expenses': self.__build_income_tab,
+            'savings': self.__build_savings_tab,
+            'analysis': self.__build_analysis_tab,
+            'investments': self.__build_investments_tab,
+            'taxes': self.__build_taxes_tab
+        }
+        self.__tabFillers:dict[str, t.Callable[[], None]] = {
+            'income and expenses': self.__fill_income_tab,
+            'savings': self.__fill_savings_tab,
+            'analysis': self.__fill_analysis_tab,
+            'investments': self.__fill_investments_tab,
+            'taxes': self.__fill_taxes_tab
+        }
+        self.__tabFrames:dict[str, tk.Frame] = {}
+
+        #charts of each mode. they are paused while their mode is hidden
+        self.__tabCharts:dict[str, list] = {}
+
+        #modes whose data changed since they were last filled in.
+        #hidden modes are only filled in when they are opened again
+        self.__staleTabs:set[str] = set()
+        self.__refreshJob:str|None = None
+
+        #the saved budget and the transactions in it
+        self.store:budgetStorage.BudgetStore = budgetStorage.open_store(
+            DATA_FILE
+        )
+        self.transactions:dict[str, np.ndarray] = (
+            budgetStorage.empty_transactions()
+        )
+
+        #dates the table and analysis show. None for no limit.
+        #a database store only loads these dates
+        self.startDate:np.datetime64|None = None
+        self.endDate:np.datetime64|None = None
+        if self.store.queryable:
+            self.startDate = (
+                np.datetime64("today", "D")
+                - np.timedelta64(DATABASE_WINDOW_DAYS, "D")
+            )
+
+        #totals by category, month and date, updated with every edit.
+        #a database store is totalled by the tabs' own queries instead.
+        #built the first time a tab needs them, so opening the budget does
+        #not read every row
+        self.totals:categoryTotals.CategoryTotals|None = None
+
+        #sums by day, week, month, quarter and year for zoomable charts,
+        #also updated with every edit once built
+        self.pyramid:timePyramid.TimePyramid|None = None
+
+        #ids of the rows in the income table, see __transaction_key
+        self.shownIds = np.array([], dtype=np.int64)
+
+        #slow work runs on worker threads so the window does not freeze.
+        #tasks are grouped by the mode that started them
+        self.tasks:taskRunner.TaskRunner = taskRunner.TaskRunner(self)
+        self.bind("<Destroy>", lambda e: self.tasks.shutdown(), "+")
+
         self.CurrentModeIndex:int|None = None #set default mode
         self.__set_mode(0)
-        self.revive_data() # get data previously saved
+
+        #get data previously saved once the window has been drawn
+        self.after_idle(self.revive_data)
 
         #we put this last to make sure users do not accidentally save unused data
 
@@ -189,12 +267,767 @@ class Budget_Calculator(tk.Frame):
 
         self.master.update()
 
-    def __set_mode(self, value):
-        pass 
-    def save_data(self):
-        pass
-    def revive_data(self):
-        pass
+    def __set_mode(self, value:int) -> None:
+        """
+        Budget_Calculator.__set_mode(self, value)
+        value: int: index of the mode in __MODES
+
+        switches to the mode. Work started by the mode being left is
+        cancelled
+        """
+        #nothing to do if the mode is already open
+        if value == self.CurrentModeIndex:
+            return
+
+        #stop the old mode's background work; its results are not needed
+        if self.CurrentModeIndex is not None:
+            self.tasks.cancel_group(self.selectedMode)
+            self.__hide_tab(self.selectedMode)
+
+        self.CurrentModeIndex = value
+        self.selectedMode = self.__MODES[value]
+
+        self.__show_tab(self.selectedMode)
+
+    def __show_tab(self, mode:str) -> None:
+        """
+        Budget_Calculator.__show_tab(self, mode)
+        mode: str: mode to show
+
+        builds the mode's frame if it has never been opened, then shows it
+        and fills it in if its data changed while it was hidden
+        """
+        if mode not in self.__tabFrames:
+            self.__tabFrames[mode] = self.__tabBuilders[mode]()
+            self.__staleTabs.add(mode)
+
+        self.__tabFrames[mode].place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.__tabs[mode]["bg"] = self.selectedColor[1]
+
+        for chart in self.__tabCharts.get(mode, ()):
+            chart.resume()
+
+        if mode in self.__staleTabs:
+            self.refresh_tab()
+
+    def __hide_tab(self, mode:str) -> None:
+        """
+        Budget_Calculator.__hide_tab(self, mode)
+        mode: str: mode to hide
+
+        hides the mode's frame without destroying it. Its charts stop
+        redrawing until it is shown again
+        """
+        for chart in self.__tabCharts.get(mode, ()):
+            chart.pause()
+
+        self.__tabFrames[mode].place_forget()
+        self.__tabs[mode]["bg"] = self.__unselectedColor[1]
+
+    def refresh_tab(self) -> None:
+        """
+        Budget_Calculator.refresh_tab(self)
+        fills in the open mode with the current data
+        """
+        if self.__refreshJob is not None:
+            self.after_cancel(self.__refreshJob)
+            self.__refreshJob = None
+
+        self.__staleTabs.discard(self.selectedMode)
+        self.__tabFillers[self.selectedMode]()
+
+    def data_changed(self) -> None:
+        """
+        Budget_Calculator.data_changed(self)
+        marks every mode that has been built as out of date. The open mode
+        is filled in once the current changes are done; the others are
+        filled in when they are opened
+        """
+        self.__staleTabs = set(self.__tabFrames)
+
+        if self.__refreshJob is None:
+            self.__refreshJob = self.after_idle(self.refresh_tab)
+
+    def set_dates(self, start:t.Any = None, end:t.Any = None) -> None:
+        """
+        Budget_Calculator.set_dates(self, start, end)
+        start: str|np.datetime64|None: first date to show. None for no limit
+        end: str|np.datetime64|None: last date to show. None for no limit
+
+        changes the dates the table and analysis show and fills the tabs in
+        again
+        """
+        self.startDate, self.endDate = (
+            None if date is None
+            else budgetStorage.column_value("dates", date)[0]
+            for date in (start, end)
+        )
+
+        self.data_changed()
+
+    def get_totals(self, start:t.Any = None,
+                    end:t.Any = None) -> categoryTotals.CategoryTotals:
+        """
+        Budget_Calculator.get_totals(self, start, end)
+            -> categoryTotals.CategoryTotals
+        start: str|np.datetime64|None: first date needed. None for no limit
+        end: str|np.datetime64|None: last date needed. None for no limit
+
+        returns the totals of the budget by category, month and date. A
+        database store sums the dates asked for in the database each time,
+        so only one row per day and category is loaded
+        """
+        if self.store.queryable:
+            return categoryTotals.CategoryTotals(
+                self.store.daily_totals(start, end)
+            )
+
+        if self.totals is None:
+            self.totals = categoryTotals.CategoryTotals(self.transactions)
+
+        return self.totals
+
+    def get_balance_before(self, date:t.Any) -> float:
+        """
+        Budget_Calculator.get_balance_before(self, date) -> float
+        date: str|np.datetime64: date in MM/DD/YYYY or YYYY-MM-DD format
+
+        returns the total of every transaction before date. A database
+        store sums it in the database
+        """
+        if self.store.queryable:
+            return self.store.balance_before(date)
+
+        dayBefore = (
+            budgetStorage.column_value("dates", date)[0]
+            - np.timedelta64(1, "D")
+        )
+        return self.get_totals().total(end=dayBefore)
+
+    def get_pyramid(self, start:t.Any = None,
+                        end:t.Any = None) -> timePyramid.TimePyramid:
+        """
+        Budget_Calculator.get_pyramid(self, start, end)
+            -> timePyramid.TimePyramid
+        start: str|np.datetime64|None: first date needed. None for no limit
+        end: str|np.datetime64|None: last date needed. None for no limit
+
+        returns the sums of the budget by day, week, month, quarter and
+        year. A database store is summed by day in the database each time.
+        Everything before start is summed into the day before it, so the
+        running balance is the same as with the whole history
+        """
+        if self.store.queryable:
+            totals = self.store.daily_totals(start, end)
+            dates, amounts = totals["dates"], totals["amounts"]
+
+            if start is not None:
+                dayBefore = (
+                    budgetStorage.column_value("dates", start)
+                    - np.timedelta64(1, "D")
+                )
+                dates = np.concatenate((dayBefore, dates))
+                amounts = np.concatenate(
+                    ([self.store.balance_before(start)], amounts)
+                )
+
+            return timePyramid.TimePyramid(dates, amounts)
+
+        if self.pyramid is None:
+            self.pyramid = timePyramid.TimePyramid(
+                self.transactions["dates"],
+                self.transactions["amounts"]
+            )
+
+        return self.pyramid
+
+    def __add_chart(self, mode:str, master:tk.Frame, chartType:str):
+        """
+        Budget_Calculator.__add_chart(self, mode, master, chartType)
+            -> graphFrame.Graphing
+        mode: str: mode the chart belongs to
+        master: tkinter.Frame: frame to put the chart in
+        chartType: str: any chart of graphFrame.Charts
+
+        returns a new chart. It is paused while its mode is hidden
+        """
+        #only import matplotlib once a chart is shown
+        import graphFrame
+
+        chart = graphFrame.Graphing(master)
+        chart.switch_graph(chartType)
+        self.__tabCharts.setdefault(mode, []).append(chart)
+
+        return chart
+
+    def __build_income_tab(self) -> tk.Frame:
+        """
+        Budget_Calculator.__build_income_tab(self) -> tkinter.Frame
+        returns the frame of the income and expenses mode: a table of every
+        transaction
+        """
+        self.incomeFrame = tk.Frame(self.window, bg=self.selectedColor[1])
+
+        self.incomeList:bcw.DataList = bcw.DataList(
+            self.incomeFrame,
+            kwargs={"bg": self.selectedColor[1]}
+        )
+        self.incomeList.place(relx=0, rely=0, relwidth=1, relheight=1)
+
+        return self.incomeFrame
+
+    def __fill_income_tab(self) -> None:
+        """
+        Budget_Calculator.__fill_income_tab(self)
+        shows the transactions between startDate and endDate in the table
+        """
+        transactions = self.get_transactions(self.startDate, self.endDate)
+
+        #the ids of the rows shown, so edits from the table change the
+        #right transaction
+        self.shownIds = transactions["ids"]
+
+        self.incomeList.set_data(
+            transactions["dates"],
+            transactions["amounts"],
+            transactions["categories"],
+            transactions["descriptions"]
+        )
+
+    def __build_savings_tab(self) -> tk.Frame:
+        """
+        Budget_Calculator.__build_savings_tab(self) -> tkinter.Frame
+        returns the frame of the savings mode: a chart of the balance over
+        time
+        """
+        self.spendingsFrame = tk.Frame(self.window, bg=self.selectedColor[1])
+
+        self.savingsChart = self.__add_chart(
+            'savings',
+            self.spendingsFrame,
+            "LINE PLOT"
+        )
+        self.savingsChart.place(relx=0, rely=0, relwidth=1, relheight=1)
+
+        return self.spendingsFrame
+
+    def __fill_savings_tab(self) -> None:
+        """
+        Budget_Calculator.__fill_savings_tab(self)
+        charts the balance over time, up to today. The chart reads days,
+        weeks, months, quarters or years depending on how much time is in
+        view
+        """
+        self.savingsChart.set_pyramid(
+            self.get_pyramid(self.startDate, self.endDate),
+            cumulative=True,
+            #scheduled and future-dated transactions are not saved yet
+            lastDate=np.datetime64("today", "D"),
+            xName="Date",
+            yName="Balance",
+            title="Savings",
+            pointSize=0,
+            lineColor=self.selectedColor[1]
+        )
+
+    def __build_analysis_tab(self) -> tk.Frame:
+        """
+        Budget_Calculator.__build_analysis_tab(self) -> tkinter.Frame
+        returns the frame of the analysis mode: a chart of spending by
+        category next to the subscriptions and expensive repeat purchases
+        """
+        self.incomeAnalysisFrame = tk.Frame(
+            self.window,
+            bg=self.selectedColor[1]
+        )
+
+        self.spendingChart = self.__add_chart(
+            'analysis',
+            self.incomeAnalysisFrame,
+            "PIE CHART"
+        )
+        self.spendingChart.place(relx=0, rely=0, relwidth=0.6, relheight=1)
+
+        self.repeatsLabel:tk.Label = tk.Label(
+            self.incomeAnalysisFrame,
+            bg=self.selectedColor[1],
+            fg="white",
+            font=("Georgia", 14),
+            justify="left",
+            anchor="nw",
+            text="Looking for subscriptions..."
+        )
+        self.repeatsLabel.place(relx=0.6, rely=0, relwidth=0.4, relheight=1)
+
+        return self.incomeAnalysisFrame
+
+    def __fill_analysis_tab(self) -> None:
+        """
+        Budget_Calculator.__fill_analysis_tab(self)
+        charts the money spent in each category between startDate and
+        endDate and looks for subscriptions and expensive repeat purchases
+        on a worker thread
+        """
+        totals = self.get_totals(self.startDate, self.endDate)
+        spending = {
+            category: -total
+            for category, total in totals.category_totals(
+                self.startDate,
+                self.endDate
+            ).items()
+            if total < 0
+        }
+
+        #with no spending the chart says so instead of keeping the last data
+        self.spendingChart.set_attributes(
+            list(spending),
+            list(spending.values()),
+            title="Spending by category"
+        )
+
+        self.analyze_spending(self.__show_repeats, self.startDate, self.endDate)
+
+    def __show_repeats(self, analysis:dict) -> None:
+        """
+        Budget_Calculator.__show_repeats(self, analysis)
+        analysis: dict: result of purchaseAnalysis.analyze_spending()
+
+        lists the subscriptions and expensive repeat purchases
+        """
+        lines = ["Subscriptions:"]
+        subscriptions = analysis["subscriptions"]
+        for merchant, total, period in zip(subscriptions["merchant"][:5],
+                                           subscriptions["total"][:5],
+                                           subscriptions["period"][:5]):
+            lines.append(f"  {merchant}: ${total:,.2f} ({period})")
+
+        lines.append("")
+        lines.append("Expensive repeats:")
+        repeats = analysis["expensiveRepeats"]
+        for merchant, total, count in zip(repeats["merchant"][:5],
+                                          repeats["total"][:5],
+                                          repeats["count"][:5]):
+            lines.append(f"  {merchant}: ${total:,.2f} ({count} times)")
+
+        self.repeatsLabel["text"] = "\n".join(lines)
+
+    def __build_investments_tab(self) -> tk.Frame:
+        """
+        Budget_Calculator.__build_investments_tab(self) -> tkinter.Frame
+        returns the frame of the investments mode: the range of outcomes of
+        investing the current savings
+        """
+        self.investmentsFrame = tk.Frame(self.window, bg=self.selectedColor[1])
+
+        self.investmentsChart = self.__add_chart(
+            'investments',
+            self.investmentsFrame,
+            "FAN CHART"
+        )
+        self.investmentsChart.place(relx=0, rely=0, relwidth=1, relheight=1)
+
+        return self.investmentsFrame
+
+    def __fill_investments_tab(self) -> None:
+        """
+        Budget_Calculator.__fill_investments_tab(self)
+        simulates investing the current savings and the average amount
+        saved each month over the last year, on a worker thread
+        """
+        import monteCarlo
+
+        #only the last 12 months are totalled; everything before them is
+        #one balance
+        thisMonth = np.datetime64("today", "M")
+        start = (thisMonth - 11).astype("datetime64[D]")
+        end = (thisMonth + 1).astype("datetime64[D]") - np.timedelta64(1, "D")
+
+        totals = self.get_totals(start, end)
+        months, monthTotals = totals.month_totals()
+        lastYear = monthTotals[(months >= thisMonth - 11) & (months <= thisMonth)]
+        balance = self.get_balance_before(start) + totals.total(start, end)
+
+        #worker processes would each open a window when this file is
+        #imported by them, so the simulation stays in this process
+        self.run_task(
+            monteCarlo.simulate,
+            startBalance=max(balance, 0.0),
+            monthlyContribution=(
+                max(float(lastYear.mean()), 0.0) if len(lastYear) else 0.0
+            ),
+            years=30,
+            seed=0,
+            workers=1,
+            onDone=lambda simulation: self.investmentsChart.set_attributes(
+                **monteCarlo.graph_attributes(
+                    simulation,
+                    bandColor=self.selectedColor[1],
+                    lineColor="white"
+                )
+            )
+        )
+
+    def __build_taxes_tab(self) -> tk.Frame:
+        """
+        Budget_Calculator.__build_taxes_tab(self) -> tkinter.Frame
+        returns the frame of the taxes mode: a chart of the tax owed on
+        each income
+        """
+        self.taxesFrame = tk.Frame(self.window, bg=self.selectedColor[1])
+
+        self.taxesChart = self.__add_chart('taxes', self.taxesFrame, "LINE PLOT")
+        self.taxesChart.place(relx=0, rely=0, relwidth=1, relheight=1)
+
+        return self.taxesFrame
+
+    def __fill_taxes_tab(self) -> None:
+        """
+        Budget_Calculator.__fill_taxes_tab(self)
+        charts the tax owed on incomes up to $250,000
+        """
+        import taxes
+
+        sweep = taxes.what_if(np.linspace(0, 250000, 1001))
+
+        self.taxesChart.set_attributes(
+            **taxes.graph_attributes(
+                sweep["income"][:, 0, 0],
+                sweep["tax"][:, 0, 0],
+                pointSize=0,
+                lineColor=self.selectedColor[1]
+            )
+        )
+
+    def run_task(self, function:t.Callable, *args,
+                    onDone:t.Callable[[t.Any], None]|None = None,
+                    onProgress:t.Callable[..., None]|None = None,
+                    group:str|None = CURRENT_MODE,
+                    **kwargs) -> taskRunner.Task:
+        """
+        Budget_Calculator.run_task(self, function, *args, onDone, onProgress,
+            group, **kwargs) -> taskRunner.Task
+        function: callable: slow work to run, e.g. a total or a projection
+        *args, **kwargs: arguments for function
+        onDone: function(result): called on the Tkinter thread when done
+        onProgress: function(*args): called on the Tkinter thread each time
+            function reports. function is given onProgress to report with
+        group: str|None: name used to cancel the task. By default, the task
+            is cancelled if the user switches to another mode before it
+            finishes. None is never cancelled by switching modes
+
+        runs the function on a worker thread
+        returns the Task
+        """
+        if group == CURRENT_MODE:
+            group = self.selectedMode
+
+        return self.tasks.submit(
+            function,
+            *args,
+            onDone=onDone,
+            onProgress=onProgress,
+            group=group,
+            **kwargs
+        )
+
+    def add_transaction(self, date:str, amount:float, category:str,
+                            description:str) -> None:
+        """
+        Budget_Calculator.add_transaction(self, date, amount, category,
+            description)
+        date: str: date in MM/DD/YYYY format
+        amount: float: amount of the transaction
+        category: str: category of the transaction
+        description: str: description of the transaction
+
+        adds a transaction and saves it to the journal
+        """
+        self.__record_edit({
+            "op": "add",
+            "values": {
+                "dates": date,
+                "amounts": amount,
+                "categories": category,
+                "descriptions": description
+            }
+        })
+
+    def edit_transaction(self, row:int, column:str, value) -> None:
+        """
+        Budget_Calculator.edit_transaction(self, row, column, value)
+        row: int: row of the transaction as shown in the table
+        column: str: any of budgetStorage.TRANSACTION_COLUMNS
+        value: any: new value
+
+        changes one value of a transaction
+        """
+        self.__record_edit({
+            **self.__transaction_key(row),
+            "op": "edit",
+            "column": column,
+            "value": value
+        })
+
+    def delete_transaction(self, row:int) -> None:
+        """
+        Budget_Calculator.delete_transaction(self, row)
+        row: int: row of the transaction as shown in the table
+
+        removes a transaction
+        """
+        self.__record_edit({**self.__transaction_key(row), "op": "delete"})
+
+    def __transaction_key(self, row:int) -> dict[str, int]:
+        """
+        Budget_Calculator.__transaction_key(self, row) -> dict[str, int]
+        row: int: row of the transaction as shown in the table
+
+        the table can be sorted and filtered and only shows startDate to
+        endDate, so the row is turned into the transaction's id
+        returns {"id": database id} for a database store, or
+        {"row": position in transactions}
+        """
+        transactionId = int(self.shownIds[self.incomeList.get_order()[row]])
+
+        if self.store.queryable:
+            return {"id": transactionId}
+
+        return {"row": transactionId}
+
+    def __record_edit(self, record:dict) -> None:
+        """
+        Budget_Calculator.__record_edit(self, record)
+        record: dict: edit to make. see budgetStorage.apply_record()
+
+        makes the edit and saves it right away, so a crash does not lose
+        it. Once the journal is long, it is folded into the budget file on
+        a background thread
+        """
+        #a database store saves each edit as it is made
+        if self.store.queryable:
+            try:
+                self.store.append([record])
+            except (OSError, IndexError, ValueError) as error:
+                print(f"ERROR: edit could not be saved: {error}")
+            self.data_changed()
+            return
+
+        #the totals need the transaction from before the edit.
+        #totals that are not built yet are built with the edit in them
+        if self.totals is not None:
+            self.totals.apply_record(self.transactions, record)
+        if self.pyramid is not None:
+            self.pyramid.apply_record(self.transactions, record)
+        self.transactions = budgetStorage.apply_record(
+            self.transactions,
+            record
+        )
+
+        try:
+            self.store.append([record])
+
+            if self.store.needs_compaction():
+                self.store.compact(self.transactions)
+
+        except OSError as error:
+            print(f"ERROR: edit could not be saved: {error}")
+
+        self.data_changed()
+
+    def import_statement(self, path:str,
+                            onProgress:t.Callable[[int, int], None]|None = None
+                            ) -> int:
+        """
+        Budget_Calculator.import_statement(self, path, onProgress) -> int
+        path: str: CSV, OFX or QFX file exported from a bank
+        onProgress: function(bytesRead, totalBytes): called after each chunk
+
+        adds every transaction in the statement to the budget, a chunk at a
+        time, then saves the budget. Blocks until the import is done; see
+        start_import() to import in the background
+        returns the number of transactions imported
+        """
+        return self.__finish_import(self.__read_statement(path, onProgress))
+
+    def start_import(self, path:str,
+                        onDone:t.Callable[[int], None]|None = None,
+                        onProgress:t.Callable[[int, int], None]|None = None
+                        ) -> taskRunner.Task:
+        """
+        Budget_Calculator.start_import(self, path, onDone, onProgress)
+        path: str: CSV, OFX or QFX file exported from a bank
+        onDone: function(imported): called with the number of transactions
+            imported
+        onProgress: function(bytesRead, totalBytes): called after each chunk
+
+        imports the statement on a worker thread. The import is not
+        cancelled by switching modes. Callbacks are called on the Tkinter
+        thread
+        returns the Task
+        """
+        def finish(result:tuple[int, dict|None]) -> None:
+            imported = self.__finish_import(result)
+            if onDone:
+                onDone(imported)
+
+        return self.run_task(
+            self.__read_statement,
+            path,
+            onDone=finish,
+            #report progress only if someone is listening
+            onProgress=onProgress if onProgress else (lambda *args: None),
+            #an import keeps going when the user switches modes
+            group=None
+        )
+
+    def __read_statement(self, path:str,
+                            onProgress:t.Callable[[int, int], None]|None = None
+                            ) -> tuple[int, dict[str, np.ndarray]|None]:
+        """
+        Budget_Calculator.__read_statement(self, path, onProgress)
+        path: str: CSV, OFX or QFX file exported from a bank
+        onProgress: function(bytesRead, totalBytes): called after each chunk
+
+        reads the statement. Safe to run on a worker thread: the budget in
+        memory is not changed
+        returns the number of transactions read and the transactions. A
+        database store saves the transactions as they are read, so None is
+        returned in their place
+        """
+        #only import pandas when a statement is imported
+        import statementImporter
+
+        #a database store saves each chunk as it is read
+        if self.store.queryable:
+            imported = statementImporter.import_statement(
+                path,
+                self.store.append_columns,
+                onProgress=onProgress
+            )
+            return imported, None
+
+        columns = budgetStorage.empty_transactions()
+
+        def add_chunk(chunk:dict[str, np.ndarray]) -> None:
+            nonlocal columns
+            columns = budgetStorage.concatenate_columns(columns, chunk)
+
+        imported = statementImporter.import_statement(
+            path,
+            add_chunk,
+            onProgress=onProgress
+        )
+
+        return imported, columns
+
+    def __finish_import(self,
+                            result:tuple[int, dict[str, np.ndarray]|None]
+                            ) -> int:
+        """
+        Budget_Calculator.__finish_import(self, result) -> int
+        result: tuple[int, dict|None]: result of __read_statement()
+
+        adds the imported transactions to the budget and saves it
+        returns the number of transactions imported
+        """
+        imported, columns = result
+
+        if columns is not None:
+            self.transactions = budgetStorage.concatenate_columns(
+                self.transactions,
+                columns
+            )
+            #the totals are built again the next time a tab needs them
+            self.totals = None
+            self.pyramid = None
+
+            #the journal's edits are already in the transactions
+            self.store.save(self.transactions)
+
+        self.data_changed()
+
+        return imported
+
+    def save_data(self, e:tk.Event = None) -> None:
+        """
+        Budget_Calculator.save_data(self, e)
+        e: tkinter.Event
+        every edit is already in the journal; folds the journal into
+        DATA_FILE on a background thread
+        """
+        try:
+            if self.store.needs_compaction(minimum=1):
+                self.store.compact(self.transactions)
+
+        except OSError as error:
+            print(f"ERROR: budget could not be saved: {error}")
+
+    def revive_data(self) -> None:
+        """
+        Budget_Calculator.revive_data(self)
+        loads the budget saved in DATA_FILE and replays the journal of
+        edits made since it was last rewritten.
+        The columns are memory-mapped. The totals are only built when a tab
+        needs them, so columns no open tab uses are not read from the disk
+        """
+        #a database store is read a range of dates at a time by the tabs
+        if self.store.queryable:
+            return
+
+        try:
+            self.transactions = self.store.load()
+            self.totals = None
+            self.pyramid = None
+        except (OSError, ValueError) as error:
+            print(f"ERROR: saved budget could not be loaded: {error}")
+
+        self.data_changed()
+
+    def get_transactions(self, start:t.Any = None,
+                            end:t.Any = None) -> dict[str, np.ndarray]:
+        """
+        Budget_Calculator.get_transactions(self, start, end)
+        start: str|np.datetime64|None: first date in MM/DD/YYYY format. None
+            for no limit
+        end: str|np.datetime64|None: last date in MM/DD/YYYY format. None
+            for no limit
+
+        returns the transactions a tab shows, with the id of each one in
+        "ids": the database id, or the position in transactions. A
+        database store only loads the dates asked for
+        """
+        if self.store.queryable:
+            return self.store.query(start, end)
+
+        columns = dict(self.transactions)
+        columns["ids"] = np.arange(len(columns["dates"]))
+
+        return budgetStorage.select_dates(columns, start, end)
+
+    def analyze_spending(self, onDone:t.Callable[[dict], None],
+                            start:t.Any = None, end:t.Any = None
+                            ) -> taskRunner.Task:
+        """
+        Budget_Calculator.analyze_spending(self, onDone, start, end)
+        onDone: function(analysis): called with the result of
+            purchaseAnalysis.analyze_spending()
+        start: str|np.datetime64|None: first date in MM/DD/YYYY format. None
+            for no limit
+        end: str|np.datetime64|None: last date in MM/DD/YYYY format. None
+            for no limit
+
+        finds subscriptions and expensive repeat purchases for the analysis
+        tab on a worker thread
+        returns the Task
+        """
+        #only import pandas when spending is analyzed
+        import purchaseAnalysis
+
+        return self.run_task(
+            purchaseAnalysis.analyze_spending,
+            self.get_transactions(start, end),
+            onDone=onDone
+        )
 
  
 
@@ -0,0 +1,364 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Keeps totals of the budget by category, month and date for the income and
+expenses, savings and analysis tabs.
+Each category keeps a Fenwick tree (binary indexed tree) of its daily
+totals, so adding, editing or deleting one transaction and the total of
+any range of dates both take O(log N) instead of a pass over the budget
+"""
+
+#import needed modules
+import typing as t
+import numpy as np
+
+import budgetStorage
+import dateUtils
+
+
+#days added past the newest date so new transactions rarely grow the arrays
+GROWTH_DAYS:int = 366
+
+
+def to_day(date:t.Any) -> np.datetime64:
+    """
+    to_day(date) -> np.datetime64
+    date: str|np.datetime64: date in MM/DD/YYYY format or a datetime64
+    returns the date as a datetime64[D]
+    """
+    return budgetStorage.column_value("dates", date)[0]
+
+
+def record_changes(columns:dict[str, np.ndarray],
+                    record:dict) -> list[tuple[t.Any, float, str]]:
+    """
+    record_changes(columns, record) -> list[tuple[date, float, str]]
+    columns: dict[str, np.ndarray]: transactions from BEFORE the edit
+    record: dict: edit. see budgetStorage.apply_record()
+
+    returns the (date, amount, category) to add to the totals for the edit.
+    a removed transaction is added back with a negative amount
+    """
+    match record["op"]:
+        case "add":
+            values = record["values"]
+            return [(
+                values.get("dates"),
+                float(values.get("amounts") or 0),
+                values.get("categories", "")
+            )]
+
+        case "edit" | "delete":
+            row = record["row"]
+            old = {
+                name: columns[name][row]
+                for name in ("dates", "amounts", "categories")
+            }
+            changes = [
+                (old["dates"], -float(old["amounts"]), old["categories"])
+            ]
+
+            if record["op"] == "edit":
+                if record["column"] in old:
+                    old[record["column"]] = budgetStorage.column_value(
+                        record["column"],
+                        record["value"]
+                    )[0]
+                changes.append(
+                    (old["dates"], float(old["amounts"]), old["categories"])
+                )
+
+            return changes
+
+        case _:
+            raise ValueError(f"unknown journal record: {record}")
+
+
+class CategoryTotals:
+    """
+    Totals of transactions by category, month and date that are updated
+    one transaction at a time
+    """
+    def __init__(self, columns:dict[str, np.ndarray]|None = None):
+        """
+        CategoryTotals(self, columns)
+        columns: dict[str, np.ndarray]|None: transactions (dates, amounts,
+            categories) to start with
+        """
+        #row 0 holds every category together
+        self.categories:list[str] = []
+        self.__rows:dict[str, int] = {}
+
+        #first day and first month of the arrays
+        self.start:np.datetime64 = np.datetime64("1970-01-01", "D")
+        self.startMonth:np.datetime64 = np.datetime64("1970-01", "M")
+
+        #daily totals, their Fenwick trees and the monthly rollups.
+        # one row for all categories, then one row per category
+        self.daily:np.ndarray = np.zeros((1, 0))
+        self.tree:np.ndarray = np.zeros((1, 1))
+        self.monthly:np.ndarray = np.zeros((1, 0))
+
+        if columns is not None:
+            self.build(columns)
+
+    def build(self, columns:dict[str, np.ndarray]) -> None:
+        """
+        CategoryTotals.build(self, columns)
+        columns: dict[str, np.ndarray]: transactions (dates, amounts,
+            categories)
+
+        recomputes every total from the transactions in O(N)
+        """
+        dates = dateUtils.parse_dates(columns["dates"])
+        amounts = np.asarray(columns["amounts"], dtype=np.float64)
+        categoryNames, codes = np.unique(
+            np.asarray(columns["categories"], dtype=str),
+            return_inverse=True
+        )
+
+        self.categories = [str(name) for name in categoryNames]
+        self.__rows = {
+            name: row + 1 for row, name in enumerate(self.categories)
+        }
+
+        if len(dates) == 0:
+            self.daily = np.zeros((len(self.categories) + 1, 0))
+            self.__rebuild()
+            return
+
+        self.start = dates.min()
+        numDays = int((dates.max() - self.start).astype(np.int64)) + 1 + GROWTH_DAYS
+        days = (dates - self.start).astype(np.int64)
+
+        #add every transaction to its category's row and to row 0
+        self.daily = np.zeros((len(self.categories) + 1, numDays))
+        np.add.at(self.daily, (codes + 1, days), amounts)
+        self.daily[0] = self.daily[1:].sum(axis=0)
+
+        self.__rebuild()
+
+    def add(self, date:t.Any, amount:float, category:str) -> None:
+        """
+        CategoryTotals.add(self, date, amount, category)
+        date: str|np.datetime64: date of the transaction
+        amount: float: amount of the transaction
+        category: str: category of the transaction
+
+        adds one transaction in O(log N)
+        """
+        day = self.__day_index(to_day(date))
+        row = self.__row(str(category))
+
+        month = int(
+            ((self.start + day).astype("datetime64[M]") - self.startMonth)
+            .astype(np.int64)
+        )
+
+        for updated in (0, row):
+            self.daily[updated, day] += amount
+            self.monthly[updated, month] += amount
+
+            #every tree node that covers the day
+            node = day + 1
+            while node < self.tree.shape[1]:
+                self.tree[updated, node] += amount
+                node += node & -node
+
+    def remove(self, date:t.Any, amount:float, category:str) -> None:
+        """
+        CategoryTotals.remove(self, date, amount, category)
+        date: str|np.datetime64: date of the transaction
+        amount: float: amount of the transaction
+        category: str: category of the transaction
+
+        removes one transaction in O(log N)
+        """
+        self.add(date, -amount, category)
+
+    def apply_record(self, columns:dict[str, np.ndarray],
+                        record:dict) -> None:
+        """
+        CategoryTotals.apply_record(self, columns, record)
+        columns: dict[str, np.ndarray]: transactions from BEFORE the edit
+        record: dict: edit. see budgetStorage.apply_record()
+
+        updates the totals for one edit, the same way
+        budgetStorage.apply_record() updates the transactions
+        """
+        for date, amount, category in record_changes(columns, record):
+            self.add(date, amount, category)
+
+    def total(self, start:t.Any = None, end:t.Any = None,
+                category:str|None = None) -> float:
+        """
+        CategoryTotals.total(self, start, end, category) -> float
+        start: str|np.datetime64|None: first date. None for no limit
+        end: str|np.datetime64|None: last date. None for no limit
+        category: str|None: category to total. None for every category
+
+        returns the total of the transactions between start and end in
+        O(log N)
+        """
+        row = self.__rows.get(category, -1) if category is not None else 0
+        if row < 0:
+            return 0.0
+
+        return float(self.__range_totals(start, end)[row])
+
+    def category_totals(self, start:t.Any = None,
+                            end:t.Any = None) -> dict[str, float]:
+        """
+        CategoryTotals.category_totals(self, start, end) -> dict[str, float]
+        start: str|np.datetime64|None: first date. None for no limit
+        end: str|np.datetime64|None: last date. None for no limit
+
+        returns the total of each category between start and end
+        """
+        totals = self.__range_totals(start, end)[1:]
+
+        return dict(zip(self.categories, totals.tolist()))
+
+    def month_totals(self, category:str|None = None
+                        ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        CategoryTotals.month_totals(self, category)
+            -> tuple[np.ndarray[datetime64[M]], np.ndarray[float]]
+        category: str|None: category to total. None for every category
+
+        returns each month and its total
+        """
+        row = self.__rows.get(category, -1) if category is not None else 0
+        months = self.startMonth + np.arange(self.monthly.shape[1])
+
+        if row < 0:
+            return months, np.zeros(len(months))
+
+        return months, self.monthly[row].copy()
+
+    def running_balance(self, dates:t.Iterable,
+                            category:str|None = None) -> np.ndarray:
+        """
+        CategoryTotals.running_balance(self, dates, category) -> np.ndarray
+        dates: iterable[str|np.datetime64]: dates to find the balance on
+        category: str|None: category to total. None for every category
+
+        returns the total of every transaction up to and including each
+        date, all dates at once
+        """
+        row = self.__rows.get(category, -1) if category is not None else 0
+        dates = dateUtils.parse_dates(dates)
+
+        if row < 0:
+            return np.zeros(len(dates))
+
+        days = (dates - self.start).astype(np.int64)
+        return self.__prefix(row, days)
+
+    def __range_totals(self, start:t.Any, end:t.Any) -> np.ndarray:
+        """
+        CategoryTotals.__range_totals(self, start, end) -> np.ndarray
+        returns the total of every row between start and end
+        """
+        last = self.daily.shape[1] - 1
+        first = 0
+
+        if end is not None:
+            last = min(last, int((to_day(end) - self.start).astype(np.int64)))
+        if start is not None:
+            first = max(first, int((to_day(start) - self.start).astype(np.int64)))
+
+        totals = self.__prefix(slice(None), np.array([last, first - 1]))
+        return totals[:, 0] - totals[:, 1]
+
+    def __prefix(self, rows:t.Any, days:np.ndarray) -> np.ndarray:
+        """
+        CategoryTotals.__prefix(self, rows, days) -> np.ndarray
+        rows: int|slice: rows of the trees to read
+        days: np.ndarray[int]: day indexes
+
+        returns the totals up to and including each day, walking the trees
+        for every day at once
+        """
+        nodes = np.clip(days + 1, 0, self.tree.shape[1] - 1)
+        totals = np.zeros(np.shape(self.tree[rows, 0]) + nodes.shape)
+
+        while nodes.any():
+            totals += self.tree[rows][..., nodes]
+            nodes -= nodes & -nodes
+
+        return totals
+
+    def __row(self, category:str) -> int:
+        """
+        CategoryTotals.__row(self, category) -> int
+        returns the row of category, adding a row for a new category
+        """
+        row = self.__rows.get(category)
+
+        if row is None:
+            row = len(self.categories) + 1
+            self.categories.append(category)
+            self.__rows[category] = row
+
+            for name in ("daily", "tree", "monthly"):
+                array = getattr(self, name)
+                setattr(
+                    self,
+                    name,
+                    np.vstack((array, np.zeros((1, array.shape[1]))))
+                )
+
+        return row
+
+    def __day_index(self, day:np.datetime64) -> int:
+        """
+        CategoryTotals.__day_index(self, day) -> int
+        returns the index of day, growing the arrays if it is out of range
+        """
+        index = int((day - self.start).astype(np.int64))
+        numDays = self.daily.shape[1]
+
+        if 0 <= index < numDays:
+            return index
+
+        #a new budget starts at its first transaction
+        if numDays == 0:
+            self.start = day
+            before, after = 0, GROWTH_DAYS + 1
+        else:
+            before = max(0, -index + GROWTH_DAYS) if index < 0 else 0
+            after = index - numDays + 1 + GROWTH_DAYS if index >= 0 else 0
+
+        self.start = self.start - before
+        self.daily = np.pad(self.daily, ((0, 0), (before, after)))
+        self.__rebuild()
+
+        return int((day - self.start).astype(np.int64))
+
+    def __rebuild(self) -> None:
+        """
+        CategoryTotals.__rebuild(self)
+        recomputes the trees and monthly rollups from the daily totals in
+        O(N) with cumulative sums
+        """
+        numDays = self.daily.shape[1]
+
+        #node i of a Fenwick tree holds the days after i - lowbit(i) up to i
+        prefix = np.zeros((self.daily.shape[0], numDays + 1))
+        np.cumsum(self.daily, axis=1, out=prefix[:, 1:])
+        nodes = np.arange(numDays + 1)
+        self.tree = prefix - prefix[:, nodes - (nodes & -nodes)]
+
+        #monthly rollups
+        self.startMonth = self.start.astype("datetime64[M]")
+        months = (
+            (self.start + np.arange(numDays)).astype("datetime64[M]")
+            - self.startMonth
+        ).astype(np.int64)
+        self.monthly = np.zeros(
+            (self.daily.shape[0], months[-1] + 1 if numDays else 0)
+        )
+        if numDays:
+            firstDays = np.flatnonzero(np.diff(months, prepend=-1))
+            self.monthly = np.add.reduceat(self.daily, firstDays, axis=1)
@@ -0,0 +1,91 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Saves charts to PNG, SVG or PDF files without opening a window, e.g. to
+make monthly reports for many budgets overnight.
+Charts take the same attributes as Graphing.set_attributes and are drawn
+with the Agg backend at an exact size. Many charts can be drawn at once
+on a process pool
+"""
+
+#import needed modules
+import os
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+from graphFrame import Charts, chart_data, default_attributes, make_figure
+
+
+#file types charts can be saved as
+FORMATS:tuple[str, ...] = ("png", "svg", "pdf")
+
+
+def export_chart(path:str, chartType:Charts|str,
+                    independant:t.Iterable[t.Any] = (),
+                    dependant:t.Iterable[int|float] = (),
+                    *, width:int = 800, height:int = 600, dpi:float = 100,
+                    **attributes) -> str:
+    """
+    export_chart(path, chartType, independant, dependant, width, height,
+        dpi, **attributes) -> str
+    path: str: file to save. the type is taken from its extension
+    chartType: Charts|str: chart to draw, e.g. "LINE PLOT"
+    independant: iterable: list of all x values
+    dependant: iterable: list of all y values
+    width: int: width of the image in pixels
+    height: int: height of the image in pixels
+    dpi: float: dots per inch. larger values make the text larger
+    **attributes: any keyword arguments of Graphing.set_attributes
+
+    draws the chart without Tkinter and saves it
+    raises ValueError if the file type cannot be saved
+    returns the path the chart was saved to
+    """
+    fileType = os.path.splitext(path)[1].lstrip(".").lower()
+    if fileType not in FORMATS:
+        raise ValueError(
+            f"charts cannot be saved as '{fileType}'. choose any: {FORMATS}"
+        )
+
+    if not isinstance(chartType, Charts):
+        chartType = Charts(chartType.upper())
+
+    atts = default_attributes(**attributes)
+
+    #the data is prepared the same way a Graphing widget prepares it
+    xData, yData = chart_data(chartType, independant, dependant, atts, width)
+
+    figure = make_figure(chartType, xData, yData, atts, width, height, dpi)
+    figure.savefig(path, format=fileType, dpi=dpi)
+
+    return path
+
+
+def export_job(job:dict[str, t.Any]) -> str:
+    """
+    export_job(job) -> str
+    job: dict: keyword arguments of export_chart()
+
+    returns the path the chart was saved to
+    """
+    return export_chart(**job)
+
+
+def export_charts(jobs:t.Iterable[dict[str, t.Any]],
+                    workers:int|None = None) -> list[str]:
+    """
+    export_charts(jobs, workers) -> list[str]
+    jobs: iterable[dict]: keyword arguments of export_chart() for each
+        chart, e.g. {"path": "may.png", "chartType": "PIE CHART", ...}
+    workers: int|None: processes to draw the charts on. 1 draws them here
+
+    draws every chart, several at once on a process pool
+    returns the paths the charts were saved to, in the order of jobs
+    """
+    jobs = list(jobs)
+
+    if workers == 1 or len(jobs) <= 1:
+        return [export_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(export_job, jobs))
@@ -0,0 +1,188 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Converts colors between hex codes, RGB values and Tk color names.
+Every byte's hex digits are worked out once into lookup tables, named Tk
+colors are only asked of Tk the first time they are used, and whole
+palettes can be converted in one call
+"""
+
+#import needed modules
+import tkinter as tk
+import typing as t
+from functools import lru_cache
+import numpy as np
+
+
+#the two hex digits of every byte, e.g. HEX_BYTES[255] == "ff"
+HEX_BYTES:tuple[str, ...] = tuple(f"{value:02x}" for value in range(256))
+
+#every hex digit, in upper or lower case
+HEX_DIGITS:frozenset[str] = frozenset("0123456789abcdefABCDEF")
+
+#the byte of every pair of hex digits
+BYTE_VALUES:dict[str, int] = {
+    high + low: int(high + low, 16)
+    for high in HEX_DIGITS
+    for low in HEX_DIGITS
+}
+
+
+@lru_cache(maxsize=1024)
+def hex_to_rgb(hexCode:str) -> tuple[int, int, int]:
+    """
+    hex_to_rgb(hexCode) -> tuple[int, int, int]
+    hexCode: str: hex code to convert, e.g. "#1a2b3c". Tk's short "#abc"
+        and long "#aaabbbccc" forms are allowed too
+
+    returns the RGB value, each from 0 to 255
+    """
+    digits = hexCode.lstrip("#")
+    width = len(digits) // 3
+
+    if width == 0 or len(digits) % 3 or not HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"invalid hex code: '{hexCode}'")
+
+    #one digit per color is repeated: "#abc" is "#aabbcc"
+    if width == 1:
+        return tuple(BYTE_VALUES[digit * 2] for digit in digits)
+
+    #longer codes keep their top two digits per color
+    return tuple(
+        BYTE_VALUES[digits[start:start + 2]]
+        for start in range(0, 3 * width, width)
+    )
+
+
+def rgb_to_hex(rgb:t.Iterable[int]) -> str:
+    """
+    rgb_to_hex(rgb) -> str
+    rgb: iterable[int]: RGB value, each from 0 to 255. anything after the
+        third value is ignored
+
+    values below 0 or above 255 are clipped, like rgb_to_hex_array()
+    returns the hex code, e.g. "#1a2b3c"
+    """
+    red, green, blue = (
+        HEX_BYTES[min(max(int(value), 0), 255)] for value in tuple(rgb)[:3]
+    )
+
+    return "#" + red + green + blue
+
+
+@lru_cache(maxsize=256)
+def root_named_to_rgb(name:str, root:tk.Misc) -> tuple[int, int, int]:
+    """
+    root_named_to_rgb(name, root) -> tuple[int, int, int]
+    name: str: Tk color name, e.g. "white" or "SystemButtonFace"
+    root: tkinter.Misc: root window of the app
+
+    Tk is only asked the first time each name is used. the root is the same
+    for every widget, so the cache is keyed by name
+    returns the RGB value, each from 0 to 255
+    """
+    #Tk gives 16 bits per color
+    return tuple(value // 256 for value in root.winfo_rgb(name))
+
+
+def named_to_rgb(name:str, widget:tk.Misc) -> tuple[int, int, int]:
+    """
+    named_to_rgb(name, widget) -> tuple[int, int, int]
+    name: str: Tk color name, e.g. "white" or "SystemButtonFace"
+    widget: tkinter.Misc: any widget of the window
+
+    Tk is only asked the first time each name is used, from any widget
+    returns the RGB value, each from 0 to 255
+    """
+    #ask the root window so the widget is not kept alive by the cache
+    return root_named_to_rgb(name, widget._root())
+
+
+def to_rgb(color:str, widget:tk.Misc|None = None) -> tuple[int, int, int]:
+    """
+    to_rgb(color, widget) -> tuple[int, int, int]
+    color: str: hex code or Tk color name
+    widget: tkinter.Misc|None: any widget of the window. only needed for
+        color names
+
+    returns the RGB value, each from 0 to 255
+    """
+    if color.startswith("#"):
+        return hex_to_rgb(color)
+
+    if widget is None:
+        raise ValueError(f"a widget is needed to look up '{color}'")
+
+    return named_to_rgb(color, widget)
+
+
+def to_hex(color:str, widget:tk.Misc|None = None) -> str:
+    """
+    to_hex(color, widget) -> str
+    color: str: hex code or Tk color name
+    widget: tkinter.Misc|None: any widget of the window. only needed for
+        color names
+
+    returns the color as a 6 digit hex code
+    """
+    return rgb_to_hex(to_rgb(color, widget))
+
+
+def shade(rgb:t.Any, amount:int) -> t.Any:
+    """
+    shade(rgb, amount) -> tuple[int, int, int]|np.ndarray
+    rgb: tuple[int, int, int]|np.ndarray: one RGB value or an (N, 3) array
+    amount: int: amount to add to every value. negative to darken
+
+    keeps every value from 0 to 255
+    returns the shaded colors in the same form they were given
+    """
+    shaded = np.clip(np.asarray(rgb, dtype=np.int64) + amount, 0, 255)
+
+    if isinstance(rgb, np.ndarray):
+        return shaded.astype(rgb.dtype)
+
+    return tuple(int(value) for value in shaded)
+
+
+def hex_to_rgb_array(hexCodes:t.Iterable[str]) -> np.ndarray:
+    """
+    hex_to_rgb_array(hexCodes) -> np.ndarray[uint8]
+    hexCodes: iterable[str]: 6 digit hex codes, e.g. "#1a2b3c"
+
+    converts the whole palette at once
+    raises ValueError if any code is not "#" and 6 hex digits
+    returns np.ndarray[uint8]: the RGB values, shape (N, 3)
+    """
+    hexCodes = list(hexCodes)
+
+    #codes of other lengths would shift every color after them
+    if any(len(code) != 7 or code[0] != "#" for code in hexCodes):
+        raise ValueError("hex codes must be 6 digits, e.g. '#1a2b3c'")
+
+    try:
+        values = bytes.fromhex("".join(code[1:] for code in hexCodes))
+    except ValueError:
+        raise ValueError("hex codes must be 6 digits, e.g. '#1a2b3c'")
+
+    #fromhex() skips spaces, so make sure every digit was read
+    if len(values) != 3 * len(hexCodes):
+        raise ValueError("hex codes must be 6 digits, e.g. '#1a2b3c'")
+
+    return np.frombuffer(values, dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_to_hex_array(rgb:t.Any) -> np.ndarray:
+    """
+    rgb_to_hex_array(rgb) -> np.ndarray[str]
+    rgb: array: RGB values from 0 to 255, shape (N, 3)
+
+    converts the whole palette at once
+    returns np.ndarray[str]: the hex codes
+    """
+    rgb = np.clip(np.asarray(rgb), 0, 255).astype(np.uint8).reshape(-1, 3)
+
+    #6 hex digits for each color, cut apart without a loop
+    digits = np.frombuffer(rgb.tobytes().hex().encode("ascii"), dtype="S6")
+
+    return np.char.add("#", digits.astype(str))
@@ -0,0 +1,90 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Converts dates between the MM/DD/YYYY strings used by the budget calculator
+and numpy datetime64 arrays
+"""
+
+#import needed modules
+import numpy as np
+import typing as t
+
+
+def parse_dates(dates:t.Iterable[str]) -> np.ndarray:
+    '''
+    parse_dates(dates) -> np.ndarray[datetime64[D]]
+    dates: iterable[str]: dates in MM/DD/YYYY format. months and days do not
+        need leading zeros
+
+    converts every date at once instead of one at a time
+    raises ValueError if a date does not exist
+    returns np.ndarray[datetime64[D]]: the converted dates
+    '''
+    dates = np.asarray(dates)
+
+    #dates that were already converted do not need to be parsed again
+    if np.issubdtype(dates.dtype, np.datetime64):
+        return dates.astype("datetime64[D]")
+
+    #nothing to split
+    if len(dates) == 0:
+        return np.array([], dtype="datetime64[D]")
+
+    #pandas is slow to import; only import it once there are dates to parse
+    import pandas as pd
+
+    #split every MM/DD/YYYY string into its month, day and year at once
+    units = (
+        pd.Series(dates, dtype=str)
+        .str.split("/", expand=True)
+        .astype(int)
+        .to_numpy()
+        )
+    months, days, years = units[:, 0], units[:, 1], units[:, 2]
+
+    #count the months since 1970 to get the month of each date,
+    # then move forward to the day of the month
+    monthStart = ((years - 1970) * 12 + (months - 1)).astype("datetime64[M]")
+    newDates = (
+        monthStart.astype("datetime64[D]")
+        + (days - 1).astype("timedelta64[D]")
+        )
+
+    #a day past the end of its month spills into the next month
+    invalid = (
+        (months < 1) | (months > 12) | (days < 1)
+        | (newDates.astype("datetime64[M]") != monthStart)
+        )
+    if invalid.any():
+        raise ValueError(
+            f"invalid date: '{dates[invalid][0]}'. "
+            + "dates must be in MM/DD/YYYY format"
+            )
+
+    return newDates
+
+
+def format_dates(dates:np.ndarray) -> np.ndarray:
+    '''
+    format_dates(dates) -> np.ndarray[str]
+    dates: np.ndarray[datetime64]: dates to convert
+
+    converts every date at once to MM/DD/YYYY format
+    returns np.ndarray[str]: the formatted dates
+    '''
+    dates = np.asarray(dates, dtype="datetime64[D]")
+
+    #split the dates into their year, month and day
+    months = dates.astype("datetime64[M]")
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    days = (dates - months).astype(np.int64) + 1
+    months = months.astype(np.int64) % 12 + 1
+
+    #put the units back together with leading zeros
+    return np.char.add(
+        np.char.add(
+            np.char.add(np.char.zfill(months.astype(str), 2), "/"),
+            np.char.add(np.char.zfill(days.astype(str), 2), "/")
+            ),
+        np.char.zfill(years.astype(str), 4)
+        )
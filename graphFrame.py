@@ -9,21 +9,767 @@ import random
 import tkinter as tk
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import matplotlib.dates as mdates
+from matplotlib.lines import Line2D
+from matplotlib.collections import PathCollection
+from matplotlib.container import BarContainer
+from matplotlib.patches import Rectangle
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import sys
 import math
-import datetime
-from datetime import datetime as dt 
+import inspect
+import time
 import typing as t
 from enum import Enum
 
+import dateUtils
+import taskRunner
+
+#number of days in each unit of time used by the timespan attribute
+TIMESPAN_DAYS:dict[str, float] = {"W": 7, "M": 30.44, "Y": 365.25}
+
 #declare charts enum
 class Charts(Enum):
     BAR_CHART = "BAR CHART"
     LINE_PLOT = "LINE PLOT"
     SCATTER_PLOT = "SCATTER PLOT"
     PIE_CHART = "PIE CHART"
+    FAN_CHART = "FAN CHART"
+
+
+
+def downsample_min_max(
+        xData:np.ndarray, yData:np.ndarray, numBuckets:int
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    downsample_min_max(xData, yData, numBuckets) -> tuple[np.ndarray, np.ndarray]
+    xData: np.ndarray: x values -- numbers or datetime64
+    yData: np.ndarray[int|float]: y values
+    numBuckets: int: number of buckets, usually the plot width in pixels
+
+    splits the x axis into numBuckets even buckets and keeps only the lowest
+    and highest point in each bucket. The shape of the data stays the same
+    while no more than 2 * numBuckets points are drawn
+    returns the downsampled x and y values
+    """
+    numPoints = len(xData)
+
+    #nothing to gain if there are already fewer points than pixels
+    if numBuckets < 1 or numPoints <= 2 * numBuckets:
+        return xData, yData
+
+    #sort the points along the x axis if they are not already sorted
+    if np.any(xData[1:] < xData[:-1]):
+        order = np.argsort(xData, kind="stable")
+        xData, yData = xData[order], yData[order]
+
+    #dates are measured as a number of days so they can be split into buckets
+    if np.issubdtype(xData.dtype, np.datetime64):
+        xValues = xData.astype("datetime64[D]").astype(np.int64).astype(float)
+    else:
+        xValues = xData.astype(float)
+
+    #put each point in the bucket its x value falls in
+    xRange = xValues[-1] - xValues[0]
+    if xRange == 0:
+        return xData, yData
+    buckets = ((xValues - xValues[0]) / xRange * numBuckets).astype(np.int64)
+    buckets = np.minimum(buckets, numBuckets - 1)
+
+    #sort the points in each bucket by y value; the first point in each
+    #bucket is then the lowest and the last point is the highest
+    order = np.lexsort((yData, buckets))
+    _, starts = np.unique(buckets, return_index=True)
+    ends = np.append(starts[1:], numPoints) - 1
+
+    #keep the lowest and highest points in the order they were in
+    keep = np.unique(np.concatenate((order[starts], order[ends])))
+
+    return xData[keep], yData[keep]
+
+
+
+def clean_data(xData:t.Iterable, yData:t.Iterable,
+                makeHistogram:bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    clean_data(xData, yData, makeHistogram) -> tuple[np.ndarray, np.ndarray]
+    xData: iterable: x values
+    yData: iterable: y values
+    makeHistogram: bool: only the x values are used by a histogram
+
+    cleans the data by filtering out None types and null.
+    returns the cleaned x and y values. xData and yData are not changed
+    """
+    xData = np.asarray(xData)
+    yData = np.asarray(yData)
+
+    #if the plot is not supposed to be a histogram
+    #filter the x and y axis  
+    if not makeHistogram:
+
+        #make sure xData and yData are the same length
+        #set the max length of both sequences to be the smallest length
+        maxLength = min(len(xData), len(yData))
+
+        #slice both sequences to go up to the length of the smaller list
+        xData = xData[:maxLength]
+        yData = yData[:maxLength]
+
+        #drop all rows with no values
+        keep = ~(pd.isna(xData) | pd.isna(yData))
+        xData = xData[keep]
+        yData = yData[keep]
+
+        #numbers stored alongside None are objects; make them numbers again
+        if yData.dtype == object:
+            try:
+                yData = yData.astype(float)
+            except (TypeError, ValueError):
+                pass
+
+    #if it is supposed to be a histogram, look at only x values
+    else:
+        #drop all rows with no values
+        xData = xData[~pd.isna(xData)]
+
+    return xData, yData
+
+
+def timespan_delta(timespan:str) -> np.timedelta64|None:
+    """
+    timespan_delta(timespan) -> np.timedelta64|None
+    timespan: str: num_iterations.unit_of_time | all
+        (see Graphing.set_attributes)
+
+    returns the length of the timespan in days. None for all time
+    """
+    if timespan.lower() == "all":
+        return None
+
+    #get the desired timeframe
+    timeFrame = timespan.split(".")
+
+    #cast the M/W/Y noatation to uppercase
+    #reduces case sensitivity
+    timeFrame[1] = timeFrame[1].upper()
+
+    #number of units * days in the unit
+    return np.timedelta64(
+        int(int(timeFrame[0]) * TIMESPAN_DAYS[timeFrame[1]]),
+        "D"
+        )
+
+
+def filter_dates(dates:np.ndarray, values:np.ndarray,
+                    timespan:str = "all") -> tuple[np.ndarray, np.ndarray]:
+    """
+    filter_dates(dates, values, timespan) -> tuple[np.ndarray, np.ndarray]
+    dates: np.ndarray[datetime64]: x values
+    values: np.ndarray: y values
+    timespan: str: num_iterations.unit_of_time | all
+        (see Graphing.set_attributes)
+
+    sorts the dates and filters them to be in desired time frame
+    returns the sorted, filtered dates and values
+    """
+    #sort the dates and values alongside each other so the data does not
+    #get mixed up and any time frame is one unbroken slice of the data
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    if len(values) == len(order):
+        values = values[order]
+
+    #check to see if user wants all time; if not, filter by timespan
+    timeSubtract = timespan_delta(timespan)
+    if timeSubtract is not None and len(dates):
+        #have the earliest date be the length of the timespan before the
+        #most recent date
+        beginningDate = dates[-1] - timeSubtract
+
+        #binary search for the first date within the time frame
+        # and remove all dates before it
+        start = np.searchsorted(dates, beginningDate, side="left")
+        dates = dates[start:]
+        values = values[start:]
+
+    return dates, values
+
+
+def view_slice(dates:np.ndarray, values:np.ndarray,
+                start:np.datetime64|None,
+                end:np.datetime64|None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    view_slice(dates, values, start, end) -> tuple[np.ndarray, np.ndarray]
+    dates: np.ndarray[datetime64]: sorted x values
+    values: np.ndarray: y values
+    start: np.datetime64|None: first date in view. None for no limit
+    end: np.datetime64|None: last date in view. None for no limit
+
+    returns the dates and values in view, plus one point on each side so
+    lines run to the edge of the plot
+    """
+    #binary search for the edges of the view
+    first = 0 if start is None else np.searchsorted(dates, start, "left")
+    last = len(dates) if end is None else np.searchsorted(dates, end, "right")
+
+    first, last = max(first - 1, 0), min(last + 1, len(dates))
+
+    return dates[first:last], values[first:last]
+
+
+def num_to_date(value:float) -> np.datetime64:
+    """
+    num_to_date(value) -> np.datetime64
+    value: float: matplotlib date number, e.g. from the axis limits
+
+    returns the date to the second
+    """
+    return np.datetime64(mdates.num2date(value).replace(tzinfo=None), "s")
+
+
+def zoom_view(start:np.datetime64, end:np.datetime64,
+                center:np.datetime64,
+                factor:float) -> tuple[np.datetime64, np.datetime64]:
+    """
+    zoom_view(start, end, center, factor) -> tuple[datetime64, datetime64]
+    start: np.datetime64: first date in view
+    end: np.datetime64: last date in view
+    center: np.datetime64: date that stays in place, e.g. under the mouse
+    factor: float: how much longer the new view is. below 1 zooms in
+
+    returns the start and end of the new view. the view is never shorter
+    than a day
+    """
+    start, end, center = (np.datetime64(date, "s")
+                            for date in (start, end, center))
+
+    newStart = center - (center - start) * factor
+    newEnd = center + (end - center) * factor
+
+    #zooming in past a day only shows a single bar/point
+    if newEnd - newStart < np.timedelta64(1, "D"):
+        return start, end
+
+    return newStart, newEnd
+
+
+def plot_data(xData:t.Iterable, yData:t.Iterable,
+                atts:dict) -> tuple[np.ndarray, np.ndarray]:
+    """
+    plot_data(xData, yData, atts) -> tuple[np.ndarray, np.ndarray]
+    xData: iterable: x values
+    yData: iterable: y values
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    returns the cleaned x and y values in the format they are plotted in:
+    text, dates within the timespan, or numbers
+    """
+    xData, yData = clean_data(xData, yData, atts["makeHistogram"])
+
+    #text is plotted as categories, not numbers
+    if atts["treatAsText"]:
+        return xData.astype(str), yData
+
+    #dates are converted and kept within the timespan
+    if atts["xAreDates"]:
+        return filter_dates(
+            dateUtils.parse_dates(xData),
+            yData,
+            atts["timespan"]
+            )
+
+    return xData, yData
+
+
+def fan_data(xData:t.Iterable, yData:t.Iterable,
+                atts:dict) -> tuple[np.ndarray, np.ndarray]:
+    """
+    fan_data(xData, yData, atts) -> tuple[np.ndarray, np.ndarray]
+    xData: iterable: x values
+    yData: iterable: y values of the middle line
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    returns the x values and a 2D array of the middle line followed by
+    the low and high edge of each band in atts["bands"], cleaned, sorted
+    and filtered to the timespan like the line chart
+    """
+    xData = np.asarray(xData)
+    rows = [np.asarray(yData, dtype=float)]
+    for low, high in atts["bands"]:
+        rows.append(np.asarray(low, dtype=float))
+        rows.append(np.asarray(high, dtype=float))
+
+    #cut every row to the shortest one
+    maxLength = min(len(xData), *(len(row) for row in rows))
+    xData = xData[:maxLength]
+    yData = np.stack([row[:maxLength] for row in rows])
+
+    #drop all points with no values
+    keep = ~(pd.isna(xData) | np.isnan(yData).any(axis=0))
+    xData, yData = xData[keep], yData[:, keep]
+
+    #sort by x, keeping the dates within the timespan
+    if atts["xAreDates"]:
+        xData, positions = filter_dates(
+            dateUtils.parse_dates(xData),
+            np.arange(len(xData)),
+            atts["timespan"]
+            )
+    else:
+        positions = np.argsort(xData, kind="stable")
+        xData = xData[positions]
+
+    return xData, yData[:, positions]
+
+
+def level_of_detail(xData:np.ndarray, yData:np.ndarray, atts:dict,
+                        width:int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    level_of_detail(xData, yData, atts, width) -> tuple
+    xData: np.ndarray: x values being plotted
+    yData: np.ndarray: y values being plotted
+    atts: dict: chart attributes (see Graphing.set_attributes)
+    width: int: width of the plot in pixels
+
+    reduces the points to what can be seen at the plot's width in pixels
+    so large data sets draw as fast as small ones.
+    returns the points to draw
+    """
+    #text cannot be split into buckets; draw everything if the
+    #developer asked for it
+    if (not atts.get("downsample", True)
+            or atts["treatAsText"]
+            or not np.issubdtype(yData.dtype, np.number)):
+        return xData, yData
+
+    return downsample_min_max(xData, yData, width)
+
+
+def chart_data(chartType:Charts, xData:t.Iterable, yData:t.Iterable,
+                atts:dict, width:int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    chart_data(chartType, xData, yData, atts, width) -> tuple
+    chartType: Charts: chart being drawn
+    xData: iterable: x values as given to Graphing.set_attributes
+    yData: iterable: y values as given to Graphing.set_attributes
+    atts: dict: chart attributes (see Graphing.set_attributes)
+    width: int: width of the plot in pixels
+
+    returns the cleaned data the chart draws. Does the same work as a
+    Graphing widget without Tkinter
+    """
+    if chartType in (Charts.LINE_PLOT, Charts.SCATTER_PLOT):
+        return level_of_detail(*plot_data(xData, yData, atts), atts, width)
+
+    if chartType == Charts.FAN_CHART:
+        return fan_data(xData, yData, atts)
+
+    return clean_data(xData, yData, atts["makeHistogram"])
+
+
+def label_chart(ax, atts:dict) -> None:
+    """
+    label_chart(ax, atts) -> None
+    ax: matplotlib.axes.Axes: axis of the chart
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    sets the title and axis labels of the chart
+    """
+    ax.title.set_text(atts["title"])
+    ax.set_xlabel(atts["xName"])
+    ax.set_ylabel(atts["yName"])
+
+
+def draw_scatterplot(ax, xData:np.ndarray, yData:np.ndarray,
+                        atts:dict) -> PathCollection:
+    """
+    draw_scatterplot(ax, xData, yData, atts) -> PathCollection
+    ax: matplotlib.axes.Axes: axis to draw on
+    xData: np.ndarray: x values
+    yData: np.ndarray: y values
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    returns the points drawn
+    """
+    return ax.scatter(
+        xData,
+        yData,
+        s=atts["pointSize"],
+        color=atts["pointColor"]
+        )
+
+
+def draw_line_chart(ax, xData:np.ndarray, yData:np.ndarray,
+                        atts:dict) -> Line2D:
+    """
+    draw_line_chart(ax, xData, yData, atts) -> Line2D
+    ax: matplotlib.axes.Axes: axis to draw on
+    xData: np.ndarray: x values
+    yData: np.ndarray: y values
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    returns the line drawn
+    """
+    line, = ax.plot(
+        xData,
+        yData,
+        color=atts["lineColor"]
+        )
+
+    return line
+
+
+def bar_width(xData:np.ndarray) -> float:
+    """
+    bar_width(xData) -> float
+    xData: np.ndarray: x values of the bars
+
+    bars of dates are as wide as the gap between them, e.g. a month,
+    instead of one day
+    returns the width of every bar
+    """
+    if (np.issubdtype(np.asarray(xData).dtype, np.datetime64)
+            and len(xData) > 1):
+        gaps = np.diff(xData).astype("timedelta64[D]").astype(float)
+        return 0.8 * float(np.median(gaps))
+
+    return 0.8
+
+
+def draw_bar_chart(ax, xData:np.ndarray, yData:np.ndarray,
+                    atts:dict) -> BarContainer|None:
+    """
+    draw_bar_chart(ax, xData, yData, atts) -> BarContainer|None
+    ax: matplotlib.axes.Axes: axis to draw on
+    xData: np.ndarray: x values
+    yData: np.ndarray: y values
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    draws a bar graph, or a histogram of xData if atts["makeHistogram"]
+    returns the bars of a bar graph. None for a histogram
+    """
+    #if the user wants a histogram: make the histogram
+    if atts["makeHistogram"]:
+
+        # create the histogram
+        n, bins, patches = ax.hist(
+                xData,
+                linewidth=atts["lineWidth"],
+                edgecolor=atts["lineColor"],
+                bins = atts["numBins"]
+                )
+
+        #make the colors
+
+        #if the user included a list of colors,
+        #iterate through each color and assign to bar graph
+
+        #create own flag variables 
+        # or else if statement will get long and confusing
+        isSeq = isinstance(atts["fillColor"], t.Iterable)
+        isNotStr = not isinstance(atts["fillColor"], str)
+        isListOfStrs = all(map(
+            lambda value: isinstance(value, str) == True,
+            atts["fillColor"]
+            ))
+
+        #now check the conditions
+        if (isSeq and isNotStr and isListOfStrs):
+            # if user inputted less colors than there are
+            # bins, iterate through user inputted colors
+            # and add it to a new list of colors until they are the 
+            #same length
+            if len(atts["fillColor"]) < len(patches):
+
+                #index of __graphAtts to reference
+                index = 0
+
+                # add the user inputted colors to colors
+                colors = list(atts["fillColor"])
+
+                #add new color if there are less colors than bars
+                while len(colors) < len(patches):
+                    #add a new color
+                    colors.append(atts["fillColor"][index])
+
+                    #if index is at the last index of the list of
+                    #user inputted colors, reset index to 0
+                    if index == len(atts["fillColor"]) - 1:
+                        index = 0
+                    #else, add 1 to index
+                    else:
+                        index += 1
+
+            #else if there are more colors than bars, cut off the 
+            #excess colors and assign to a new list
+            elif len(atts["fillColor"]) > len(patches):
+                colors = list(atts["fillColor"])[:len(patches)]
+
+            #else assign the fill color to a new list
+            else:
+                colors = list(atts["fillColor"])
+
+            #loop through the each bar and each color in colors
+
+            for color, bar in zip(colors, patches):
+                bar.set_facecolor(color)
+
+        #else, set the facecolor to one color
+        else:
+            for bar in patches:
+                bar.set_facecolor(atts["fillColor"])
+
+
+    #else user does not want a histogram; they want a normal bar graph
+    else:
+        # draw the bar graph
+        return ax.bar(
+            xData,
+            yData,
+            width=bar_width(xData),
+            color=atts["fillColor"],
+            linewidth=atts["lineWidth"],
+            edgecolor=atts["lineColor"]
+            )
+
+
+def move_bars(ax, bars:list[Rectangle], xData:np.ndarray,
+                yData:np.ndarray, atts:dict) -> list[Rectangle]:
+    """
+    move_bars(ax, bars, xData, yData, atts) -> list[Rectangle]
+    ax: matplotlib.axes.Axes: axis the bars are on
+    bars: list[Rectangle]: bars already drawn by draw_bar_chart()
+    xData: np.ndarray: new x values
+    yData: np.ndarray: new y values
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    moves the bars already on the axis to the new data instead of drawing
+    the chart again. Only the bars that are missing are made and only
+    the extra ones are removed
+    returns the bars now on the axis, in order
+    """
+    width = bar_width(xData)
+    lefts = np.asarray(ax.convert_xunits(xData), dtype=np.float64) - width / 2
+
+    #a list of colors is used in turn, the same way ax.bar() does
+    colors = atts["fillColor"]
+    if isinstance(colors, str) or not isinstance(colors, t.Iterable):
+        colors = [colors]
+    else:
+        colors = list(colors)
+    heights = np.asarray(yData, dtype=np.float64)
+
+    #move the bars that are already drawn
+    for bar, left, height in zip(bars, lefts, heights):
+        bar.set_x(left)
+        bar.set_width(width)
+        bar.set_height(height)
+
+    #remove the bars that are no longer needed
+    for bar in bars[len(lefts):]:
+        bar.remove()
+    bars = bars[:len(lefts)]
+
+    #add the bars that are missing
+    for left, height in zip(lefts[len(bars):], heights[len(bars):]):
+        bars.append(ax.add_patch(Rectangle(
+            (left, 0),
+            width,
+            height,
+            facecolor=colors[len(bars) % len(colors)],
+            linewidth=atts["lineWidth"],
+            edgecolor=atts["lineColor"]
+            )))
+
+    return bars
+
+
+def draw_pie_chart(ax, xData:np.ndarray, yData:np.ndarray,
+                    atts:dict) -> None:
+    """
+    draw_pie_chart(ax, xData, yData, atts) -> None
+    ax: matplotlib.axes.Axes: axis to draw on
+    xData: np.ndarray: slice labels
+    yData: np.ndarray: slice sizes
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    draws a pie chart, or says there is no data if nothing is above 0
+    """
+    #a pie chart cannot be drawn with nothing in it
+    if not len(yData) or np.sum(yData) <= 0:
+        ax.text(
+            0.5,
+            0.5,
+            "No data",
+            ha="center",
+            va="center",
+            fontsize=16.0,
+            transform=ax.transAxes
+        )
+        ax.set_axis_off()
+        return
+
+    #if the user inputted a list, color the pie chart based on
+    # developer input, make the colors used in the part chart based off 
+    # of what was passed by the developer
+    if (isinstance(atts["fillColor"], t.Iterable)
+        and not isinstance(atts["fillColor"], str)):
+
+        # initialize variable to create a copy of dev inputted colors
+        colors = list(atts["fillColor"])
+
+        #if there are less colors than pie slices: add random colors 
+        #until there are the same amount of colors and pie slices
+        if len(colors) < len(xData):
+            #while length of colors < num pie slices: add new color
+            while len(colors) < len(xData):
+                #generate a random color
+                newColor = ("#" + "".join(
+                    random.choice("ABCDEF1234567890") 
+                    for i in range(6)
+                    ))
+
+                #add random color to the list of colors
+                colors.append(newColor)
+
+        #else if there are more colors than number of slices: reduce
+        #list of colors length
+        elif len(colors) > len(xData):
+            # cut off the excess colors from the list of colors
+            colors = colors[:len(xData)]
+
+        #draw the pie chart
+        patches, text, autotexts = ax.pie(
+            yData,
+            labels=xData,
+            colors=colors,
+            autopct="%1.1f%%"
+        )
+
+    #else; dev did not input custom color list:
+    else:
+        # draw the pie chart without user inputted data
+        patches, text, autotexts = ax.pie(
+            yData,
+            labels=xData,
+            autopct="%1.1f%%"
+        )
+
+    #set font to readable size
+    for label, pctLabels in zip(text, autotexts):
+            label.set_fontsize(16.0)
+            pctLabels.set_fontsize(14.0)
+
+
+def draw_fan_chart(ax, xData:np.ndarray, yData:np.ndarray,
+                    atts:dict) -> Line2D:
+    """
+    draw_fan_chart(ax, xData, yData, atts) -> Line2D
+    ax: matplotlib.axes.Axes: axis to draw on
+    xData: np.ndarray: x values
+    yData: np.ndarray: 2D array. the first row is the middle line, then
+        the low and high edge of each band, widest band first
+    atts: dict: chart attributes (see Graphing.set_attributes)
+
+    draws each band as one filled region instead of every path inside it.
+    inner bands are drawn darker
+    returns the middle line
+    """
+    numBands = (len(yData) - 1) // 2
+
+    for band in range(numBands):
+        ax.fill_between(
+            xData,
+            yData[1 + 2 * band],
+            yData[2 + 2 * band],
+            color=atts["bandColor"],
+            alpha=0.15 + 0.25 * (band + 1) / numBands,
+            linewidth=0
+            )
+
+    return draw_line_chart(ax, xData, yData[0], atts)
+
+
+def make_figure(chartType:Charts, xData:np.ndarray, yData:np.ndarray,
+                    atts:dict, width:int, height:int,
+                    dpi:float = 100) -> Figure:
+    """
+    make_figure(chartType, xData, yData, atts, width, height, dpi) -> Figure
+    chartType: Charts: chart to draw
+    xData: np.ndarray: x values, already cleaned
+    yData: np.ndarray: y values, already cleaned
+    atts: dict: chart attributes (see Graphing.set_attributes)
+    width: int: width of the figure in pixels
+    height: int: height of the figure in pixels
+    dpi: float: dots per inch. larger values make the text larger
+
+    draws the chart on its own figure with the Agg backend, without
+    Tkinter. Safe to call from a worker thread or process
+    returns the figure; it is drawn or saved by the caller
+    """
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+
+    #attach an Agg canvas so the figure is drawn without Tkinter
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+
+    match chartType:
+        case Charts.BAR_CHART:
+            draw_bar_chart(ax, xData, yData, atts)
+        case Charts.LINE_PLOT:
+            draw_line_chart(ax, xData, yData, atts)
+        case Charts.SCATTER_PLOT:
+            draw_scatterplot(ax, xData, yData, atts)
+        case Charts.PIE_CHART:
+            draw_pie_chart(ax, xData, yData, atts)
+        case Charts.FAN_CHART:
+            draw_fan_chart(ax, xData, yData, atts)
+
+    #reduce clutter of x axis
+    if chartType != Charts.PIE_CHART:
+        fig.autofmt_xdate()
+
+    label_chart(ax, atts)
+
+    return fig
+
+
+def render_chart(chartType:Charts, xData:np.ndarray, yData:np.ndarray,
+                    atts:dict, width:int, height:int,
+                    dpi:float = 100) -> np.ndarray:
+    """
+    render_chart(chartType, xData, yData, atts, width, height, dpi)
+    same arguments as make_figure()
+
+    draws the chart without Tkinter. Safe to call from a worker thread
+    returns np.ndarray[uint8]: the image as (height, width, 4) RGBA values
+    """
+    canvas = make_figure(
+        chartType, xData, yData, atts, width, height, dpi
+        ).canvas
+    canvas.draw()
+
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def render_ppm(chartType:Charts, xData:np.ndarray, yData:np.ndarray,
+                atts:dict, width:int, height:int, dpi:float = 100) -> bytes:
+    """
+    render_ppm(chartType, xData, yData, atts, width, height, dpi) -> bytes
+    same arguments as render_chart()
+
+    returns the chart as a binary PPM image, which tkinter.PhotoImage can
+    read without any image libraries
+    """
+    rgba = render_chart(chartType, xData, yData, atts, width, height, dpi)
+
+    #PPM images have no transparency
+    height, width = rgba.shape[:2]
+    header = f"P6 {width} {height} 255\n".encode("ascii")
+
+    return header + np.ascontiguousarray(rgba[:, :, :3]).tobytes()
 
 
 
@@ -31,16 +777,19 @@ class Charts(Enum):
 class Graphing(tk.Frame):
     '''
     Make a Frame to display different graphs
-    During the initial instantiation, there will be a warning that a chart is
-    not created. This is because a chart has not been selected yet. 
+    The figure, axis and canvas are made once and reused for every chart.
+    Resizing the window only resizes the figure and redraws it
     '''
 
     #give the list of charts (referenced later in code)
     __CHARTS = tuple(item.value for item in Charts)
     
-    def __init__(self, master:tk.Frame|tk.Tk, **kwargs):
+    def __init__(self, master:tk.Frame|tk.Tk, backgroundRender:bool = False,
+                    **kwargs):
         '''GraphFrame(args, kwargs):\n
             master: Tkinter.Frame() or Tkinter.Tk()\n
+            backgroundRender: bool: draw charts on a worker thread and show
+            the finished image, so typing is not blocked by big charts\n
             **kwargs: tkinter.Canvas parameters -- NOT 'bg'
         '''
 
@@ -56,17 +805,66 @@ class Graphing(tk.Frame):
         self.yData:np.ndarray[int|float] = []
         self.__graphAtts:dict = {}
 
+        #cleaned/converted copies of xData and yData, reused until the data
+        #changes. every change to the data bumps the version
+        self.__dataVersion:int = 0
+        self.__dataCache:dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+
          #initialize the type
         self.type:Charts = Charts
 
+        #sums kept by day, week, month, quarter and year. when set, line and
+        #bar charts draw the level that fits the dates in view instead of
+        #xData and yData
+        self.pyramid = None
+        self.cumulative:bool = False
+
+        #last date of the pyramid that is ever drawn, e.g. today to leave
+        #out scheduled transactions. None draws every date
+        self.lastDate:np.datetime64|None = None
+
+        #dates in view. None shows everything/the timespan
+        self.viewStart:np.datetime64|None = None
+        self.viewEnd:np.datetime64|None = None
+
+        #each turn of the mouse wheel makes the view this many times
+        #shorter/longer. the view is dragged with the left mouse button
+        self.zoomFactor:float = 1.25
+        self.__dragStart:tuple|None = None
+
+        #the figure, axis and canvas are made the first time a chart is drawn
+        #and reused after that
+        self.fig:Figure|None = None
+        self.ax = None
+        self.graph:FigureCanvasTkAgg|None = None
+
+        #the line/points currently on the axis and what they were drawn for.
+        #lets new data be moved onto the existing artist
+        self.__plotted:Line2D|PathCollection|list[Rectangle]|None = None
+        self.__plottedKey:tuple|None = None
+
+        #redraws are collected and drawn at most once every redrawInterval ms
+        self.redrawInterval:int = 16
+        self.__redrawJob:str|None = None
+        self.__dataDirty:bool = False
+        self.__sizeDirty:bool = False
+        self.__lastRender:float = 0.0
+
+        #a paused chart keeps track of changes but does not draw them,
+        #e.g. while its tab is hidden
+        self.paused:bool = False
+
+        #when drawing on a worker thread, the finished image is shown in a
+        #label. only the newest image is shown; older ones are thrown out
+        self.backgroundRender:bool = backgroundRender
+        self.__renderer:taskRunner.TaskRunner|None = None
+        self.__renderTask:taskRunner.Task|None = None
+        self.__renderGeneration:int = 0
+        self.__image:tk.PhotoImage|None = None
+        self.__imageLabel:tk.Label|None = None
+
         #allow graphs to change size with window size
-        self.bind(
-            "<Configure>", 
-            lambda e: self.__create_graph(newDates=False), 
-            "+"
-            )
-        
-        print("Ignore the following error: ", end="")
+        self.bind("<Configure>", self.__on_resize, "+")
         
     def get_graph_atts(self) -> dict:
         return self.__graphAtts
@@ -79,6 +877,7 @@ class Graphing(tk.Frame):
             - "LINE PLOT"\n
             - "SCATTER PLOT"\n
             - "PIE CHART"\n
+            - "FAN CHART"\n
             input is not case sensitive\n
 
         creates a chart
@@ -90,7 +889,7 @@ class Graphing(tk.Frame):
             self.type = Charts(graphType.upper())
 
              #draw the graph
-            self.__create_graph()
+            self.request_redraw()
 
         #else, warn the programmer that an invalid option was selected
         else:
@@ -128,32 +927,47 @@ class Graphing(tk.Frame):
         fillColor: str|iterable[str]: color(s) to fill bar chart\n
         lineWidth: int: size of line for line chart\n
         lineColor: str: color of chart line\n
+        downsample: bool: only draw the lowest and highest point for each
+        pixel of the plot's width. False draws every point\n
+        bands: iterable[tuple[iterable, iterable]]: (low, high) values of
+        each band for the fan chart, widest band first\n
+        bandColor: str: color of the fan chart's bands\n
 
         Used with all charts: xName, yName, title\n
 
         Unique to scatterplot: xAreDates, treatAsText, timespan, pointSize,
-        pointColor\n
+        pointColor, downsample\n
 
         Unique to line graph: xAreDates, treatAsText, timespan, pointSize,
-        pointColor, lineWidth, lineColor\n
+        pointColor, lineWidth, lineColor, downsample\n
 
         unique to bar chart: makeHistorgram, fillColor, numBins\n
 
+        unique to fan chart: xAreDates, timespan, lineColor, bands,
+        bandColor\n
+
         sets up the attributes for the chart and draws the graph
         """
 
         #update the data
         self.__graphAtts.update(kwargs)
 
-        #if there is new x data, then update x data
-        if independant:
+        #if there is new x data, then update x data.
+        #the new data is drawn instead of any pyramid
+        if independant is not None:
             self.xData = np.array(independant)
+            self.pyramid = None
         
         #if there is new y data, update the y data
-        if dependant:
+        if dependant is not None:
             self.yData = np.array(dependant)
 
-        self.__create_graph(newDates=False)
+        #throw out the cleaned data from before
+        if (independant is not None or dependant is not None
+                or "bands" in kwargs):
+            self.__bump_data_version()
+
+        self.request_redraw()
     
     def set_attributes(
             self, independant:t.Iterable[t.Any] = (), 
@@ -162,7 +976,9 @@ class Graphing(tk.Frame):
             xAreDates:bool = False, treatAsText:bool = False, timespan:str = 'all',
             pointSize:int = 10, pointColor:str = 'black', makeHistogram:bool = False,
             numBins:int = 10, fillColor:str|t.Iterable[str] = "black",
-            lineWidth:int = 5, lineColor:str = "black",
+            lineWidth:int = 5, lineColor:str = "black", downsample:bool = True,
+            bands:t.Iterable[tuple[t.Iterable, t.Iterable]] = (),
+            bandColor:str = "tab:blue",
             ) -> None:
         
         """
@@ -189,103 +1005,539 @@ class Graphing(tk.Frame):
             - must be interable[str] for custom colors for pie chart \n
         lineWidth: int: size of line for line chart\n
         lineColor: str: color of chart line\n
+        downsample: bool: only draw the lowest and highest point for each
+        pixel of the plot's width. False draws every point\n
+        bands: iterable[tuple[iterable, iterable]]: (low, high) values of
+        each band for the fan chart, widest band first\n
+        bandColor: str: color of the fan chart's bands\n
 
         Used with all charts: xName, yName, title\n
 
         Unique to scatterplot: xAreDates, treatAsText, timespan, pointSize,
-        pointColor\n
+        pointColor, downsample\n
 
         Unique to line graph: xAreDates, treatAsText, timespan, pointSize,
-        pointColor, lineWidth, lineColor\n
+        pointColor, lineWidth, lineColor, downsample\n
 
         unique to bar chart: makeHistorgram, fillColor, numBins\n
 
+        unique to fan chart: xAreDates, timespan, lineColor, bands,
+        bandColor\n
+
         sets up the attributes for the chart and draws the graph
         """
         # set self.xValues passed independant values
         # and self.yValues to  and dependant values
         self.xData, self.yData = np.array(independant), np.array(dependant)
 
+        #the new data is drawn instead of any pyramid
+        self.pyramid = None
+
         #update self.__graphAtts to be all attributes except the first two items
         self.__graphAtts = dict(locals())
         del self.__graphAtts["independant"]
         del self.__graphAtts["dependant"]
 
+        #throw out the cleaned data from before
+        self.__bump_data_version()
+
         #draw the graph
-        self.__create_graph()
+        self.request_redraw()
 
+    def set_pyramid(self, pyramid, cumulative:bool = False,
+                        lastDate:t.Any = None, **kwargs) -> None:
+        """
+        Graphing.set_pyramid(self, pyramid, cumulative, lastDate, **kwargs)
+            -> None
+        pyramid: timePyramid.TimePyramid: sums of the data by day, week,
+            month, quarter and year
+        cumulative: bool: draw the running balance instead of each sum
+        lastDate: str|np.datetime64|None: last date drawn. None draws
+            every date
+        **kwargs: any keyword arguments of set_attributes
+
+        draws the line or bar chart from the pyramid. Only the level that
+        fits the dates in view is read, so zooming never goes back to every
+        transaction
+        """
+        self.set_attributes(xAreDates=True, **kwargs)
 
+        self.pyramid = pyramid
+        self.cumulative = cumulative
+        self.lastDate = (
+            None if lastDate is None else dateUtils.parse_dates([lastDate])[0]
+        )
+
+    def set_view(self, start:t.Any = None, end:t.Any = None) -> None:
+        """
+        Graphing.set_view(self, start, end) -> None
+        start: str|np.datetime64|None: first date to show. None for no limit
+        end: str|np.datetime64|None: last date to show. None for no limit
+
+        shows only the dates between start and end of a line, scatter or
+        pyramid chart of dates
+        """
+        self.viewStart = (
+            None if start is None else dateUtils.parse_dates([start])[0]
+        )
+        self.viewEnd = None if end is None else dateUtils.parse_dates([end])[0]
+
+        self.request_redraw()
+
+    def __bump_data_version(self) -> None:
+        """
+        Graphing.__bump_data_version(self) -> None
+        marks xData and yData as changed so the cleaned copies of the old
+        data are not used again
+        """
+        self.__dataVersion += 1
+        self.__dataCache = {}
+
+    def request_redraw(self) -> None:
+        """
+        Graphing.request_redraw(self) -> None
+        marks the chart as out of date. Every request made before the chart
+        is drawn is drawn together, at most once every redrawInterval ms
+        """
+        self.__dataDirty = True
+
+        self.__schedule_redraw()
+
+    def pause(self) -> None:
+        """
+        Graphing.pause(self) -> None
+        stops drawing the chart. Changes made while paused are drawn when
+        the chart is resumed
+        """
+        self.paused = True
+
+        #the waiting redraw is done by resume() instead
+        if self.__redrawJob is not None:
+            self.after_cancel(self.__redrawJob)
+            self.__redrawJob = None
+
+        #a render that has not started yet is not needed; render again
+        #when the chart is resumed
+        if self.__renderTask is not None:
+            self.__renderTask.cancel()
+            self.__renderTask = None
+            self.__dataDirty = True
+
+    def resume(self) -> None:
+        """
+        Graphing.resume(self) -> None
+        starts drawing the chart again and draws anything that changed
+        while it was paused
+        """
+        self.paused = False
+
+        if self.__dataDirty or self.__sizeDirty:
+            self.__schedule_redraw()
+
+    def flush_redraw(self) -> None:
+        """
+        Graphing.flush_redraw(self) -> None
+        draws any waiting changes right now instead of waiting for the
+        scheduled redraw
+        """
+        #cancel the scheduled redraw; it is being done now
+        if self.__redrawJob is not None:
+            self.after_cancel(self.__redrawJob)
+            self.__redrawJob = None
+
+        self.__lastRender = time.perf_counter()
+
+        #draw the whole chart on a worker thread instead
+        if self.backgroundRender:
+            if self.__dataDirty or self.__sizeDirty:
+                self.__dataDirty = self.__sizeDirty = False
+                self.__start_background_render()
+            return
+
+        #resize the figure first so a new chart is drawn at the right size
+        if self.__sizeDirty and self.graph is not None:
+            self.__resize_figure()
+
+        #redraw the chart if the data or chart changed
+        if self.__dataDirty:
+            self.__dataDirty = self.__sizeDirty = False
+            self.__create_graph()
+
+        #else, only the size changed; draw the same chart at its new size
+        elif self.__sizeDirty:
+            self.__sizeDirty = False
+            if self.graph is not None:
+                self.graph.draw()
+
+    def __schedule_redraw(self) -> None:
+        """
+        Graphing.__schedule_redraw(self) -> None
+        schedules one redraw if one is not already waiting
+        """
+        #a redraw is already waiting; it will draw these changes too.
+        #a paused chart draws its changes when it is resumed
+        if self.__redrawJob is not None or self.paused:
+            return
+
+        #wait until a full interval has passed since the last redraw
+        waitTime = int(
+            self.redrawInterval
+            - (time.perf_counter() - self.__lastRender) * 1000
+            )
+
+        if waitTime > 0:
+            self.__redrawJob = self.after(waitTime, self.flush_redraw)
+        else:
+            self.__redrawJob = self.after_idle(self.flush_redraw)
 
-    def __create_graph(self, newDates = True) -> None:
-        '''GraphFrame.create_graph(graphType)\n
-        independant: seq: x-axis values\n
-        dependant: seq: numeric: y-axis values\n
-        newDates: bool: new dates entered (default True)
-        '''
 
-        #make sure we don't end up with multiple charts in one frame
-        for widget in self.winfo_children(): 
-            widget.destroy()
+
+    def __create_graph(self) -> None:
+        '''GraphFrame.create_graph()\n
+        draws the chart that is currently selected
+        '''
 
         # draw the graph that corresponds to the current chart selected
         match self.type:
             case Charts.BAR_CHART:
                 self.__make_bar_graph()
             case Charts.LINE_PLOT:
-                self.__make_line_chart(formatDates=newDates)
+                self.__make_line_chart()
             case Charts.SCATTER_PLOT:
-                self.__make_scatterplot(formatDates=newDates)
+                self.__make_scatterplot()
             case Charts.PIE_CHART:
-                self.__make_pie_chart
+                self.__make_pie_chart()
+            case Charts.FAN_CHART:
+                self.__make_fan_chart()
             #if no valid option is used, warn the programmer
             case _:
-                print(f"ERROR: invalid bar type: {self.type}. Chart not created") 
-           
-    def __reset_plot(self) -> None:
+                print(f"ERROR: invalid bar type: {self.type}. Chart not created")
+
+    def __on_resize(self, e:tk.Event = None) -> None:
         """
-        Graph.__reset_plot(self, plotWidth, plotHeight, dpiRef) -> None
-        Resets the fig and axis
+        Graphing.__on_resize(self, e) -> None
+        e: tkinter.Event
+        resizes the existing figure to fit the frame with the next redraw.
+        the chart itself is not rebuilt
         """
-        #update window to get most accurate window size
-        self.update_idletasks()
-        self.master.update_idletasks()
+        #nothing to resize if no chart has been drawn yet
+        if self.graph is None and self.__imageLabel is None:
+            return
+
+        #resize and draw the figure with the next redraw
+        self.__sizeDirty = True
+        self.__schedule_redraw()
+
+    def __can_navigate(self) -> bool:
+        """
+        Graphing.__can_navigate(self) -> bool
+        returns True if the chart has dates on its x axis that can be zoomed
+        and panned
+        """
+        if self.__graphAtts == {} or self.__graphAtts["treatAsText"]:
+            return False
+
+        #bar charts are only zoomed through a pyramid; histograms and bars
+        #of raw rows do not have a date axis to zoom
+        if self.pyramid is not None:
+            return self.type in (
+                Charts.LINE_PLOT, Charts.SCATTER_PLOT, Charts.BAR_CHART
+                )
+
+        return (self.__graphAtts["xAreDates"]
+                and self.type in (Charts.LINE_PLOT, Charts.SCATTER_PLOT))
+
+    def __shown_dates(self) -> tuple[np.datetime64, np.datetime64]:
+        """
+        Graphing.__shown_dates(self) -> tuple[np.datetime64, np.datetime64]
+        returns the first and last date on the x axis
+        """
+        left, right = self.ax.get_xlim()
+
+        return num_to_date(left), num_to_date(right)
+
+    def __move_view(self, start:np.datetime64, end:np.datetime64) -> None:
+        """
+        Graphing.__move_view(self, start, end) -> None
+        start: np.datetime64: first date to show
+        end: np.datetime64: last date to show
+
+        shows the dates between start and end with the next redraw. Only
+        the data in view is read, and the line/points are moved onto the
+        same axis
+        """
+        self.viewStart, self.viewEnd = start, end
+
+        self.request_redraw()
+
+    def __on_scroll(self, e) -> None:
+        """
+        Graphing.__on_scroll(self, e) -> None
+        e: matplotlib.backend_bases.MouseEvent
+        zooms in/out around the date under the mouse
+        """
+        if e.inaxes is not self.ax or e.xdata is None:
+            return
+        if not self.__can_navigate():
+            return
+
+        #scrolling up zooms in
+        factor = self.zoomFactor if e.button == "down" else 1 / self.zoomFactor
+
+        self.__move_view(*zoom_view(
+            *self.__shown_dates(),
+            num_to_date(e.xdata),
+            factor
+            ))
+
+    def __on_press(self, e) -> None:
+        """
+        Graphing.__on_press(self, e) -> None
+        e: matplotlib.backend_bases.MouseEvent
+        starts dragging the view with the left mouse button. a double click
+        shows the whole chart/timespan again
+        """
+        if e.inaxes is not self.ax or e.button != 1:
+            return
+        if not self.__can_navigate():
+            return
+
+        if e.dblclick:
+            self.__dragStart = None
+            self.__move_view(None, None)
+            return
+
+        #where the drag started and what was in view at the time
+        self.__dragStart = (e.x, *self.__shown_dates())
+
+    def __on_drag(self, e) -> None:
+        """
+        Graphing.__on_drag(self, e) -> None
+        e: matplotlib.backend_bases.MouseEvent
+        moves the view along with the mouse
+        """
+        if self.__dragStart is None or e.x is None:
+            return
+
+        startX, start, end = self.__dragStart
+
+        #pixels dragged, as a number of seconds on the x axis
+        span = (end - start).astype(np.int64)
+        shift = np.timedelta64(
+            int((e.x - startX) / max(self.ax.bbox.width, 1) * span),
+            "s"
+            )
+
+        #dragging right shows earlier dates
+        self.__move_view(start - shift, end - shift)
+
+    def __on_release(self, e) -> None:
+        """
+        Graphing.__on_release(self, e) -> None
+        e: matplotlib.backend_bases.MouseEvent
+        stops dragging the view
+        """
+        self.__dragStart = None
+
+    def __start_background_render(self) -> None:
+        """
+        Graphing.__start_background_render(self) -> None
+        prepares the data on the Tkinter thread, then draws the chart on a
+        worker thread. A render that has not started yet is cancelled
+        """
+        #nothing to draw until a chart and data have been chosen
+        if not isinstance(self.type, Charts) or self.__graphAtts == {}:
+            return
+
+        plotWidth = self.winfo_width()
+        plotHeight = self.winfo_height()
+        if min(plotWidth, plotHeight) <= 1:
+            return
+
+        #the data is cleaned here so the cache is only used by this thread
+        xData, yData = self.__chart_data()
+
+        #renders that are still waiting are out of date
+        if self.__renderTask is not None:
+            self.__renderTask.cancel()
+
+        if self.__renderer is None:
+            self.__renderer = taskRunner.TaskRunner(self, maxWorkers=1,
+                                                    pollInterval=10)
+
+        self.__renderGeneration += 1
+        generation = self.__renderGeneration
+
+        self.__renderTask = self.__renderer.submit(
+            render_ppm,
+            self.type,
+            xData,
+            yData,
+            dict(self.__graphAtts),
+            plotWidth,
+            plotHeight,
+            min(plotWidth, plotHeight) / 8,
+            onDone=lambda image: self.__show_render(generation, image)
+        )
+
+    def __show_render(self, generation:int, image:bytes) -> None:
+        """
+        Graphing.__show_render(self, generation, image) -> None
+        generation: int: number of the render the image came from
+        image: bytes: PPM image of the chart
+
+        shows the image if it is from the newest render
+        """
+        #a newer render was started; this image is out of date
+        if generation != self.__renderGeneration:
+            return
+
+        #nothing is left to render
+        self.__renderTask = None
+
+        if self.__imageLabel is None:
+            self.__imageLabel = tk.Label(self, bg=self["bg"], bd=0)
+            self.__imageLabel.pack(fill=tk.BOTH, expand=True)
+
+        #keep a reference to the image or tkinter throws it away
+        self.__image = tk.PhotoImage(data=image, format="PPM")
+        self.__imageLabel.configure(image=self.__image)
+
+    def __chart_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Graphing.__chart_data(self) -> tuple[np.ndarray, np.ndarray]
+        returns the cleaned data the current chart draws
+        """
+        if self.type in (Charts.LINE_PLOT, Charts.SCATTER_PLOT):
+            return self.__level_of_detail(*self.__plot_data())
 
+        if self.type == Charts.FAN_CHART:
+            return self.__fan_data()
+
+        if self.type == Charts.BAR_CHART:
+            return self.__bar_data()
+
+        return self.__clean_data()
+
+    def __resize_figure(self) -> None:
+        """
+        Graphing.__resize_figure(self) -> None
+        sizes the figure and its canvas to the size of the frame
+        """
         #store the length, width, and average of length and width.
         #the plot will reference these measurements to determine plot size
         plotWidth = self.winfo_width()
         plotHeight = self.winfo_height()
         dpiRef = min(plotHeight, plotWidth)
 
-        #create a figure if it does not already exist
-        if not hasattr(self, "fig") or self.fig is None:
-            #initialize the figure
-            self.fig = plt.figure()
-    
-        # remove current axis from memory.
-        if hasattr(self, "ax"):
-            del self.ax
-
-        # clear the figure and create a new axis
-        self.fig.clear()
-
-        #create the axis where the chart will be made
-        self.ax = self.fig.add_subplot(111)
+        #the frame has not been drawn yet; keep the current size
+        if dpiRef <= 1:
+            return
 
         #resize fig
         self.fig.set_size_inches(plotWidth//120, plotHeight//110)
         self.fig.set_dpi(dpiRef/8)
         #ABOVE ARE THE DIMENSIONS NEEDED TO ENSURE CHART FITS IN THE WINDOW.
 
-        #put the scatterplot on the frame
+        #resize the canvas the figure is drawn on
+        self.graph.get_tk_widget().configure(width=plotWidth, height=plotHeight)
+
+    def __build_canvas(self) -> None:
+        """
+        Graphing.__build_canvas(self) -> None
+        creates the figure, axis and canvas. only called once; every chart
+        after the first one reuses them
+        """
+        #initialize the figure and the axis where the chart will be made
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot(111)
+
+        #put the figure on the frame
         self.graph = FigureCanvasTkAgg(self.fig, self)
         chart = self.graph.get_tk_widget()
-        chart.configure(width=plotWidth, height=plotHeight, bg=self["bg"])
+        chart.configure(bg=self["bg"])
         chart.pack()
-            
-    def __make_scatterplot(self, formatDates:bool) -> None:
+
+        #zoom with the mouse wheel, pan by dragging, double click to reset
+        self.graph.mpl_connect("scroll_event", self.__on_scroll)
+        self.graph.mpl_connect("button_press_event", self.__on_press)
+        self.graph.mpl_connect("motion_notify_event", self.__on_drag)
+        self.graph.mpl_connect("button_release_event", self.__on_release)
+
+    def __reset_plot(self) -> None:
+        """
+        Graph.__reset_plot(self) -> None
+        Resets the axis so a new chart can be drawn on it
+        """
+        #update window to get most accurate window size
+        self.update_idletasks()
+        self.master.update_idletasks()
+
+        #create the figure and canvas if they do not already exist
+        if self.graph is None:
+            self.__build_canvas()
+
+        # clear the axis instead of making a new one
+        self.ax.clear()
+
+        #the old line/points were removed with the rest of the axis
+        self.__plotted = None
+        self.__plottedKey = None
+
+        self.__resize_figure()
+
+    def __reuse_plotted(self, key:tuple) -> bool:
+        """
+        Graphing.__reuse_plotted(self, key) -> bool
+        key: tuple: chart type and x axis format of the chart to be drawn
+
+        returns True if the line/points already on the axis were drawn for the
+        same kind of chart, so the new data can be moved onto them
+        """
+        #text on the x axis is tied to the categories it was first drawn with
+        return (
+            self.__plotted is not None
+            and self.__plottedKey == key
+            and not self.__graphAtts["treatAsText"]
+        )
+
+    def __update_limits(self) -> None:
+        """
+        Graphing.__update_limits(self) -> None
+        fits the axis to the data of the line/points already on it
+        """
+        #collections are not picked up by relim(); add their points directly
+        if isinstance(self.__plotted, PathCollection):
+            self.ax.ignore_existing_data_limits = True
+            self.ax.update_datalim(self.__plotted.get_offsets())
+        else:
+            self.ax.relim()
+
+        #the x axis follows the data again once the view is reset
+        self.ax.set_autoscalex_on(True)
+        self.ax.autoscale_view()
+
+        self.__apply_view()
+
+    def __apply_view(self) -> None:
+        """
+        Graphing.__apply_view(self) -> None
+        sets the x axis to the dates in view, if a view is set
+        """
+        if self.viewStart is None and self.viewEnd is None:
+            return
+
+        left, right = self.ax.get_xlim()
+        if self.viewStart is not None:
+            left = mdates.date2num(self.viewStart)
+        if self.viewEnd is not None:
+            right = mdates.date2num(self.viewEnd)
+
+        self.ax.set_xlim(left, right)
+
+    def __make_scatterplot(self) -> None:
         '''
-        GraphFrame.make_scaterplot(self, formatDates): void\n
-        formatDates: bool: does we have new dates to update\n
+        GraphFrame.make_scaterplot(self): void\n
 
         displays a scatterplot
         '''
@@ -297,44 +1549,39 @@ class Graphing(tk.Frame):
         #if it is, then it means the window just opened without any data
         # and nothing should be plotted
         if self.__graphAtts != {}:
-            #remove rows with no values
-            self.__clean_data()
-
-            #if the data is text: convert to string
-            #allows matplotlib to interpret data as as text, not numeric
-            if self.__graphAtts["treatAsText"]:
-                self.xData = self.xData.astype(str)
-
-            #else if the data are dates, convert to datetime
-            elif self.__graphAtts["xAreDates"]:
-
-                #if the dates need to be formatted, then we got new dates
-                #update dates
-                if formatDates:
-                    #convert all days to datetime to work with them easier
-                    # filter them to be within specified timeframe
-                    # the user wants
-                    self.__filter_dates()
-
-            #reset the matplotlib plot -- remove current one from memory.
-            #create new blank slate
-            self.__reset_plot()
+            #get the cleaned x and y values in the format being plotted
+            xData, yData = self.__level_of_detail(*self.__plot_data())
+
+            key = (Charts.SCATTER_PLOT, self.__graphAtts["xAreDates"])
+
+            #if the points are already on the axis, move them to the new data
+            if self.__reuse_plotted(key):
+                self.__plotted.set_offsets(np.column_stack((
+                    self.ax.convert_xunits(xData),
+                    self.ax.convert_yunits(yData)
+                    )))
+                self.__plotted.set_sizes([self.__graphAtts["pointSize"]])
+                self.__plotted.set_color(self.__graphAtts["pointColor"])
+                self.__update_limits()
+
+            #else, draw the scatter plot on a blank axis
+            else:
+                #reset the matplotlib plot -- clear the current one.
+                #create new blank slate
+                self.__reset_plot()
 
-            #reduce clutter of x axis
-            self.fig.autofmt_xdate()
+                #graph the scatter plot
+                self.__plotted = draw_scatterplot(
+                    self.ax, xData, yData, self.__graphAtts
+                    )
+                self.__plottedKey = key
+                self.__apply_view()
+
+                #reduce clutter of x axis
+                self.fig.autofmt_xdate()
 
-            #graph the scatter plot
-            self.ax.scatter(
-                self.xData,
-                self.yData,
-                s=self.__graphAtts["pointSize"],
-                color=self.__graphAtts["pointColor"]
-                )
-            
             #set axis labels
-            self.ax.title.set_text(self.__graphAtts["title"])
-            self.ax.set_xlabel(self.__graphAtts["xName"])
-            self.ax.set_ylabel(self.__graphAtts["yName"])
+            label_chart(self.ax, self.__graphAtts)
             
             #draw the chart
             self.graph.draw()
@@ -358,112 +1605,52 @@ class Graphing(tk.Frame):
         if self.__graphAtts != {}:
 
             #clean data
-            self.__clean_data()
+            xData, yData = self.__bar_data()
 
-            #reset plot -- clear the current plot from memory
-            self.__reset_plot()
+            key = (Charts.BAR_CHART, "pyramid")
 
-            #clean up x axis
-            self.fig.autofmt_xdate()
-            
-            #if the user wants a histogram: make the histogram
-            if self.__graphAtts["makeHistogram"]:
-
-                # create the histogram
-                n, bins, patches = self.ax.hist(
-                        self.xData,
-                        linewidth=self.__graphAtts["lineWidth"],
-                        edgecolor=self.__graphAtts["lineColor"],
-                        bins = self.__graphAtts["numBins"]
-                        )
-
-                #make the colors
-
-                #if the user included a list of colors,
-                #iterate through each color and assign to bar graph
-
-                #create own flag variables 
-                # or else if statement will get long and confusing
-                isSeq = isinstance(self.__graphAtts["fillColor"], t.Iterable)
-                isNotStr = not isinstance(self.__graphAtts["fillColor"], str)
-                isListOfStrs = all(map(
-                    lambda value: isinstance(value, str) == True,
-                    self.__graphAtts["fillColor"]
-                    ))
-
-                #now check the conditions
-                if (isSeq and isNotStr and isListOfStrs):
-                    # if user inputted less colors than there are
-                    # bins, iterate through user inputted colors
-                    # and add it to a new list of colors until they are the 
-                    #same length
-                    if len(self.__graphAtts["fillColor"]) < len(patches):
-                        
-                        #index of __graphAtts to reference
-                        index = 0
+            #zooming/panning a pyramid moves the bars already on the axis.
+            #a histogram is always drawn again
+            isHistogram = self.__graphAtts["makeHistogram"]
+            if (self.pyramid is not None and not isHistogram
+                and self.__reuse_plotted(key)):
+                self.__plotted = move_bars(
+                    self.ax, self.__plotted, xData, yData, self.__graphAtts
+                    )
+                self.__update_limits()
 
-                        # add the user inputted colors to colors
-                        colors = list(self.__graphAtts["fillColor"])
-
-                        #add new color if there are less colors than bars
-                        while len(colors) < len(patches):
-                            #add a new color
-                            colors.append(self.__graphAtts["fillColor"][index])
-
-                            #if index is at the last index of the list of
-                            #user inputted colors, reset index to 0
-                            if index == len(self.__graphAtts["fillColor"]) - 1:
-                                index = 0
-                            #else, add 1 to index
-                            else:
-                                index += 1
-
-                    #else if there are more colors than bars, cut off the 
-                    #excess colors and assign to a new list
-                    elif len(self.__graphAtts["fillColor"]) < len(patches):
-                        colors = self.__graphAtts[:len(patches)]
-                    
-                    #else assign the fill color to a new list
-                    else:
-                        colors = list(self.__graphAtts["fillColor"])
-                    
-                    #loop through the each bar and each color in colors
+            #else, draw the bar graph on a blank axis
+            else:
+                #reset plot -- clear the current plot from memory
+                self.__reset_plot()
 
-                    for color, bar in zip(colors, patches):
-                        bar.set_facecolor(color)
+                #clean up x axis
+                self.fig.autofmt_xdate()
 
-                #else, set the facecolor to one color
-                else:
-                    for bar in patches:
-                        bar.set_facecolor(self.__graphAtts["fillColor"])
+                #draw the bar graph or histogram
+                bars = draw_bar_chart(self.ax, xData, yData, self.__graphAtts)
 
+                #keep the bars of a pyramid so they can be moved.
+                #an empty chart has no date axis to move bars along yet,
+                #and a histogram has no bars to keep
+                if self.pyramid is not None and bars is not None and len(bars):
+                    self.__plotted = list(bars)
+                    self.__plottedKey = key
+                    self.__apply_view()
 
-            #else user does not want a histogram; they want a normal bar graph
-            else:
-                # draw the bar graph
-                self.ax.bar(
-                    self.xData,
-                    self.yData,
-                    color=self.__graphAtts["fillColor"],
-                    linewidth=self.__graphAtts["lineWidth"],
-                    edgecolor=self.__graphAtts["lineColor"]
-                    )
-
-            #set the title, xLabel, yLabel, bar color, and outline thickness
-            self.ax.title.set_text(self.__graphAtts["title"])
-            self.ax.title.set_text(self.__graphAtts["title"])
-            self.ax.set_xlabel(self.__graphAtts["xName"])
-            self.ax.set_ylabel(self.__graphAtts["yName"])
+            #set the title, xLabel, yLabel
+            label_chart(self.ax, self.__graphAtts)
 
+            #draw the chart
+            self.graph.draw()
 
             #update the window
             self.update_idletasks()
 
 
-    def __make_line_chart(self, formatDates: bool) -> None:
+    def __make_line_chart(self) -> None:
         '''
-        GraphFrame.make_line_chart(self, formatDates): void\n
-        formatDates: bool: does we have new dates to update\n
+        GraphFrame.make_line_chart(self): void\n
 
         displays a scatterplot
         '''
@@ -475,43 +1662,35 @@ class Graphing(tk.Frame):
         #if it is, then it means the window just opened without any data
         # and nothing should be plotted
         if self.__graphAtts != {}:
-            #remove rows with no values
-            self.__clean_data()
-
-            #if the data is text: convert to string
-            #allows matplotlib to interpret data as as text, not numeric
-            if self.__graphAtts["treatAsText"]:
-                self.xData = self.xData.astype(str)
-
-            #else if the data are dates, convert to datetime
-            elif self.__graphAtts["xAreDates"]:
-
-                #if the dates need to be formatted, then we got new dates
-                #update dates
-                if formatDates:
-                    #convert all days to datetime to work with them easier
-                    # filter them to be within specified timeframe
-                    # the user wants
-                    self.__filter_dates()
-
-            #reset the matplotlib plot -- remove current one from memory.
-            #create new blank slate
-            self.__reset_plot()
+            #get the cleaned x and y values in the format being plotted
+            xData, yData = self.__level_of_detail(*self.__plot_data())
 
-            #reduce clutter of x axis
-            self.fig.autofmt_xdate()
+            key = (Charts.LINE_PLOT, self.__graphAtts["xAreDates"])
+
+            #if the line is already on the axis, move it to the new data
+            if self.__reuse_plotted(key):
+                self.__plotted.set_data(xData, yData)
+                self.__plotted.set_color(self.__graphAtts["lineColor"])
+                self.__update_limits()
+
+            #else, draw the line plot on a blank axis
+            else:
+                #reset the matplotlib plot -- clear the current one.
+                #create new blank slate
+                self.__reset_plot()
+
+                #graph the line plot
+                self.__plotted = draw_line_chart(
+                    self.ax, xData, yData, self.__graphAtts
+                    )
+                self.__plottedKey = key
+                self.__apply_view()
+
+                #reduce clutter of x axis
+                self.fig.autofmt_xdate()
 
-            #graph the line plot
-            self.ax.plot(
-                self.xData,
-                self.yData,
-                color=self.__graphAtts["lineColor"]
-                )
-            
             #set axis labels
-            self.ax.title.set_text(self.__graphAtts["title"])
-            self.ax.set_xlabel(self.__graphAtts["xName"])
-            self.ax.set_ylabel(self.__graphAtts["yName"])
+            label_chart(self.ax, self.__graphAtts)
             
             #draw the chart
             self.graph.draw()
@@ -537,220 +1716,298 @@ class Graphing(tk.Frame):
             self.__reset_plot()
 
             #clean data
-            self.__clean_data()
-
-            #if the user inputted a list, color the pie chart based on
-            # developer input, make the colors used in the part chart based off 
-            # of what was passed by the developer
-            if (isinstance(self.__graphAtts["fillColor"], t.Iterable)
-                and not isinstance(self.__graphAtts["fillColor"], str)):
-
-                # initialize variable to create a copy of dev inputted colors
-                colors = list(self.__graphAtts["fillColor"])
-
-                #if there are less colors than pie slices: add random colors 
-                #until there are the same amount of colors and pie slices
-                if len(colors) < len(self.xData):
-                    #while length of colors < num pie slices: add new color
-                    while len(colors) < len(self.xData):
-                        #generate a random color
-                        newColor = ("#" + "".join(
-                            random.choice("ABCDEF1234567890") 
-                            for i in range(6)
-                            ))
-                        
-                        #add random color to the list of colors
-                        colors.append(newColor)
-
-                #else if there are more colors than number of slices: reduce
-                #list of colors length
-                elif len(colors) > len(self.xData):
-                    # cut off the excess colors from the list of colors
-                    colors = colors[:len(self.xData)]
-
-                #draw the pie chart
-                patches, text, autotexts = self.ax.pie(
-                    self.yData,
-                    labels=self.xData,
-                    colors=colors,
-                    autopct="%1.1f%%"
+            xData, yData = self.__clean_data()
+
+            #draw the pie chart
+            draw_pie_chart(self.ax, xData, yData, self.__graphAtts)
+
+            #draw the chart
+            self.graph.draw()
+
+    def __make_fan_chart(self) -> None:
+        """
+        GraphFrame.__make_fan_chart(self)
+        displays a line with shaded bands around it, e.g. the percentiles
+        of a simulation
+        """
+        #update the window
+        self.update_idletasks()
+        self.master.update_idletasks()
+
+        #if __graphAtts is not an empty dictionary, there is data to process
+        if self.__graphAtts != {}:
+            #get the cleaned line and bands
+            xData, yData = self.__fan_data()
+
+            #filled bands cannot be moved onto new data; start over
+            self.__reset_plot()
+
+            #draw the bands and the line
+            draw_fan_chart(self.ax, xData, yData, self.__graphAtts)
+
+            #reduce clutter of x axis
+            self.fig.autofmt_xdate()
+
+            #set axis labels
+            label_chart(self.ax, self.__graphAtts)
+
+            #draw the chart
+            self.graph.draw()
+
+    def __fan_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        GraphFrame.__fan_data(self) -> tuple[np.ndarray, np.ndarray]
+        returns the x values and a 2D array of the middle line followed by
+        the low and high edge of each band, cleaned, sorted and filtered to
+        the timespan like the line chart.
+        only worked out once for each version of the data
+        """
+        key = ("fan", self.__graphAtts["timespan"].lower())
+
+        if key not in self.__dataCache:
+            self.__dataCache[key] = fan_data(
+                self.xData,
+                self.yData,
+                self.__graphAtts
                 )
 
-            #else; dev did not input custom color list:
+        return self.__dataCache[key]
+
+    def __plot_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        GraphFrame.__plot_data(self) -> tuple[np.ndarray, np.ndarray]
+        returns the cleaned x and y values in the format they are plotted in:
+        text, dates within the timespan, or numbers.
+        only worked out once for each version of the data
+        """
+        #a pyramid is read for the dates in view every time instead
+        if self.pyramid is not None:
+            return self.__pyramid_data()
+
+        #the cleaned data differs with and without makeHistogram, so
+        #anything worked out from it is kept apart the same way
+        makeHistogram = self.__graphAtts["makeHistogram"]
+
+        #if the data is text: convert to string
+        #allows matplotlib to interpret data as as text, not numeric
+        if self.__graphAtts["treatAsText"]:
+            key = ("text", makeHistogram)
+        #else if the data are dates, convert to datetime and keep the dates
+        #within the timespan
+        #once the chart is zoomed/panned, the view replaces the timespan
+        elif self.__graphAtts["xAreDates"]:
+            timespan = self.__graphAtts["timespan"].lower()
+            if self.viewStart is not None or self.viewEnd is not None:
+                timespan = "all"
+            key = ("dates", timespan, makeHistogram)
+        #else, plot the cleaned data as is
+        else:
+            return self.__clean_data()
+
+        if key not in self.__dataCache:
+            xData, yData = self.__clean_data()
+
+            if key[0] == "text":
+                self.__dataCache[key] = (xData.astype(str), yData)
             else:
-                # draw the pie chart without user inputted data
-                patches, text, autotexts = self.ax.pie(
-                    self.yData,
-                    labels=self.xData,
-                    autopct="%1.1f%%"
+                self.__dataCache[key] = self.__filter_dates(
+                    self.__convert_to_datetime(xData),
+                    yData
+                    )
+
+        #only the dates in view are drawn
+        if key[0] == "dates":
+            return view_slice(
+                *self.__dataCache[key], self.viewStart, self.viewEnd
                 )
 
-            #set font to readable size
-            for label, pctLabels in zip(text, autotexts):
-                    label.set_fontsize(16.0)
-                    pctLabels.set_fontsize(14.0)
-                    
-    def __filter_dates(self):
+        return self.__dataCache[key]
+
+    def __pyramid_data(self) -> tuple[np.ndarray, np.ndarray]:
         """
-        GraphFrame.__filter_dates(self)
-        filters the dates to be in desired time frame
+        GraphFrame.__pyramid_data(self) -> tuple[np.ndarray, np.ndarray]
+        returns the buckets of the pyramid in view, at the finest level
+        with no more buckets than the plot is wide in pixels
         """
+        start, end = self.viewStart, self.viewEnd
+
+        #without a view, show the timespan ending at the newest date
+        #that is drawn
+        timeSubtract = timespan_delta(self.__graphAtts["timespan"])
+        dateRange = self.pyramid.date_range()
+        if (start is None and end is None and timeSubtract is not None
+                and dateRange is not None):
+            end = dateRange[1]
+            if self.lastDate is not None:
+                end = min(end, self.lastDate)
+            start = end - timeSubtract
+
+        #bars need a few pixels each to be seen
+        width = max(self.winfo_width(), 1)
+        if self.type == Charts.BAR_CHART:
+            width = max(width // 8, 1)
+
+        xData, yData, level = self.pyramid.query(
+            start,
+            end,
+            maxPoints=width,
+            cumulative=self.cumulative
+            )
 
-        # convert the current xData to datetime
-        self.__convert_to_datetime()
+        #leave out buckets that start after the last date drawn
+        if self.lastDate is not None:
+            keep = xData <= self.lastDate
+            xData, yData = xData[keep], yData[keep]
 
-        #check to see if user wants all time; if not, filter by timespan
-        if self.__graphAtts['timespan'].lower() != "all":
-            #get the desired timeframe
-            timeFrame = self.__graphAtts["timespan"].split(".")
+        #dates at the start of each bucket and the bucket's sum/balance
+        return xData, yData
 
-            #cast the M/W/Y noatation to uppercase
-            #reduces case sensitivity
-            timeFrame[1] = timeFrame[1].upper()
+    def __bar_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        GraphFrame.__bar_data(self) -> tuple[np.ndarray, np.ndarray]
+        returns the data the bar chart draws
+        """
+        if self.pyramid is not None:
+            return self.__pyramid_data()
 
-            #make sure the xData and yData are within the range specified.
+        return self.__clean_data()
 
-            #put self.xValues and self.yValyes in temporary dataFrame to 
-            #make sure the xvalues and yvalues are sorted along side each
-            #other and data does not get mixed up
-            tempData = pd.DataFrame(
-                {"date": self.xData, "value": self.yData},
+    def __level_of_detail(
+            self, xData:np.ndarray, yData:np.ndarray
+            ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        GraphFrame.__level_of_detail(self, xData, yData) -> tuple
+        xData: np.ndarray: x values being plotted
+        yData: np.ndarray: y values being plotted
+
+        reduces the points to what can be seen at the plot's width in pixels
+        so large data sets draw as fast as small ones.
+        returns the points to draw
+        """
+        return level_of_detail(
+            xData,
+            yData,
+            self.__graphAtts,
+            self.winfo_width()
             )
 
-            #sort the dataFrame by date in descending order
-            tempData = tempData.sort_values(
-                "date",
-                ascending=False,
-                ignore_index=True
-                )
-            
+    def __filter_dates(
+            self, dates:np.ndarray, values:np.ndarray
+            ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        GraphFrame.__filter_dates(self, dates, values) -> tuple
+        dates: np.ndarray[datetime64]: x values
+        values: np.ndarray: y values
 
-            #cast timeFrame[0] to int; this is the number of iterations of
-            # the unit of time
-            timeFrame[0] = int(timeFrame[0])
-
-            #if timeFrame[1] == "W", filter by num weeks
-            if timeFrame[1] == "W":
-                # have the earliest date be timeSpan[0] * 7 days before
-                #most recent date
-                timeSubtract = datetime.timedelta(timeFrame[0] * 7)
-                beginningDate = tempData.date[0] - timeSubtract
-
-            #else if timeSpan[1] == "M", filter by num months
-            elif timeFrame[1] == "M":
-                # have beginning date be 
-                #(int value timeSpan[0] * 30.44 days) before most recent date
-                timeSubtract = datetime.timedelta(int(timeFrame[0] * 30.44))
-                beginningDate = tempData.date[0] - timeSubtract
-
-            #else if timeSpan[1] == "Y", filter by num years
-            elif timeFrame[1] == "Y":
-                # have the beginning date be
-                #(int value of timeSpan[0] * 365.25 days) before most recent date
-                timeSubtract = datetime.timedelta(int(timeFrame[0] * 365.25))
-                beginningDate = tempData.date[0] - timeSubtract
-
-            # filter the dataframe and remove all rows that are less than
-            #specified beginning date
-            tempData = tempData[tempData.date >= beginningDate]
-
-            #reassign self.xValues and self.yValues based on dataframe
-            self.xData = tempData.date
-            self.yData = tempData.value
-
-            #delete temporary dataframe from memory
-            del tempData
-         
-    def __convert_to_datetime(self) -> None:
+        sorts the dates and filters them to be in desired time frame
+        returns the sorted, filtered dates and values
+        """
+        return filter_dates(dates, values, self.__graphAtts["timespan"])
+
+    def __convert_to_datetime(self, dates:np.ndarray) -> np.ndarray:
         '''
-        GraphFrame.convert_to_datetime(dates)\n
+        GraphFrame.convert_to_datetime(dates) -> np.ndarray[datetime64]\n
+        dates: np.ndarray[str]: dates in MM/DD/YYYY format\n
         converts x-axis dates to datetime format\n
+        the dates are parsed once for each version of the cleaned data\n
         '''
-        #store the dates in a new format and save it to variable
-        tempIndependant = []
-        for element in self.xData:
-            #split it into a list so we can work with each unit at a time
-            element = element.split("/")
-
-            for unit in range(2):
-                #make sure the month and day are in MM and DD format
-                element[unit] = element[unit].zfill(2)
-            
-            #make sure year is in YYYY format
-            element[2] = element[2].zfill(4)
+        #dates that were already converted do not need to be parsed again
+        if np.issubdtype(dates.dtype, np.datetime64):
+            return dates
 
-            #put the properly formatted months and dates into a new string
-            tempDate = "{}/{}/{}".format(*element)
+        #parsed from the cleaned data, which is cleaned per makeHistogram
+        key = ("parsedDates", self.__graphAtts["makeHistogram"])
+        if key in self.__dataCache:
+            return self.__dataCache[key][0]
 
-            #set the format for the dates
-            format = "%m/%d/%Y"
+        #parse the whole column at once
+        newDates = dateUtils.parse_dates(dates)
 
-            #make the newdate in datetime format
-            newDate = dt.strptime(tempDate, format)
+        #save the parsed dates for the next redraw
+        self.__dataCache[key] = (newDates, None)
 
-            #add it to the list of dates
-            tempIndependant.append(newDate.date())
-        
-        #update stored independant values to be in datetime format
-        self.xData = tempIndependant
+        return newDates
 
     def close(self) -> None:
         """
         self.close(self)\n
         closes the window
         """
+        #cancel any redraw that is still waiting
+        if self.__redrawJob is not None:
+            self.after_cancel(self.__redrawJob)
+            self.__redrawJob = None
+
+        #stop drawing on the worker thread
+        if self.__renderer is not None:
+            self.__renderer.shutdown()
+            self.__renderer = None
+
         #close the plot
-        if hasattr(self, "fig"):
+        if self.fig is not None:
             self.fig.clear()
-            del self.fig
-        
-        if hasattr(self, "ax"):
+            self.fig = None
+
+        if self.ax is not None:
             self.ax.clear()
-            del self.ax
-        
+            self.ax = None
+
+        #remove the canvas the figure was drawn on
+        if self.graph is not None:
+            self.graph.get_tk_widget().destroy()
+            self.graph = None
+
+        self.__plotted = None
+        self.__plottedKey = None
+
         #destory the frame
         self.destroy()
 
-    def __clean_data(self) -> None:
+    def __clean_data(self) -> tuple[np.ndarray, np.ndarray]:
         '''
-        GraphFrame.clean_data(independant, dependant)\n
+        GraphFrame.clean_data() -> tuple[np.ndarray, np.ndarray]\n
         cleans the data by filtering out None types and null\n
-        reassigns self.xData and self.yData to be the cleaned data
+        returns the cleaned xData and yData. xData and yData are not changed.
+        the data is only cleaned once for each version of the data
         '''
+        key = ("clean", self.__graphAtts["makeHistogram"])
 
-        #if the plot is not supposed to be a histogram
-        #filter the x and y axis  
-        if not self.__graphAtts["makeHistogram"]:
+        #reuse the cleaned data if this version was already cleaned
+        if key in self.__dataCache:
+            return self.__dataCache[key]
 
-            #make sure xData and yData are the same length
-            #set the max length of both sequences to be the smallest length
-            maxLength = min(len(self.xData), len(self.yData))
+        self.__dataCache[key] = clean_data(
+            self.xData,
+            self.yData,
+            self.__graphAtts["makeHistogram"]
+            )
 
-            #slice both sequences to go up to the length of the smaller list
-            self.xData = self.xData[:maxLength]
-            self.yData = self.yData[:maxLength]
+        return self.__dataCache[key]
 
-            #save data to dataframe
-            data = pd.DataFrame({'x': self.xData, 'y': self.yData})
+def default_attributes(**kwargs) -> dict:
+    """
+    default_attributes(**kwargs) -> dict
+    **kwargs: any keyword arguments of Graphing.set_attributes
 
-            #drop all rows with no values
-            data = data.dropna()
+    returns the chart attributes Graphing.set_attributes would store,
+    without needing a Graphing widget
+    """
+    parameters = inspect.signature(Graphing.set_attributes).parameters
 
-            #declare the cleaned data to xData and yData
-            self.xData = data.x
-            self.yData = data.y
-        
-        #if it is supposed to be a histogram, look at only x values
-        else:
-            data = pd.DataFrame({'x': self.xData})
+    atts = {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if parameter.kind == inspect.Parameter.KEYWORD_ONLY
+    }
 
-            #drop all rows with no values
-            data = data.dropna()
+    #only the same attributes as set_attributes are allowed
+    unknown = set(kwargs) - set(atts)
+    if unknown:
+        raise TypeError(f"unknown chart attributes: {sorted(unknown)}")
 
-            #declare the cleaned data to xData and yData
-            self.xData = data.x
+    atts.update(kwargs)
 
-        del data 
+    return atts
 
 def main():
     import random
@@ -0,0 +1,256 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Simulates thousands of possible futures of an investment portfolio for the
+investments tab, so it can show a range of outcomes instead of one line.
+Paths are seeded in fixed-size blocks, so the same seed gives the same
+paths however they are split up. Chunks of whole blocks are spread over a
+process pool and only the portfolio totals of each path are kept, not the
+value of every investment
+"""
+
+#import needed modules
+import typing as t
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+import dateUtils
+import projections
+
+
+#how much the yearly return of each kind of investment swings
+ASSET_VOLATILITY:dict[str, float] = {
+    "stocks": 0.15,
+    "bonds": 0.05,
+    "real estate": 0.10,
+    "gold": 0.15,
+    "savings": 0.005
+}
+
+#number of paths drawn from each seed. chunks are made of whole blocks so
+#the random numbers do not depend on the chunk size
+SEED_BLOCK:int = 100
+
+#percentiles shown by default: the middle 50% and 90% of outcomes
+PERCENTILES:tuple[float, ...] = (5, 25, 50, 75, 95)
+
+
+def simulate_paths(seeds:t.Sequence[np.random.SeedSequence],
+                    blockSizes:t.Sequence[int], months:int,
+                    startBalance:float, contributions:np.ndarray,
+                    weights:np.ndarray, annualRates:np.ndarray,
+                    volatility:np.ndarray) -> np.ndarray:
+    """
+    simulate_paths(seeds, blockSizes, months, startBalance, contributions,
+        weights, annualRates, volatility) -> np.ndarray
+    seeds: sequence[np.random.SeedSequence]: seed of each block of paths
+        in this chunk
+    blockSizes: sequence[int]: number of paths in each block
+    months: int: number of months
+    startBalance: float: money invested at the start
+    contributions: np.ndarray: amount invested in each month
+    weights: np.ndarray: share of the money in each investment
+    annualRates: np.ndarray: expected yearly return of each investment
+    volatility: np.ndarray: yearly volatility of each investment
+
+    monthly returns are lognormal with the expected yearly return
+    returns the total value of the portfolio, shape (paths, months)
+    """
+
+    #monthly mean and spread of the log returns, shape (assets, 1)
+    sigma = (volatility / np.sqrt(12))[:, None]
+    mu = (np.log1p(annualRates) / 12)[:, None] - sigma ** 2 / 2
+
+    #every random number of every path, each block from its own seed,
+    #shape (paths, assets, months)
+    normals = np.concatenate([
+        np.random.default_rng(seed).standard_normal(
+            (blockSize, len(weights), months)
+        )
+        for seed, blockSize in zip(seeds, blockSizes)
+    ])
+
+    #every return of every path at once
+    growth = np.exp(np.cumsum(mu + sigma * normals, axis=2))
+
+    #B[m] = G[m] * (B[0] + sum of c[k] / G[k] for k <= m)
+    perAsset = contributions[None, :] * weights[:, None]
+    balances = growth * (
+        (startBalance * weights)[:, None]
+        + np.cumsum(perAsset / growth, axis=2)
+    )
+
+    return balances.sum(axis=1)
+
+
+def simulate(startBalance:float = 0.0, monthlyContribution:float = 0.0,
+                years:int = 40,
+                allocation:dict[str, float]|None = None,
+                returns:dict[str, float]|None = None,
+                volatility:dict[str, float]|None = None,
+                annualIncrease:float = 0.0,
+                numPaths:int = 10000,
+                percentiles:t.Iterable[float] = PERCENTILES,
+                seed:int|None = None,
+                chunkSize:int = 1000,
+                workers:int|None = None,
+                startDate:t.Any = None) -> dict[str, t.Any]:
+    """
+    simulate(startBalance, monthlyContribution, years, allocation, returns,
+        volatility, annualIncrease, numPaths, percentiles, seed, chunkSize,
+        workers, startDate) -> dict
+    startBalance: float: money invested today
+    monthlyContribution: float: amount invested each month
+    years: int: number of years to simulate
+    allocation: dict[str, float]|None: share of the money in each
+        investment. all in stocks if None
+    returns: dict[str, float]|None: expected yearly return of each
+        investment. projections.ASSET_RETURNS is used for any that are
+        missing
+    volatility: dict[str, float]|None: yearly volatility of each
+        investment. ASSET_VOLATILITY is used for any that are missing
+    annualIncrease: float: how much the monthly amount grows each year
+    numPaths: int: number of possible futures to simulate
+    percentiles: iterable[float]: percentiles to keep, from 0 to 100
+    seed: int|None: seed of the random numbers. the same seed gives the same
+        result for any chunkSize and number of workers
+    chunkSize: int: paths simulated at once. bounds the memory of the
+        random numbers and returns of each chunk; the totals of every path
+        are still kept, numPaths * years * 12 floats. rounded up to whole
+        blocks of SEED_BLOCK paths
+    workers: int|None: processes to run the chunks on. 1 runs them here
+    startDate: str|np.datetime64|None: month the simulation starts. this
+        month if None
+
+    returns a dict with:
+        - dates: np.ndarray[datetime64[D]]: first day of each month
+        - percentiles: np.ndarray: the percentiles kept
+        - bands: np.ndarray: value of the portfolio at each percentile,
+          shape (percentiles, months)
+        - final: np.ndarray: value of every path at the end
+    """
+    if allocation is None:
+        allocation = {"stocks": 1.0}
+    returns = {} if returns is None else returns
+    volatility = {} if volatility is None else volatility
+
+    assets = list(allocation)
+    weights = np.array([allocation[asset] for asset in assets],
+                       dtype=np.float64)
+    if weights.sum() <= 0:
+        raise ValueError("allocation must put money in an investment")
+    weights = weights / weights.sum()
+
+    annualRates = np.array([
+        returns.get(asset, projections.ASSET_RETURNS.get(asset, 0.0))
+        for asset in assets
+    ], dtype=np.float64)
+    assetVolatility = np.array([
+        volatility.get(asset, ASSET_VOLATILITY.get(asset, 0.0))
+        for asset in assets
+    ], dtype=np.float64)
+
+    months = int(round(years * 12))
+    contributions = projections.contribution_schedule(
+        monthlyContribution,
+        months,
+        annualIncrease
+    )[0]
+
+    #one independent seed per block of paths, however the blocks are
+    #split into chunks
+    blockSizes = [
+        min(SEED_BLOCK, numPaths - start)
+        for start in range(0, numPaths, SEED_BLOCK)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(blockSizes))
+
+    #each chunk is made of whole blocks
+    blocksPerChunk = max(-(-chunkSize // SEED_BLOCK), 1)
+    chunkSize = blocksPerChunk * SEED_BLOCK
+    chunkSizes = [
+        min(chunkSize, numPaths - start)
+        for start in range(0, numPaths, chunkSize)
+    ]
+    arguments = (
+        [seeds[block:block + blocksPerChunk]
+         for block in range(0, len(seeds), blocksPerChunk)],
+        [blockSizes[block:block + blocksPerChunk]
+         for block in range(0, len(blockSizes), blocksPerChunk)],
+        [months] * len(chunkSizes),
+        [float(startBalance)] * len(chunkSizes),
+        [contributions] * len(chunkSizes),
+        [weights] * len(chunkSizes),
+        [annualRates] * len(chunkSizes),
+        [assetVolatility] * len(chunkSizes)
+    )
+
+    #the portfolio total of every path, so the percentiles are exact
+    totals = np.empty((numPaths, months))
+
+    #fill in the totals one chunk at a time as the chunks finish
+    if workers == 1 or len(chunkSizes) <= 1:
+        chunks = map(simulate_paths, *arguments)
+        for start, chunk in zip(range(0, numPaths, chunkSize), chunks):
+            totals[start:start + len(chunk)] = chunk
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(simulate_paths, *arguments)
+            for start, chunk in zip(range(0, numPaths, chunkSize), chunks):
+                totals[start:start + len(chunk)] = chunk
+
+    percentiles = np.asarray(tuple(percentiles), dtype=np.float64)
+
+    if startDate is None:
+        firstMonth = np.datetime64("today", "M")
+    else:
+        firstMonth = dateUtils.parse_dates([startDate])[0].astype(
+            "datetime64[M]"
+        )
+
+    return {
+        "dates": (firstMonth + np.arange(1, months + 1)).astype(
+            "datetime64[D]"
+        ),
+        "percentiles": percentiles,
+        "bands": np.percentile(totals, percentiles, axis=0),
+        "final": totals[:, -1].copy()
+    }
+
+
+def graph_attributes(simulation:dict[str, t.Any],
+                        **kwargs) -> dict[str, t.Any]:
+    """
+    graph_attributes(simulation, **kwargs) -> dict
+    simulation: dict: result of simulate()
+    **kwargs: other arguments for Graphing.set_attributes()
+
+    the middle percentile is the line; the other percentiles are paired
+    from the outside in as bands
+    returns the arguments to give Graphing.set_attributes() for a fan
+    chart, e.g.
+        graph.switch_graph("FAN CHART")
+        graph.set_attributes(**graph_attributes(simulation))
+    """
+    bands = simulation["bands"]
+    numBands = len(bands) // 2
+
+    #an even number of percentiles has no middle one; use the middle two
+    if len(bands) % 2:
+        middle = bands[numBands]
+    else:
+        middle = bands[numBands - 1:numBands + 1].mean(axis=0)
+
+    attributes = {
+        "independant": dateUtils.format_dates(simulation["dates"]),
+        "dependant": middle,
+        "bands": [(bands[band], bands[-1 - band])
+                  for band in range(numBands)],
+        "xName": "Date",
+        "yName": "Balance",
+        "title": "Range of outcomes",
+        "xAreDates": True
+    }
+    attributes.update(kwargs)
+
+    return attributes
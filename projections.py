@@ -0,0 +1,191 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Projects savings and investments into the future for the savings and
+investments tabs.
+Every month of every scenario is computed at once from the closed form of
+compound growth, so a 40 year monthly projection of many scenarios takes
+milliseconds. graph_attributes() turns a projection into the arguments of
+Graphing.set_attributes()
+"""
+
+#import needed modules
+import typing as t
+import numpy as np
+
+import dateUtils
+
+
+#expected yearly return of each kind of investment
+ASSET_RETURNS:dict[str, float] = {
+    "stocks": 0.07,
+    "bonds": 0.03,
+    "real estate": 0.05,
+    "gold": 0.02,
+    "savings": 0.01
+}
+
+
+def monthly_rate(annualRate:t.Any) -> np.ndarray:
+    """
+    monthly_rate(annualRate) -> np.ndarray
+    annualRate: float|array: yearly rate, e.g. 0.07 for 7%
+
+    returns the monthly rate that compounds to annualRate over a year
+    """
+    return (1 + np.asarray(annualRate, dtype=np.float64)) ** (1 / 12) - 1
+
+
+def contribution_schedule(monthlyContribution:t.Any, months:int,
+                            annualIncrease:t.Any = 0.0) -> np.ndarray:
+    """
+    contribution_schedule(monthlyContribution, months, annualIncrease)
+        -> np.ndarray
+    monthlyContribution: float|array: amount saved each month. one value
+        per scenario for an array
+    months: int: number of months
+    annualIncrease: float|array: how much the monthly amount grows each
+        year, e.g. 0.03 for raises of 3%
+
+    returns the amount saved in each month, shape (scenarios, months)
+    """
+    monthlyContribution = np.atleast_1d(
+        np.asarray(monthlyContribution, dtype=np.float64)
+    )[:, None]
+    annualIncrease = np.atleast_1d(
+        np.asarray(annualIncrease, dtype=np.float64)
+    )[:, None]
+
+    #the amount goes up at the start of every year
+    years = np.arange(months) // 12
+
+    return monthlyContribution * (1 + annualIncrease) ** years
+
+
+def project(startBalance:t.Any = 0.0, monthlyContribution:t.Any = 0.0,
+                years:int = 40,
+                allocation:dict[str, float]|None = None,
+                returns:dict[str, t.Any]|None = None,
+                annualIncrease:t.Any = 0.0,
+                startDate:t.Any = None) -> dict[str, t.Any]:
+    """
+    project(startBalance, monthlyContribution, years, allocation, returns,
+        annualIncrease, startDate) -> dict
+    startBalance: float|array: money invested today
+    monthlyContribution: float|array: amount invested each month
+    years: int: number of years to project
+    allocation: dict[str, float]|None: share of the money in each
+        investment, e.g. {"stocks": 0.6, "gold": 0.4}. all in stocks if None
+    returns: dict[str, float|array]|None: yearly return of each investment.
+        ASSET_RETURNS is used for any that are missing
+    annualIncrease: float|array: how much the monthly amount grows each year
+    startDate: str|np.datetime64|None: month the projection starts. this
+        month if None
+
+    Any argument given as an array is one value per scenario; every
+    scenario is projected at once
+    Money is added at the end of each month, after that month's growth
+
+    returns a dict with:
+        - assets: list[str]: names of the investments
+        - dates: np.ndarray[datetime64[D]]: first day of each month
+        - contributions: np.ndarray: total put in by each month,
+          shape (scenarios, months)
+        - balances: np.ndarray: value of each investment,
+          shape (scenarios, assets, months)
+        - total: np.ndarray: value of everything, shape (scenarios, months)
+    """
+    if allocation is None:
+        allocation = {"stocks": 1.0}
+    returns = {} if returns is None else returns
+
+    assets = list(allocation)
+    weights = np.array([allocation[asset] for asset in assets],
+                       dtype=np.float64)
+    if weights.sum() <= 0:
+        raise ValueError("allocation must put money in an investment")
+    weights = weights / weights.sum()
+
+    annualRates = [
+        np.asarray(returns.get(asset, ASSET_RETURNS.get(asset, 0.0)),
+                   dtype=np.float64)
+        for asset in assets
+    ]
+
+    #every argument is lined up into one row per scenario
+    startBalance, monthlyContribution, annualIncrease, *annualRates = (
+        np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=np.float64))
+              for value in (startBalance, monthlyContribution,
+                            annualIncrease, *annualRates))
+        )
+    )
+    months = int(round(years * 12))
+    steps = np.arange(1, months + 1)
+
+    #shapes are (scenarios, assets, months)
+    rates = monthly_rate(np.stack(annualRates, axis=1))[:, :, None]
+    contributions = contribution_schedule(
+        monthlyContribution,
+        months,
+        annualIncrease
+    )
+    perAsset = contributions[:, None, :] * weights[None, :, None]
+    growth = (1 + rates) ** steps
+
+    #B[m] = (1 + r)^m * (B[0] + sum of c[k] / (1 + r)^k for k <= m)
+    balances = growth * (
+        (startBalance[:, None] * weights)[:, :, None]
+        + np.cumsum(perAsset / growth, axis=2)
+    )
+
+    if startDate is None:
+        firstMonth = np.datetime64("today", "M")
+    else:
+        firstMonth = dateUtils.parse_dates([startDate])[0].astype(
+            "datetime64[M]"
+        )
+
+    return {
+        "assets": assets,
+        "dates": (firstMonth + steps).astype("datetime64[D]"),
+        "contributions": (
+            startBalance[:, None] + np.cumsum(contributions, axis=1)
+        ),
+        "balances": balances,
+        "total": balances.sum(axis=1)
+    }
+
+
+def graph_attributes(projection:dict[str, t.Any], scenario:int = 0,
+                        asset:str|None = None, **kwargs) -> dict[str, t.Any]:
+    """
+    graph_attributes(projection, scenario, asset, **kwargs) -> dict
+    projection: dict: result of project()
+    scenario: int: which scenario to graph
+    asset: str|None: which investment to graph. everything if None
+    **kwargs: other arguments for Graphing.set_attributes()
+
+    returns the arguments to give Graphing.set_attributes(), e.g.
+    graph.set_attributes(**graph_attributes(projection))
+    """
+    if asset is None:
+        values = projection["total"][scenario]
+    else:
+        values = projection["balances"][
+            scenario,
+            projection["assets"].index(asset)
+        ]
+
+    attributes = {
+        "independant": dateUtils.format_dates(projection["dates"]),
+        "dependant": values,
+        "xName": "Date",
+        "yName": "Balance",
+        "title": "Projected " + (asset or "savings"),
+        "xAreDates": True,
+        "pointSize": 0
+    }
+    attributes.update(kwargs)
+
+    return attributes
@@ -0,0 +1,269 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Finds subscriptions and expensive repeat purchases for the analysis tab.
+Merchants are grouped with a hash table and every statistic is worked out
+for all merchants at once, so the whole history is checked in about the
+time it takes to sort it
+"""
+
+#import needed modules
+import typing as t
+import numpy as np
+import pandas as pd
+
+#parts of bank descriptions that are not the merchant's name
+MERCHANT_NOISE:tuple[str, ...] = (
+    r"^(pos|debit card|debit|card|purchase|recurring|ach|checkcard)\b\s*",
+    r"^(sq|tst|pp|paypal|sp)\s*\*\s*",
+    r"#\s*\d+",
+    r"\b\d{3,}\b",
+    r"[^a-z0-9& ]+",
+)
+
+#usual number of days between charges of each kind of subscription
+PERIODS:dict[str, float] = {
+    "weekly": 7,
+    "every 2 weeks": 14,
+    "monthly": 30.44,
+    "every 3 months": 91.31,
+    "yearly": 365.25
+}
+
+
+def normalize_merchants(descriptions:t.Iterable[str]) -> np.ndarray:
+    """
+    normalize_merchants(descriptions) -> np.ndarray[str]
+    descriptions: iterable[str]: descriptions of transactions
+
+    removes card prefixes, store numbers and punctuation, and lowercases
+    the descriptions, so "SQ *BLUE BOTTLE #1234" and "Blue Bottle" match
+    returns the merchant of each description
+    """
+    merchants = pd.Series(np.asarray(descriptions), dtype=str).str.lower()
+
+    for pattern in MERCHANT_NOISE:
+        merchants = merchants.str.replace(pattern, " ", regex=True)
+
+    #collapse the spaces left behind
+    merchants = merchants.str.replace(r"\s+", " ", regex=True).str.strip()
+
+    return merchants.to_numpy(dtype=str)
+
+
+class MerchantIndex:
+    """
+    Hash index from each merchant to the positions of its transactions
+    """
+    def __init__(self, descriptions:t.Iterable[str]):
+        """
+        MerchantIndex(self, descriptions)
+        descriptions: iterable[str]: descriptions of transactions
+        """
+        #give every merchant a number with a hash table
+        self.codes:np.ndarray
+        self.merchants:np.ndarray
+        self.codes, self.merchants = pd.factorize(
+            normalize_merchants(descriptions)
+        )
+        self.merchants = np.asarray(self.merchants, dtype=str)
+
+        #positions grouped by merchant, and where each group starts
+        self.order:np.ndarray = np.argsort(self.codes, kind="stable")
+        self.starts:np.ndarray = np.searchsorted(
+            self.codes[self.order],
+            np.arange(len(self.merchants) + 1)
+        )
+
+        self.__lookup:dict[str, int] = {
+            merchant: code for code, merchant in enumerate(self.merchants)
+        }
+
+    def positions(self, merchant:str) -> np.ndarray:
+        """
+        MerchantIndex.positions(merchant) -> np.ndarray[int]
+        merchant: str: merchant or description to look up
+
+        returns the positions of the merchant's transactions
+        """
+        code = self.__lookup.get(normalize_merchants([merchant])[0])
+
+        if code is None:
+            return np.array([], dtype=np.int64)
+
+        return self.order[self.starts[code]:self.starts[code + 1]]
+
+
+def merchant_summary(columns:dict[str, np.ndarray],
+                        index:MerchantIndex|None = None
+                        ) -> dict[str, np.ndarray]:
+    """
+    merchant_summary(columns, index) -> dict[str, np.ndarray]
+    columns: dict[str, np.ndarray]: transactions (dates, amounts,
+        descriptions)
+    index: MerchantIndex|None: index of the descriptions. made if None
+
+    only money spent (negative amounts) is counted
+    returns one row per merchant with these columns:
+        - merchant: merchant name
+        - count: number of purchases
+        - total: total spent
+        - meanAmount, amountSpread: average amount and its coefficient of
+          variation
+        - meanInterval, intervalSpread: average days between purchases and
+          its coefficient of variation
+    """
+    if index is None:
+        index = MerchantIndex(columns["descriptions"])
+
+    dates = np.asarray(columns["dates"], dtype="datetime64[D]")
+    amounts = np.asarray(columns["amounts"], dtype=np.float64)
+
+    #only look at spending, as positive amounts
+    spent = amounts < 0
+    codes = index.codes[spent]
+    days = dates[spent].astype(np.int64)
+    costs = -amounts[spent]
+    numMerchants = len(index.merchants)
+
+    #sort by merchant, then date
+    order = np.lexsort((days, codes))
+    codes, days, costs = codes[order], days[order], costs[order]
+
+    #amount statistics for every merchant at once
+    count = np.bincount(codes, minlength=numMerchants)
+    total = np.bincount(codes, weights=costs, minlength=numMerchants)
+    squares = np.bincount(codes, weights=costs ** 2, minlength=numMerchants)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        meanAmount = total / count
+        amountSpread = (
+            np.sqrt(np.maximum(squares / count - meanAmount ** 2, 0))
+            / meanAmount
+        )
+
+    #days between purchases; the first purchase of a merchant has none.
+    #with no spending at all, no purchase has one
+    sameMerchant = np.zeros(len(codes), dtype=bool)
+    sameMerchant[1:] = codes[1:] == codes[:-1]
+    intervals = np.diff(days, prepend=0).astype(np.float64)[sameMerchant]
+    intervalCodes = codes[sameMerchant]
+
+    intervalCount = np.bincount(intervalCodes, minlength=numMerchants)
+    intervalTotal = np.bincount(intervalCodes, weights=intervals,
+                                minlength=numMerchants)
+    intervalSquares = np.bincount(intervalCodes, weights=intervals ** 2,
+                                  minlength=numMerchants)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        meanInterval = intervalTotal / intervalCount
+        intervalSpread = (
+            np.sqrt(np.maximum(
+                intervalSquares / intervalCount - meanInterval ** 2, 0
+            ))
+            / meanInterval
+        )
+
+    return {
+        "merchant": index.merchants,
+        "count": count,
+        "total": total,
+        "meanAmount": meanAmount,
+        "amountSpread": amountSpread,
+        "meanInterval": meanInterval,
+        "intervalSpread": intervalSpread
+    }
+
+
+def find_subscriptions(summary:dict[str, np.ndarray], minCount:int = 3,
+                        maxIntervalSpread:float = 0.2,
+                        maxAmountSpread:float = 0.25
+                        ) -> dict[str, np.ndarray]:
+    """
+    find_subscriptions(summary, minCount, maxIntervalSpread,
+        maxAmountSpread) -> dict[str, np.ndarray]
+    summary: dict[str, np.ndarray]: result of merchant_summary()
+    minCount: int: fewest charges that count as a subscription
+    maxIntervalSpread: float: how uneven the days between charges can be
+    maxAmountSpread: float: how much the amount charged can change
+
+    returns the rows of summary charged on a regular schedule for about
+    the same amount, with a "period" column naming the schedule, sorted
+    by total spent
+    """
+    #the schedule closest to the average days between charges
+    periodNames = np.array(list(PERIODS), dtype=str)
+    periodDays = np.array(list(PERIODS.values()))
+    meanInterval = np.nan_to_num(summary["meanInterval"], nan=-1)
+    closest = np.abs(meanInterval[:, None] - periodDays).argmin(axis=1)
+
+    #allow charges a few days early or late
+    onSchedule = (
+        np.abs(meanInterval - periodDays[closest])
+        <= np.maximum(2, periodDays[closest] * 0.1)
+    )
+
+    keep = (
+        (summary["count"] >= minCount)
+        & onSchedule
+        & (np.nan_to_num(summary["intervalSpread"], nan=1)
+           <= maxIntervalSpread)
+        & (np.nan_to_num(summary["amountSpread"], nan=1) <= maxAmountSpread)
+    )
+
+    result = {name: column[keep] for name, column in summary.items()}
+    result["period"] = periodNames[closest[keep]]
+
+    order = np.argsort(-result["total"], kind="stable")
+    return {name: column[order] for name, column in result.items()}
+
+
+def find_expensive_repeats(summary:dict[str, np.ndarray], minCount:int = 2,
+                            top:int = 10,
+                            subscriptions:dict[str, np.ndarray]|None = None
+                            ) -> dict[str, np.ndarray]:
+    """
+    find_expensive_repeats(summary, minCount, top, subscriptions)
+    summary: dict[str, np.ndarray]: result of merchant_summary()
+    minCount: int: fewest purchases that count as a repeat
+    top: int: number of merchants to return
+    subscriptions: dict|None: result of find_subscriptions(). found if None
+
+    returns the merchants bought from more than once that are not
+    subscriptions, most money spent first
+    """
+    if subscriptions is None:
+        subscriptions = find_subscriptions(summary)
+
+    keep = (
+        (summary["count"] >= minCount)
+        & ~np.isin(summary["merchant"], subscriptions["merchant"])
+    )
+
+    result = {name: column[keep] for name, column in summary.items()}
+
+    order = np.argsort(-result["total"], kind="stable")[:top]
+    return {name: column[order] for name, column in result.items()}
+
+
+def analyze_spending(columns:dict[str, np.ndarray], top:int = 10
+                        ) -> dict[str, dict[str, np.ndarray]]:
+    """
+    analyze_spending(columns, top) -> dict[str, dict[str, np.ndarray]]
+    columns: dict[str, np.ndarray]: transactions (dates, amounts,
+        descriptions)
+    top: int: number of expensive repeats to return
+
+    returns the merchant summary, the subscriptions and the most
+    expensive repeat purchases
+    """
+    summary = merchant_summary(columns)
+    subscriptions = find_subscriptions(summary)
+
+    return {
+        "summary": summary,
+        "subscriptions": subscriptions,
+        "expensiveRepeats": find_expensive_repeats(
+            summary,
+            top=top,
+            subscriptions=subscriptions
+        )
+    }
@@ -0,0 +1,404 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Saves budget data in a SQLite database.
+Transactions are indexed by date, category and merchant so a tab can load
+only the dates it shows instead of the whole history
+"""
+
+#import needed modules
+import sqlite3
+import threading
+import typing as t
+import numpy as np
+
+import budgetStorage
+
+#the table and its indexes.
+#dates are stored as the number of days since 01/01/1970
+CREATE_TABLE:str = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    date INTEGER NOT NULL,
+    amount REAL NOT NULL,
+    category TEXT NOT NULL,
+    merchant TEXT NOT NULL,
+    description TEXT NOT NULL
+)
+"""
+CREATE_INDEXES:tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS transactionDate ON transactions (date)",
+    "CREATE INDEX IF NOT EXISTS transactionCategory "
+    + "ON transactions (category, date)",
+    "CREATE INDEX IF NOT EXISTS transactionMerchant "
+    + "ON transactions (merchant, date)",
+)
+
+#every statement is written once with ? placeholders so sqlite3 keeps it
+#compiled in its statement cache
+INSERT:str = (
+    "INSERT INTO transactions (date, amount, category, merchant, description)"
+    + " VALUES (?, ?, ?, ?, ?)"
+)
+SELECT_WINDOW:str = (
+    "SELECT id, date, amount, category, description FROM transactions"
+    + " WHERE date BETWEEN ? AND ? ORDER BY id"
+)
+SELECT_CATEGORY_WINDOW:str = (
+    "SELECT id, date, amount, category, description FROM transactions"
+    + " WHERE category = ? AND date BETWEEN ? AND ? ORDER BY id"
+)
+SELECT_DAILY_TOTALS:str = (
+    "SELECT date, category, SUM(amount) FROM transactions"
+    + " WHERE date BETWEEN ? AND ? GROUP BY date, category ORDER BY date"
+)
+SELECT_BALANCE_BEFORE:str = (
+    "SELECT COALESCE(SUM(amount), 0) FROM transactions WHERE date < ?"
+)
+SELECT_ROW_ID:str = "SELECT id FROM transactions ORDER BY id LIMIT 1 OFFSET ?"
+DELETE_ROW:str = "DELETE FROM transactions WHERE id = ?"
+
+#the database column of each transaction column
+DATABASE_COLUMNS:dict[str, str] = {
+    "dates": "date",
+    "amounts": "amount",
+    "categories": "category",
+    "descriptions": "description"
+}
+
+#the earliest and latest day that can be asked for
+FIRST_DAY:int = -(2 ** 62)
+LAST_DAY:int = 2 ** 62
+
+
+def merchant_name(description:str) -> str:
+    """
+    merchant_name(description) -> str
+    description: str: description of a transaction
+
+    returns the description in lowercase with extra spaces removed, so the
+    same merchant is always stored the same way
+    """
+    return " ".join(str(description).lower().split())
+
+
+def to_day(date:t.Any) -> int:
+    """
+    to_day(date) -> int
+    date: str|np.datetime64: date in MM/DD/YYYY or YYYY-MM-DD format
+
+    returns the number of days since 01/01/1970
+    """
+    return int(
+        budgetStorage.column_value("dates", date)[0].astype(np.int64)
+    )
+
+
+class SqliteBudgetStore:
+    """
+    Saves and loads the budget kept in a SQLite database.
+    Has the same methods as budgetStorage.BudgetStore, plus query() to load
+    only some dates
+    """
+
+    #tabs can ask this store for a range of dates
+    queryable:bool = True
+
+    def __init__(self, path:str):
+        """
+        SqliteBudgetStore(self, path)
+        path: str: database file the budget is saved in
+        """
+        self.path:str = path
+
+        #the connection can be used from a worker thread, e.g. by an
+        #import. only one thread uses it at a time so transactions made on
+        #different threads do not mix
+        self.connection:sqlite3.Connection = sqlite3.connect(
+            path,
+            check_same_thread=False
+        )
+        self.__lock:threading.Lock = threading.Lock()
+
+        #write-ahead logging lets the database be read while it is written
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        with self.connection:
+            self.connection.execute(CREATE_TABLE)
+            for statement in CREATE_INDEXES:
+                self.connection.execute(statement)
+
+    def exists(self) -> bool:
+        """
+        SqliteBudgetStore.exists() -> bool
+        returns True if the budget has any transactions
+        """
+        with self.__lock:
+            return self.connection.execute(
+                "SELECT EXISTS (SELECT 1 FROM transactions)"
+            ).fetchone()[0] == 1
+
+    def save(self, columns:dict[str, np.ndarray]) -> None:
+        """
+        SqliteBudgetStore.save(columns)
+        columns: dict[str, np.ndarray]: name and data of each column
+
+        replaces every transaction in the database
+        """
+        with self.__lock, self.connection:
+            self.connection.execute("DELETE FROM transactions")
+            self.connection.executemany(INSERT, self.__rows(columns))
+
+    def append_columns(self, columns:dict[str, np.ndarray]) -> None:
+        """
+        SqliteBudgetStore.append_columns(columns)
+        columns: dict[str, np.ndarray]: transactions to add
+
+        adds every transaction in one database transaction
+        """
+        with self.__lock, self.connection:
+            self.connection.executemany(INSERT, self.__rows(columns))
+
+    def __rows(self, columns:dict[str, np.ndarray]) -> t.Iterator[tuple]:
+        """
+        SqliteBudgetStore.__rows(columns) -> iterator[tuple]
+        columns: dict[str, np.ndarray]: name and data of each column
+
+        returns the values of each row in the order INSERT takes them
+        """
+        return zip(
+            np.asarray(columns["dates"], dtype="datetime64[D]")
+            .astype(np.int64).tolist(),
+            np.asarray(columns["amounts"], dtype=np.float64).tolist(),
+            map(str, columns["categories"]),
+            map(merchant_name, columns["descriptions"]),
+            map(str, columns["descriptions"])
+        )
+
+    def append(self, records:t.Iterable[dict]) -> None:
+        """
+        SqliteBudgetStore.append(records)
+        records: iterable[dict]: edits to save. see
+            budgetStorage.apply_record() for their format
+
+        makes the edits in one database transaction
+        """
+        with self.__lock, self.connection:
+            for record in records:
+                self.__apply(record)
+
+    def needs_compaction(self, minimum:int|None = None) -> bool:
+        """
+        SqliteBudgetStore.needs_compaction(minimum) -> bool
+        minimum: int|None: not used
+        SQLite keeps its own log; returns False
+        """
+        return False
+
+    def compact(self, columns:dict[str, np.ndarray] = None,
+                    background:bool = True) -> None:
+        """
+        SqliteBudgetStore.compact(columns, background)
+        copies the write-ahead log into the database file
+        """
+        with self.__lock:
+            self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def wait_for_compaction(self) -> None:
+        """
+        SqliteBudgetStore.wait_for_compaction()
+        compaction is never done in the background; does nothing
+        """
+
+    def load(self) -> dict[str, np.ndarray]:
+        """
+        SqliteBudgetStore.load() -> dict[str, np.ndarray]
+        returns every transaction
+        """
+        return self.query()
+
+    def query(self, start:t.Any = None, end:t.Any = None,
+                category:str|None = None) -> dict[str, np.ndarray]:
+        """
+        SqliteBudgetStore.query(start, end, category)
+        start: str|np.datetime64|None: first date to load. None for no limit
+        end: str|np.datetime64|None: last date to load. None for no limit
+        category: str|None: only load this category. None for every category
+
+        returns the transactions between start and end, in the order added,
+        with the database id of each one in "ids". Edits and deletes of
+        the rows returned are made by id
+        """
+        firstDay = FIRST_DAY if start is None else to_day(start)
+        lastDay = LAST_DAY if end is None else to_day(end)
+
+        #the indexes find the first date, so only the window is read
+        with self.__lock:
+            if category is None:
+                cursor = self.connection.execute(
+                    SELECT_WINDOW,
+                    (firstDay, lastDay)
+                )
+            else:
+                cursor = self.connection.execute(
+                    SELECT_CATEGORY_WINDOW,
+                    (category, firstDay, lastDay)
+                )
+
+            rows = cursor.fetchall()
+
+        if not rows:
+            columns = budgetStorage.empty_transactions()
+            columns["ids"] = np.array([], dtype=np.int64)
+            return columns
+
+        ids, dates, amounts, categories, descriptions = zip(*rows)
+
+        return {
+            "ids": np.array(ids, dtype=np.int64),
+            "dates": np.array(dates, dtype=np.int64).astype("datetime64[D]"),
+            "amounts": np.array(amounts, dtype=np.float64),
+            "categories": np.array(categories, dtype=str),
+            "descriptions": np.array(descriptions, dtype=str)
+        }
+
+    def daily_totals(self, start:t.Any = None,
+                        end:t.Any = None) -> dict[str, np.ndarray]:
+        """
+        SqliteBudgetStore.daily_totals(start, end) -> dict[str, np.ndarray]
+        start: str|np.datetime64|None: first date to total. None for no limit
+        end: str|np.datetime64|None: last date to total. None for no limit
+
+        sums the transactions in the database, so only one row for each day
+        and category is loaded instead of every transaction
+        returns the dates, amounts and categories of the sums, by date
+        """
+        firstDay = FIRST_DAY if start is None else to_day(start)
+        lastDay = LAST_DAY if end is None else to_day(end)
+
+        with self.__lock:
+            rows = self.connection.execute(
+                SELECT_DAILY_TOTALS,
+                (firstDay, lastDay)
+            ).fetchall()
+
+        if not rows:
+            columns = budgetStorage.empty_transactions()
+            del columns["descriptions"]
+            return columns
+
+        dates, categories, amounts = zip(*rows)
+
+        return {
+            "dates": np.array(dates, dtype=np.int64).astype("datetime64[D]"),
+            "amounts": np.array(amounts, dtype=np.float64),
+            "categories": np.array(categories, dtype=str)
+        }
+
+    def balance_before(self, date:t.Any) -> float:
+        """
+        SqliteBudgetStore.balance_before(date) -> float
+        date: str|np.datetime64: date in MM/DD/YYYY or YYYY-MM-DD format
+
+        returns the total of every transaction before date
+        """
+        day = to_day(date)
+
+        with self.__lock:
+            return float(self.connection.execute(
+                SELECT_BALANCE_BEFORE,
+                (day,)
+            ).fetchone()[0])
+
+    def close(self) -> None:
+        """
+        SqliteBudgetStore.close()
+        closes the database
+        """
+        with self.__lock:
+            self.connection.close()
+
+    def __apply(self, record:dict) -> None:
+        """
+        SqliteBudgetStore.__apply(record)
+        record: dict: one edit. see budgetStorage.apply_record()
+
+        makes the edit in the database
+        """
+        match record["op"]:
+            case "add":
+                values = record["values"]
+                self.connection.execute(INSERT, (
+                    to_day(values.get("dates", "1970-01-01")),
+                    float(values.get("amounts", 0)),
+                    str(values.get("categories", "")),
+                    merchant_name(values.get("descriptions", "")),
+                    str(values.get("descriptions", ""))
+                ))
+
+            case "edit":
+                rowId = self.__record_id(record)
+                column = DATABASE_COLUMNS[record["column"]]
+                value = record["value"]
+
+                if column == "date":
+                    value = to_day(value)
+                elif column == "amount":
+                    value = float(value)
+                else:
+                    value = str(value)
+
+                #the column name comes from DATABASE_COLUMNS, never the user
+                cursor = self.connection.execute(
+                    f"UPDATE transactions SET {column} = ? WHERE id = ?",
+                    (value, rowId)
+                )
+                if cursor.rowcount == 0:
+                    raise IndexError(f"no transaction with id {rowId}")
+
+                #keep the merchant in step with the description
+                if column == "description":
+                    self.connection.execute(
+                        "UPDATE transactions SET merchant = ? WHERE id = ?",
+                        (merchant_name(value), rowId)
+                    )
+
+            case "delete":
+                rowId = self.__record_id(record)
+                cursor = self.connection.execute(DELETE_ROW, (rowId,))
+                if cursor.rowcount == 0:
+                    raise IndexError(f"no transaction with id {rowId}")
+
+            case _:
+                raise ValueError(f"unknown journal record: {record}")
+
+    def __record_id(self, record:dict) -> int:
+        """
+        SqliteBudgetStore.__record_id(record) -> int
+        record: dict: edit or delete record
+
+        records made from rows returned by query() have the database "id"
+        of the row, which is found with the primary key. Records with only
+        a "row" position are looked up by counting rows
+        returns the database id of the transaction
+        """
+        if "id" in record:
+            return int(record["id"])
+
+        return self.__row_id(record["row"])
+
+    def __row_id(self, row:int) -> int:
+        """
+        SqliteBudgetStore.__row_id(row) -> int
+        row: int: position of the transaction, in the order added
+
+        raises IndexError if there is no transaction at row
+        returns the database id of the transaction
+        """
+        result = self.connection.execute(SELECT_ROW_ID, (row,)).fetchone()
+
+        if result is None:
+            raise IndexError(f"no transaction at row {row}")
+
+        return result[0]
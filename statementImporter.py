@@ -0,0 +1,342 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Imports bank statements (CSV or OFX exports).
+Statements are read a fixed number of rows at a time, so memory stays the
+same however big the export is. Each chunk is returned as transaction
+columns with the dates already converted to datetime64
+"""
+
+#import needed modules
+import os
+import re
+import typing as t
+import warnings
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+#number of rows read at a time
+CHUNK_SIZE:int = 50_000
+
+#header names banks use for each column, in lowercase
+DATE_NAMES:tuple[str, ...] = (
+    "date", "transaction date", "posted date", "posting date", "trans. date"
+)
+AMOUNT_NAMES:tuple[str, ...] = ("amount", "transaction amount")
+DEBIT_NAMES:tuple[str, ...] = ("debit", "withdrawal", "withdrawals")
+CREDIT_NAMES:tuple[str, ...] = ("credit", "deposit", "deposits")
+DESCRIPTION_NAMES:tuple[str, ...] = (
+    "description", "payee", "name", "memo", "details"
+)
+CATEGORY_NAMES:tuple[str, ...] = ("category", "type")
+
+#number of dates looked at to work out the date format of a CSV file
+DATE_SAMPLE_SIZE:int = 100
+
+#matches one <TAG>value pair in an OFX file
+OFX_TAG:re.Pattern = re.compile(r"<(\w+)>([^<\r\n]*)")
+
+#matches one whole transaction in an OFX file
+OFX_TRANSACTION:re.Pattern = re.compile(
+    r"<STMTTRN>(.*?)</STMTTRN>",
+    re.IGNORECASE | re.DOTALL
+)
+
+#number of bytes of an OFX file read at a time. some banks write the
+#whole file on one line, so it is not read by line
+OFX_BLOCK_SIZE:int = 1 << 16
+
+
+def find_column(header:t.Iterable[str],
+                    names:tuple[str, ...]) -> str|None:
+    """
+    find_column(header, names) -> str|None
+    header: iterable[str]: column names in the statement
+    names: tuple[str, ...]: names the column could have, in lowercase
+
+    returns the first column in header with one of the names, or None
+    """
+    for column in header:
+        if column.strip().lower() in names:
+            return column
+
+    return None
+
+
+def to_amounts(values:pd.Series) -> np.ndarray:
+    """
+    to_amounts(values) -> np.ndarray[float]
+    values: pandas.Series: amounts as numbers or text like "$1,234.56" or
+        "(12.00)"
+
+    returns the amounts as floats. amounts that cannot be read are NaN
+    """
+    if not pd.api.types.is_numeric_dtype(values):
+        values = (
+            values.astype(str)
+            .str.replace(r"[$,\s]", "", regex=True)
+            .str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+        )
+
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+
+
+def text_column(chunk:pd.DataFrame, column:str|None) -> np.ndarray:
+    """
+    text_column(chunk, column) -> np.ndarray[str]
+    chunk: pandas.DataFrame: rows read from a statement
+    column: str|None: name of the column. None if the statement does not
+        have it
+
+    returns the column as text with blanks for missing values
+    """
+    if column is None:
+        return np.full(len(chunk), "")
+
+    return chunk[column].fillna("").str.strip().to_numpy(dtype=str)
+
+
+def guess_date_format(dates:pd.Series) -> str|None:
+    """
+    guess_date_format(dates) -> str|None
+    dates: pandas.Series: dates as text
+
+    tries the formats the first dates look like, month first and day
+    first, on up to DATE_SAMPLE_SIZE dates
+    returns the format that reads the most dates, or None if none can be
+    read
+    """
+    sample = dates.dropna().astype(str).str.strip()
+    sample = sample[sample != ""].head(DATE_SAMPLE_SIZE)
+
+    #the formats each date could be in. ties go to the first one found,
+    #so month first wins when both read every date
+    formats:list[str] = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for dayfirst in (False, True):
+            for date in sample.head(10):
+                guess = guess_datetime_format(date, dayfirst=dayfirst)
+                if guess is not None and guess not in formats:
+                    formats.append(guess)
+
+    bestFormat, bestCount = None, 0
+    for dateFormat in formats:
+        count = pd.to_datetime(
+            sample,
+            format=dateFormat,
+            errors="coerce"
+        ).notna().sum()
+
+        if count > bestCount:
+            bestFormat, bestCount = dateFormat, count
+
+    return bestFormat
+
+
+def read_csv_chunks(path:str, chunkSize:int = CHUNK_SIZE,
+                        dateFormat:str|None = None,
+                        onProgress:t.Callable[[int, int], None]|None = None
+                        ) -> t.Iterator[dict[str, np.ndarray]]:
+    """
+    read_csv_chunks(path, chunkSize, dateFormat, onProgress)
+    path: str: CSV file exported from a bank
+    chunkSize: int: number of rows read at a time
+    dateFormat: str|None: strftime format of the dates, e.g. "%m/%d/%Y".
+        None works the format out from the first chunk and uses it for
+        every chunk
+    onProgress: function(bytesRead, totalBytes): called after each chunk
+
+    raises ValueError if the file has no date or amount column
+    returns an iterator of transaction columns, one chunk at a time.
+    rows without a readable date or amount are skipped
+    """
+    totalBytes = os.path.getsize(path)
+
+    #find the columns from the header
+    header = list(pd.read_csv(path, nrows=0).columns)
+    dateColumn = find_column(header, DATE_NAMES)
+    amountColumn = find_column(header, AMOUNT_NAMES)
+    debitColumn = find_column(header, DEBIT_NAMES)
+    creditColumn = find_column(header, CREDIT_NAMES)
+    descriptionColumn = find_column(header, DESCRIPTION_NAMES)
+    categoryColumn = find_column(header, CATEGORY_NAMES)
+
+    if dateColumn is None:
+        raise ValueError(f"'{path}' has no date column. Columns: {header}")
+    if amountColumn is None and debitColumn is None and creditColumn is None:
+        raise ValueError(f"'{path}' has no amount column. Columns: {header}")
+
+    #only read the columns that are used
+    usedColumns = [
+        column for column in (dateColumn, amountColumn, debitColumn,
+                              creditColumn, descriptionColumn, categoryColumn)
+        if column is not None
+    ]
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as file:
+        for chunk in pd.read_csv(file, usecols=usedColumns,
+                                    chunksize=chunkSize, dtype=str):
+            #work the format out once instead of guessing each date.
+            #dates no format fits are read one at a time
+            if dateFormat is None:
+                dateFormat = guess_date_format(chunk[dateColumn]) or "mixed"
+
+            #convert every date in the chunk at once
+            dates = pd.to_datetime(
+                chunk[dateColumn],
+                format=dateFormat,
+                errors="coerce"
+            ).to_numpy().astype("datetime64[D]")
+
+            #money out is negative, money in is positive
+            if amountColumn is not None:
+                amounts = to_amounts(chunk[amountColumn])
+            else:
+                amounts = np.zeros(len(chunk))
+                if debitColumn is not None:
+                    debits = to_amounts(chunk[debitColumn])
+                    amounts -= np.nan_to_num(np.abs(debits))
+                if creditColumn is not None:
+                    credits = to_amounts(chunk[creditColumn])
+                    amounts += np.nan_to_num(credits)
+
+            columns = {
+                "dates": dates,
+                "amounts": amounts,
+                "categories": text_column(chunk, categoryColumn),
+                "descriptions": text_column(chunk, descriptionColumn)
+            }
+
+            #skip rows that could not be read
+            keep = ~np.isnat(dates) & ~np.isnan(amounts)
+            yield {name: column[keep] for name, column in columns.items()}
+
+            if onProgress:
+                onProgress(min(file.tell(), totalBytes), totalBytes)
+
+
+def read_ofx_chunks(path:str, chunkSize:int = CHUNK_SIZE,
+                        onProgress:t.Callable[[int, int], None]|None = None
+                        ) -> t.Iterator[dict[str, np.ndarray]]:
+    """
+    read_ofx_chunks(path, chunkSize, onProgress)
+    path: str: OFX or QFX file exported from a bank
+    chunkSize: int: number of transactions returned at a time
+    onProgress: function(bytesRead, totalBytes): called after each chunk
+
+    reads OFX_BLOCK_SIZE bytes at a time and splits them on the
+    <STMTTRN> tags, so only one block and one unfinished transaction are
+    kept whatever the lines look like
+    returns an iterator of transaction columns, one chunk at a time
+    """
+    totalBytes = os.path.getsize(path)
+
+    #values of the transactions in the current chunk
+    dates:list[str] = []
+    amounts:list[str] = []
+    categories:list[str] = []
+    descriptions:list[str] = []
+
+    #text read but not handled yet: the start of the next transaction
+    text = ""
+
+    def make_chunk() -> dict[str, np.ndarray]:
+        """
+        make_chunk() -> dict[str, np.ndarray]
+        returns the transactions read so far as columns
+        """
+        #OFX dates start with YYYYMMDD
+        days = pd.to_datetime(
+            pd.Series(dates, dtype=str).str[:8],
+            format="%Y%m%d",
+            errors="coerce"
+        ).to_numpy().astype("datetime64[D]")
+        values = to_amounts(pd.Series(amounts, dtype=object))
+
+        columns = {
+            "dates": days,
+            "amounts": values,
+            "categories": np.array(categories, dtype=str),
+            "descriptions": np.array(descriptions, dtype=str)
+        }
+
+        keep = ~np.isnat(days) & ~np.isnan(values)
+        return {name: column[keep] for name, column in columns.items()}
+
+    with open(path, "rb") as file:
+        while block := file.read(OFX_BLOCK_SIZE):
+            #latin-1 turns every byte into one character, so a block never
+            #ends part way through a character
+            text += block.decode("latin-1")
+
+            end = 0
+            for match in OFX_TRANSACTION.finditer(text):
+                end = match.end()
+
+                #the first value of each tag
+                transaction:dict[str, str] = {}
+                for tag, value in OFX_TAG.findall(match.group(1)):
+                    if value.strip():
+                        transaction.setdefault(tag.upper(), value.strip())
+
+                dates.append(transaction.get("DTPOSTED", ""))
+                amounts.append(transaction.get("TRNAMT", ""))
+                categories.append(transaction.get("TRNTYPE", ""))
+                descriptions.append(
+                    transaction.get("NAME", transaction.get("MEMO", ""))
+                )
+
+                #hand the chunk back once it is full
+                if len(dates) >= chunkSize:
+                    yield make_chunk()
+                    dates, amounts, categories, descriptions = [], [], [], []
+
+                    if onProgress:
+                        onProgress(file.tell(), totalBytes)
+
+            #keep the unfinished transaction. with none started, keep just
+            #enough for a <STMTTRN> tag cut in half by the block
+            start = text.upper().find("<STMTTRN>", end)
+            if start < 0:
+                start = max(end, len(text) - len("<STMTTRN>"))
+            text = text[start:]
+
+    #hand back the last chunk
+    if dates:
+        yield make_chunk()
+
+    if onProgress:
+        onProgress(totalBytes, totalBytes)
+
+
+def import_statement(path:str,
+                        onChunk:t.Callable[[dict[str, np.ndarray]], None],
+                        chunkSize:int = CHUNK_SIZE,
+                        dateFormat:str|None = None,
+                        onProgress:t.Callable[[int, int], None]|None = None
+                        ) -> int:
+    """
+    import_statement(path, onChunk, chunkSize, dateFormat, onProgress) -> int
+    path: str: CSV, OFX or QFX file exported from a bank
+    onChunk: function(columns): saves one chunk of transactions
+    chunkSize: int: number of rows read at a time
+    dateFormat: str|None: strftime format of CSV dates. None works the
+        format out from the file
+    onProgress: function(bytesRead, totalBytes): called after each chunk
+
+    reads the statement one chunk at a time and hands each chunk to onChunk
+    returns the number of transactions imported
+    """
+    if path.lower().endswith((".ofx", ".qfx")):
+        chunks = read_ofx_chunks(path, chunkSize, onProgress)
+    else:
+        chunks = read_csv_chunks(path, chunkSize, dateFormat, onProgress)
+
+    imported = 0
+    for chunk in chunks:
+        onChunk(chunk)
+        imported += len(chunk["dates"])
+
+    return imported
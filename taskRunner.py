@@ -0,0 +1,238 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Runs slow work (imports, totals, projections) away from the Tkinter thread.
+Results are handed back through a queue that the Tkinter thread checks with
+after(), so callbacks always run on the Tkinter thread
+"""
+
+#import needed modules
+import queue
+import tkinter as tk
+import typing as t
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """
+    Raised inside a task when it reports progress after being cancelled
+    """
+
+
+class Task:
+    """
+    One piece of work given to a TaskRunner
+    """
+    def __init__(self, runner:"TaskRunner", group:str|None,
+                    onDone:t.Callable[[t.Any], None]|None,
+                    onError:t.Callable[[BaseException], None]|None,
+                    onProgress:t.Callable[..., None]|None):
+        """
+        Task(self, runner, group, onDone, onError, onProgress)
+        runner: TaskRunner: runner the task was given to
+        group: str|None: name used to cancel tasks together
+        onDone: function(result): called with the task's result
+        onError: function(error): called if the task raises an error
+        onProgress: function(*args): called each time the task reports
+        """
+        self.runner:TaskRunner = runner
+        self.group:str|None = group
+        self.onDone = onDone
+        self.onError = onError
+        self.onProgress = onProgress
+        self.future:Future|None = None
+        self.cancelled:bool = False
+
+    def cancel(self) -> None:
+        """
+        Task.cancel()
+        stops the task if it has not started. A running task is stopped the
+        next time it reports progress. Its callbacks are never called
+        """
+        self.cancelled = True
+
+        if self.future is not None:
+            self.future.cancel()
+
+    def report(self, *args) -> None:
+        """
+        Task.report(*args)
+        *args: values passed to onProgress on the Tkinter thread
+
+        called from inside the task to report progress
+        raises TaskCancelled if the task was cancelled
+        """
+        if self.cancelled:
+            raise TaskCancelled()
+
+        self.runner.post(self, "progress", args)
+
+
+class TaskRunner:
+    """
+    Runs functions on a pool of worker threads or processes and calls their
+    callbacks back on the Tkinter thread
+    """
+    def __init__(self, master:tk.Misc, maxWorkers:int|None = None,
+                    useProcesses:bool = False, pollInterval:int = 50):
+        """
+        TaskRunner(self, master, maxWorkers, useProcesses, pollInterval)
+        master: tkinter widget: widget whose after() checks for results
+        maxWorkers: int|None: number of workers. None lets
+            concurrent.futures choose
+        useProcesses: bool: run tasks in processes instead of threads.
+            Use for heavy number crunching; tasks and their arguments must
+            be picklable and cannot report progress
+        pollInterval: int: ms between checks for results
+        """
+        self.master:tk.Misc = master
+        self.useProcesses:bool = useProcesses
+        self.pollInterval:int = pollInterval
+
+        self.executor:Executor = (
+            ProcessPoolExecutor(maxWorkers) if useProcesses
+            else ThreadPoolExecutor(maxWorkers)
+        )
+
+        #results and progress waiting to be handed to the Tkinter thread
+        self.__results:queue.Queue = queue.Queue()
+
+        #tasks that have not finished and the id of the scheduled check
+        self.__tasks:set[Task] = set()
+        self.__pollJob:str|None = None
+
+    def submit(self, function:t.Callable, *args,
+                onDone:t.Callable[[t.Any], None]|None = None,
+                onError:t.Callable[[BaseException], None]|None = None,
+                onProgress:t.Callable[..., None]|None = None,
+                group:str|None = None, **kwargs) -> Task:
+        """
+        TaskRunner.submit(function, *args, onDone, onError, onProgress,
+            group, **kwargs) -> Task
+        function: callable: work to run on a worker
+        *args, **kwargs: arguments for function
+        onDone: function(result): called with the result
+        onError: function(error): called if function raises an error.
+            By default the error is printed
+        onProgress: function(*args): called each time the task reports.
+            function is given the keyword argument onProgress to report with
+        group: str|None: name used to cancel tasks together
+
+        every callback is called on the Tkinter thread
+        returns the Task
+        """
+        task = Task(self, group, onDone, onError, onProgress)
+
+        if onProgress is not None:
+            if self.useProcesses:
+                raise ValueError("tasks run in processes cannot report progress")
+
+            kwargs["onProgress"] = task.report
+
+        task.future = self.executor.submit(function, *args, **kwargs)
+        task.future.add_done_callback(
+            lambda future: self.post(task, "done", future)
+        )
+
+        self.__tasks.add(task)
+        self.__schedule_poll()
+
+        return task
+
+    def post(self, task:Task, kind:str, value:t.Any) -> None:
+        """
+        TaskRunner.post(task, kind, value)
+        task: Task: task the message is for
+        kind: str: "progress" or "done"
+        value: any: progress arguments or the finished Future
+
+        hands a message to the Tkinter thread. safe to call from any thread
+        """
+        self.__results.put((task, kind, value))
+
+    def cancel_group(self, group:str) -> None:
+        """
+        TaskRunner.cancel_group(group)
+        group: str: name the tasks were submitted with
+
+        cancels every unfinished task in the group
+        """
+        for task in list(self.__tasks):
+            if task.group == group:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        """
+        TaskRunner.shutdown()
+        cancels every task and stops the workers
+        """
+        for task in list(self.__tasks):
+            task.cancel()
+
+        if self.__pollJob is not None:
+            self.master.after_cancel(self.__pollJob)
+            self.__pollJob = None
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def __schedule_poll(self) -> None:
+        """
+        TaskRunner.__schedule_poll()
+        checks for results after pollInterval ms, if a check is not already
+        waiting
+        """
+        if self.__pollJob is None:
+            self.__pollJob = self.master.after(self.pollInterval, self.__poll)
+
+    def __call_back(self, callback:t.Callable, *args) -> None:
+        """
+        TaskRunner.__call_back(callback, *args)
+        callback: function: onDone, onError or onProgress of a task
+        args: any: values passed to callback
+
+        calls callback. an error in it is printed instead of raised, so the
+        other messages are still handled and polling does not stop
+        """
+        try:
+            callback(*args)
+        except Exception as error:
+            print(f"ERROR: task callback failed: {error!r}")
+
+    def __poll(self) -> None:
+        """
+        TaskRunner.__poll()
+        calls the callbacks of every waiting message on the Tkinter thread
+        """
+        self.__pollJob = None
+
+        while True:
+            try:
+                task, kind, value = self.__results.get_nowait()
+            except queue.Empty:
+                break
+
+            #cancelled tasks do not call back
+            if kind == "progress":
+                if not task.cancelled and task.onProgress:
+                    self.__call_back(task.onProgress, *value)
+                continue
+
+            self.__tasks.discard(task)
+            if task.cancelled or value.cancelled():
+                continue
+
+            error = value.exception()
+            if error is None:
+                if task.onDone:
+                    self.__call_back(task.onDone, value.result())
+            elif isinstance(error, TaskCancelled):
+                continue
+            elif task.onError:
+                self.__call_back(task.onError, error)
+            else:
+                print(f"ERROR: background task failed: {error!r}")
+
+        #keep checking while tasks are running
+        if self.__tasks:
+            self.__schedule_poll()
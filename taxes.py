@@ -0,0 +1,233 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Works out income tax for the taxes tab.
+Each bracket table is turned into sorted arrays once: the lowest income of
+every bracket, its rate, and the tax owed on every bracket below it. Tax
+for any number of incomes is then one searchsorted() and one multiply, so
+what-if sweeps over thousands of incomes can be graphed right away
+"""
+
+#import needed modules
+import json
+import typing as t
+from functools import lru_cache
+import numpy as np
+
+
+#2025 US federal income tax: the lowest taxable income of each bracket
+#and its rate, and the standard deduction of each filing status
+TAX_TABLES:dict[str, dict[str, t.Any]] = {
+    "single": {
+        "deduction": 15750,
+        "brackets": [
+            [0, 0.10], [11925, 0.12], [48475, 0.22], [103350, 0.24],
+            [197300, 0.32], [250525, 0.35], [626350, 0.37]
+        ]
+    },
+    "married": {
+        "deduction": 31500,
+        "brackets": [
+            [0, 0.10], [23850, 0.12], [96950, 0.22], [206700, 0.24],
+            [394600, 0.32], [501050, 0.35], [751600, 0.37]
+        ]
+    },
+    "head of household": {
+        "deduction": 23625,
+        "brackets": [
+            [0, 0.10], [17000, 0.12], [64850, 0.22], [103350, 0.24],
+            [197300, 0.32], [250500, 0.35], [626350, 0.37]
+        ]
+    }
+}
+
+
+class TaxTable:
+    """
+    Tax brackets and deduction of one filing status as sorted arrays
+    """
+    def __init__(self, brackets:t.Iterable[tuple[float, float]],
+                    deduction:float = 0.0):
+        """
+        TaxTable(self, brackets, deduction)
+        brackets: iterable[tuple[float, float]]: lowest taxable income of
+            each bracket and its rate, e.g. [(0, 0.10), (11925, 0.12)]
+        deduction: float: amount taken off income before it is taxed
+        """
+        brackets = np.array(sorted(brackets), dtype=np.float64)
+        if len(brackets) == 0 or brackets[0, 0] != 0:
+            raise ValueError("the first tax bracket must start at 0")
+
+        self.deduction:float = float(deduction)
+        self.thresholds:np.ndarray = brackets[:, 0]
+        self.rates:np.ndarray = brackets[:, 1]
+
+        #tax owed on all of every bracket below each one
+        self.baseTax:np.ndarray = np.concatenate((
+            [0.0],
+            np.cumsum(np.diff(self.thresholds) * self.rates[:-1])
+        ))
+
+    def taxable_income(self, incomes:t.Any,
+                        preTax:t.Any = 0.0) -> np.ndarray:
+        """
+        TaxTable.taxable_income(self, incomes, preTax) -> np.ndarray
+        incomes: float|array: yearly incomes
+        preTax: float|array: money taken out before tax, e.g. 401k
+            contributions
+
+        returns the income left after deductions, never below 0
+        """
+        return np.maximum(
+            np.asarray(incomes, dtype=np.float64)
+            - np.asarray(preTax, dtype=np.float64)
+            - self.deduction,
+            0
+        )
+
+    def bracket(self, incomes:t.Any, preTax:t.Any = 0.0) -> np.ndarray:
+        """
+        TaxTable.bracket(self, incomes, preTax) -> np.ndarray[int]
+        returns the index of the bracket each income's last dollar is in
+        """
+        return np.searchsorted(
+            self.thresholds,
+            self.taxable_income(incomes, preTax),
+            side="right"
+        ) - 1
+
+    def liability(self, incomes:t.Any, preTax:t.Any = 0.0) -> np.ndarray:
+        """
+        TaxTable.liability(self, incomes, preTax) -> np.ndarray
+        incomes: float|array: yearly incomes
+        preTax: float|array: money taken out before tax
+
+        returns the tax owed on each income, all incomes at once
+        """
+        taxable = self.taxable_income(incomes, preTax)
+        bracket = np.searchsorted(self.thresholds, taxable, side="right") - 1
+
+        return (
+            self.baseTax[bracket]
+            + (taxable - self.thresholds[bracket]) * self.rates[bracket]
+        )
+
+    def marginal_rate(self, incomes:t.Any, preTax:t.Any = 0.0) -> np.ndarray:
+        """
+        TaxTable.marginal_rate(self, incomes, preTax) -> np.ndarray
+        returns the rate paid on the next dollar of each income
+        """
+        return self.rates[self.bracket(incomes, preTax)]
+
+    def effective_rate(self, incomes:t.Any,
+                        preTax:t.Any = 0.0) -> np.ndarray:
+        """
+        TaxTable.effective_rate(self, incomes, preTax) -> np.ndarray
+        returns the share of each income paid in tax
+        """
+        incomes = np.asarray(incomes, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = self.liability(incomes, preTax) / incomes
+
+        return np.where(incomes > 0, rates, 0.0)
+
+
+def load_tables(path:str|None = None) -> dict[str, TaxTable]:
+    """
+    load_tables(path) -> dict[str, TaxTable]
+    path: str|None: JSON file laid out like TAX_TABLES. TAX_TABLES if None
+
+    returns the table of each filing status
+    """
+    if path is None:
+        tables = TAX_TABLES
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            tables = json.load(file)
+
+    return {
+        status: TaxTable(table["brackets"], table.get("deduction", 0))
+        for status, table in tables.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def get_table(status:str = "single", path:str|None = None) -> TaxTable:
+    """
+    get_table(status, path) -> TaxTable
+    status: str: filing status, e.g. "single" or "married"
+    path: str|None: JSON file of tables. TAX_TABLES if None
+
+    the tables are only loaded the first time they are asked for
+    returns the table of the filing status
+    """
+    tables = load_tables(path)
+
+    if status not in tables:
+        raise ValueError(
+            f"unknown filing status: '{status}'. "
+            + f"choose any: {tuple(tables)}"
+        )
+
+    return tables[status]
+
+
+def what_if(incomes:t.Any, raises:t.Any = 0.0, preTax:t.Any = 0.0,
+                status:str = "single") -> dict[str, np.ndarray]:
+    """
+    what_if(incomes, raises, preTax, status) -> dict[str, np.ndarray]
+    incomes: float|array: yearly incomes
+    raises: float|array: raises to try, e.g. [0, 0.03, 0.05]
+    preTax: float|array: yearly pre-tax contributions to try, e.g.
+        [0, 5000, 23500]
+    status: str: filing status
+
+    tries every income with every raise and every contribution at once
+    returns a dict of arrays of shape (incomes, raises, contributions):
+        - income: income after the raise
+        - tax: tax owed
+        - takeHome: income left after tax and contributions
+        - effectiveRate: share of the income paid in tax
+    """
+    table = get_table(status)
+
+    income = (
+        np.atleast_1d(np.asarray(incomes, dtype=np.float64))[:, None, None]
+        * (1 + np.atleast_1d(np.asarray(raises, dtype=np.float64)))[
+            None, :, None
+        ]
+    )
+    preTax = np.atleast_1d(np.asarray(preTax, dtype=np.float64))[
+        None, None, :
+    ]
+    tax = table.liability(income, preTax)
+
+    return {
+        "income": np.broadcast_to(income, tax.shape),
+        "tax": tax,
+        "takeHome": income - tax - preTax,
+        "effectiveRate": table.effective_rate(income, preTax)
+    }
+
+
+def graph_attributes(incomes:t.Any, values:t.Any,
+                        **kwargs) -> dict[str, t.Any]:
+    """
+    graph_attributes(incomes, values, **kwargs) -> dict
+    incomes: array: x values, e.g. what_if()["income"][:, 0, 0]
+    values: array: y values, e.g. what_if()["tax"][:, 0, 0]
+    **kwargs: other arguments for Graphing.set_attributes()
+
+    returns the arguments to give Graphing.set_attributes() for a line chart
+    """
+    attributes = {
+        "independant": np.asarray(incomes),
+        "dependant": np.asarray(values),
+        "xName": "Income",
+        "yName": "Tax",
+        "title": "Tax owed"
+    }
+    attributes.update(kwargs)
+
+    return attributes
@@ -0,0 +1,258 @@
+"""
+Anaya Ahanotu
+18 October 2026
+Keeps the budget summed by day, week, month, quarter and year so charts can
+show any span of time without going back to every transaction.
+A chart asks for the span it shows and gets the finest level that fits in
+its width, so zooming from a decade down to a week only reads the buckets
+in view
+"""
+
+#import needed modules
+import typing as t
+import numpy as np
+
+import categoryTotals
+import dateUtils
+
+
+#levels from finest to coarsest and the average number of days in each
+LEVELS:tuple[str, ...] = ("day", "week", "month", "quarter", "year")
+LEVEL_DAYS:dict[str, float] = {
+    "day": 1,
+    "week": 7,
+    "month": 30.44,
+    "quarter": 91.31,
+    "year": 365.25
+}
+
+#level each level is summed from. weeks cross months, so months are
+#summed from days
+SOURCES:dict[str, str] = {
+    "week": "day",
+    "month": "day",
+    "quarter": "month",
+    "year": "quarter"
+}
+
+
+def bucket_starts(dates:np.ndarray, level:str) -> np.ndarray:
+    """
+    bucket_starts(dates, level) -> np.ndarray[datetime64[D]]
+    dates: np.ndarray[datetime64[D]]: dates to put in buckets
+    level: str: any of LEVELS
+
+    returns the first day of the bucket each date is in. weeks start on
+    Monday
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+
+    match level:
+        case "day":
+            return dates
+        case "week":
+            #1 January 1970 was a Thursday
+            weekday = (dates.astype(np.int64) + 3) % 7
+            return dates - weekday.astype("timedelta64[D]")
+        case "month":
+            return dates.astype("datetime64[M]").astype("datetime64[D]")
+        case "quarter":
+            months = dates.astype("datetime64[M]").astype(np.int64)
+            return (
+                (months - months % 3).astype("datetime64[M]")
+                .astype("datetime64[D]")
+            )
+        case "year":
+            return dates.astype("datetime64[Y]").astype("datetime64[D]")
+        case _:
+            raise ValueError(f"unknown level: '{level}'. choose any: {LEVELS}")
+
+
+class TimePyramid:
+    """
+    Sums of the budget by day, week, month, quarter and year, each stored
+    as sorted bucket start dates and the sum of each bucket
+    """
+    def __init__(self, dates:t.Iterable = (),
+                    amounts:t.Iterable[float] = ()):
+        """
+        TimePyramid(self, dates, amounts)
+        dates: iterable: dates in MM/DD/YYYY format or datetime64
+        amounts: iterable[float]: amount of each transaction
+        """
+        self.starts:dict[str, np.ndarray] = {}
+        self.sums:dict[str, np.ndarray] = {}
+
+        #running totals of each level, worked out when first asked for
+        self.__balances:dict[str, np.ndarray] = {}
+
+        self.build(dates, amounts)
+
+    def build(self, dates:t.Iterable, amounts:t.Iterable[float]) -> None:
+        """
+        TimePyramid.build(self, dates, amounts)
+        dates: iterable: dates in MM/DD/YYYY format or datetime64
+        amounts: iterable[float]: amount of each transaction
+
+        sums the transactions into every level in O(N log N)
+        """
+        for level in LEVELS:
+            #each level is summed from a finer level, which is far smaller
+            #than the transactions
+            if level in SOURCES:
+                dates = self.starts[SOURCES[level]]
+                amounts = self.sums[SOURCES[level]]
+            else:
+                dates = dateUtils.parse_dates(dates)
+                amounts = np.asarray(amounts, dtype=np.float64)
+
+            starts, buckets = np.unique(
+                bucket_starts(dates, level),
+                return_inverse=True
+            )
+            self.starts[level] = starts
+            self.sums[level] = np.bincount(
+                buckets.ravel(),
+                weights=amounts,
+                minlength=len(starts)
+            ).astype(np.float64)
+
+        self.__balances = {}
+
+    def add(self, date:t.Any, amount:float) -> None:
+        """
+        TimePyramid.add(self, date, amount)
+        date: str|np.datetime64: date of the transaction
+        amount: float: amount of the transaction
+
+        adds one transaction to its bucket in every level
+        """
+        day = categoryTotals.to_day(date)
+
+        for level in LEVELS:
+            start = bucket_starts(np.array([day]), level)[0]
+            index = np.searchsorted(self.starts[level], start)
+
+            #a new bucket is made for a date with no transactions yet
+            if (index == len(self.starts[level])
+                    or self.starts[level][index] != start):
+                self.starts[level] = np.insert(
+                    self.starts[level], index, start
+                )
+                self.sums[level] = np.insert(self.sums[level], index, 0.0)
+
+            self.sums[level][index] += amount
+
+        self.__balances = {}
+
+    def remove(self, date:t.Any, amount:float) -> None:
+        """
+        TimePyramid.remove(self, date, amount)
+        date: str|np.datetime64: date of the transaction
+        amount: float: amount of the transaction
+
+        removes one transaction from its bucket in every level
+        """
+        self.add(date, -amount)
+
+    def apply_record(self, columns:dict[str, np.ndarray],
+                        record:dict) -> None:
+        """
+        TimePyramid.apply_record(self, columns, record)
+        columns: dict[str, np.ndarray]: transactions from BEFORE the edit
+        record: dict: edit. see budgetStorage.apply_record()
+
+        updates the sums for one edit
+        """
+        for date, amount, category in categoryTotals.record_changes(
+                columns, record):
+            self.add(date, amount)
+
+    def level_for(self, start:t.Any = None, end:t.Any = None,
+                    maxPoints:int = 1000) -> str:
+        """
+        TimePyramid.level_for(self, start, end, maxPoints) -> str
+        start: str|np.datetime64|None: first date shown. None for no limit
+        end: str|np.datetime64|None: last date shown. None for no limit
+        maxPoints: int: most buckets that can be shown, e.g. the chart's
+            width in pixels
+
+        returns the finest level with no more than maxPoints buckets
+        between start and end
+        """
+        for level in LEVELS:
+            first, last = self.__span(level, start, end)
+            if last - first <= maxPoints:
+                return level
+
+        return LEVELS[-1]
+
+    def query(self, start:t.Any = None, end:t.Any = None,
+                maxPoints:int = 1000, cumulative:bool = False,
+                level:str|None = None
+                ) -> tuple[np.ndarray, np.ndarray, str]:
+        """
+        TimePyramid.query(self, start, end, maxPoints, cumulative, level)
+            -> tuple[np.ndarray, np.ndarray, str]
+        start: str|np.datetime64|None: first date shown. None for no limit
+        end: str|np.datetime64|None: last date shown. None for no limit
+        maxPoints: int: most buckets that can be shown
+        cumulative: bool: return the balance at the end of each bucket
+            instead of the sum of each bucket
+        level: str|None: level to use. the finest that fits if None
+
+        one bucket on each side of the span is included, so lines reach
+        the edges of the chart
+        returns the start of each bucket, its sum or balance, and the level
+        """
+        if level is None:
+            level = self.level_for(start, end, maxPoints)
+
+        first, last = self.__span(level, start, end)
+        first = max(first - 1, 0)
+        last = min(last + 1, len(self.starts[level]))
+
+        if cumulative:
+            if level not in self.__balances:
+                self.__balances[level] = np.cumsum(self.sums[level])
+            values = self.__balances[level]
+        else:
+            values = self.sums[level]
+
+        return self.starts[level][first:last], values[first:last], level
+
+    def date_range(self) -> tuple[np.datetime64, np.datetime64]|None:
+        """
+        TimePyramid.date_range(self) -> tuple[np.datetime64, np.datetime64]
+        returns the first and last day with a transaction. None if empty
+        """
+        if len(self.starts["day"]) == 0:
+            return None
+
+        return self.starts["day"][0], self.starts["day"][-1]
+
+    def __span(self, level:str, start:t.Any,
+                end:t.Any) -> tuple[int, int]:
+        """
+        TimePyramid.__span(self, level, start, end) -> tuple[int, int]
+        returns the positions of the first bucket and one past the last
+        bucket between start and end, found with binary searches
+        """
+        starts = self.starts[level]
+        first, last = 0, len(starts)
+
+        #the bucket the start date is in counts, even if it began earlier
+        if start is not None:
+            first = np.searchsorted(
+                starts,
+                bucket_starts(np.array([categoryTotals.to_day(start)]),
+                              level)[0]
+            )
+        if end is not None:
+            last = np.searchsorted(
+                starts,
+                categoryTotals.to_day(end),
+                side="right"
+            )
+
+        return int(first), int(max(last, first))